@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+EmpowerYouth AI Career Coach - Request Event Log Analysis
+Loads the per-request JSONL files written by backend_test.py --event-log and
+reports latency percentiles per route, RPS and latency over time, and errors
+"""
+
+import argparse
+import itertools
+import json
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PERCENTILES = (50, 90, 95, 99, 99.9)
+# Time-series bucket widths (s) tried in order until the run fits in MAX_BUCKETS rows
+INTERVALS = (1, 5, 10, 30, 60, 300, 600, 1800, 3600)
+MAX_BUCKETS = 60
+TOP_ERRORS = 10
+CHUNK_LINES = 100_000
+
+class EventTable:
+    """An event log as columns; routes and error messages are stored as codes into name lists
+
+    status is 0 for requests that got no response, bytes is -1 when unknown
+    (streamed responses) and error is -1 when the record has none.
+    """
+
+    def __init__(self, t, vu, route, status, ms, wire_bytes, error, routes, errors):
+        self.t = t
+        self.vu = vu
+        self.route = route
+        self.status = status
+        self.ms = ms
+        self.bytes = wire_bytes
+        self.error = error
+        self.routes = routes
+        self.errors = errors
+
+    def __len__(self):
+        return len(self.t)
+
+    @classmethod
+    def load(cls, paths):
+        route_codes, error_codes = {}, {}
+        chunks = []
+        for path in paths:
+            for records in read_records(path):
+                chunks.append((
+                    np.fromiter((record["t"] for record in records), np.float64, len(records)),
+                    np.fromiter((record.get("vu") or 0 for record in records), np.int64, len(records)),
+                    np.fromiter((route_codes.setdefault(record["route"], len(route_codes)) for record in records),
+                                np.int32, len(records)),
+                    np.fromiter((record.get("status") or 0 for record in records), np.int32, len(records)),
+                    np.fromiter((record["ms"] for record in records), np.float64, len(records)),
+                    np.fromiter((-1 if record.get("bytes") is None else record["bytes"] for record in records),
+                                np.int64, len(records)),
+                    np.fromiter((-1 if "error" not in record else error_codes.setdefault(record["error"], len(error_codes))
+                                 for record in records), np.int32, len(records)),
+                ))
+        if not chunks:
+            empty = [np.empty(0, dtype) for dtype in (np.float64, np.int64, np.int32, np.int32, np.float64,
+                                                      np.int64, np.int32)]
+            return cls(*empty, [], [])
+        columns = [np.concatenate(column) for column in zip(*chunks)]
+        return cls(*columns, list(route_codes), list(error_codes))
+
+    def select(self, mask):
+        return EventTable(self.t[mask], self.vu[mask], self.route[mask], self.status[mask], self.ms[mask],
+                          self.bytes[mask], self.error[mask], self.routes, self.errors)
+
+    def is_error(self):
+        """Transport failures, 5xx and 429, as counted by backend_test.py"""
+        return (self.status == 0) | (self.status >= 500) | (self.status == 429)
+
+def read_records(path, chunk_lines=CHUNK_LINES):
+    """Yield lists of records; each chunk is parsed as one JSON array, which is much faster than line by line"""
+    with open(path) as f:
+        while True:
+            lines = [line for line in itertools.islice(f, chunk_lines) if line.strip()]
+            if not lines:
+                return
+            try:
+                yield json.loads("[" + ",".join(lines) + "]")
+            except ValueError:
+                # A run that was killed can leave a partial last line; keep the lines that parse
+                records = []
+                for line in lines:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        pass
+                yield records
+
+def grouped_percentiles(groups, values, percentiles):
+    """Nearest-rank percentiles of values per group, the definition LatencyHistogram uses
+
+    Returns (group ids, counts, (groups, percentiles) array).
+    """
+    order = np.lexsort((values, groups))
+    ids, starts, counts = np.unique(groups[order], return_index=True, return_counts=True)
+    ranks = np.ceil(counts[:, None] * np.asarray(percentiles, dtype=np.float64) / 100.0).astype(np.int64) - 1
+    return ids, counts, values[order][starts[:, None] + np.maximum(ranks, 0)]
+
+def route_table(events, percentiles=PERCENTILES):
+    """Per route: count, RPS, mean, percentiles, max, error rate and mean bytes"""
+    span = events.t.max() - events.t.min() if len(events) > 1 else 0.0
+    ids, counts, values = grouped_percentiles(events.route, events.ms, percentiles)
+    size = len(events.routes)
+    totals = np.bincount(events.route, weights=events.ms, minlength=size)
+    maxima = np.full(size, -np.inf)
+    np.maximum.at(maxima, events.route, events.ms)
+    errors = np.bincount(events.route, weights=events.is_error(), minlength=size)
+    known = events.bytes >= 0
+    byte_totals = np.bincount(events.route[known], weights=events.bytes[known], minlength=size)
+    byte_counts = np.bincount(events.route[known], minlength=size)
+    rows = {}
+    for code, count, row in zip(ids, counts, values):
+        rows[events.routes[code]] = {
+            "count": int(count),
+            "rps": count / span if span else 0.0,
+            "mean_ms": totals[code] / count,
+            "percentiles_ms": dict(zip(map(str, percentiles), row.tolist())),
+            "max_ms": maxima[code],
+            "error_rate": errors[code] / count,
+            "bytes_mean": byte_totals[code] / byte_counts[code] if byte_counts[code] else None,
+        }
+    return dict(sorted(rows.items()))
+
+def pick_interval(span):
+    for interval in INTERVALS:
+        if span / interval <= MAX_BUCKETS:
+            return interval
+    return INTERVALS[-1]
+
+def time_series(events, interval):
+    """Per interval since the first request: RPS, p50, p95, p99 and errors"""
+    start = events.t.min()
+    buckets = ((events.t - start) // interval).astype(np.int64)
+    ids, counts, values = grouped_percentiles(buckets, events.ms, (50, 95, 99))
+    errors = np.bincount(buckets, weights=events.is_error())
+    return [{"offset_s": float(bucket * interval), "requests": int(count), "rps": count / interval,
+             "p50_ms": row[0], "p95_ms": row[1], "p99_ms": row[2], "errors": int(errors[bucket])}
+            for bucket, count, row in zip(ids, counts, values)]
+
+def error_breakdown(events, top=TOP_ERRORS):
+    """Most frequent (route, status, error message) among failed and rejected requests"""
+    failed = events.select((events.status >= 400) | (events.status == 0))
+    if not len(failed):
+        return []
+    # One integer key per combination, so np.unique does the grouping
+    statuses, status_codes = np.unique(failed.status, return_inverse=True)
+    keys = (failed.route.astype(np.int64) * len(statuses) + status_codes) * (len(events.errors) + 1) + failed.error + 1
+    unique, counts = np.unique(keys, return_counts=True)
+    rows = []
+    for key, count in sorted(zip(unique.tolist(), counts.tolist()), key=lambda item: -item[1])[:top]:
+        key, error = divmod(key, len(events.errors) + 1)
+        route, status = divmod(key, len(statuses))
+        rows.append({"route": events.routes[route], "status": int(statuses[status]) or None,
+                     "error": events.errors[error - 1] if error else None, "count": count})
+    return rows
+
+def print_report(events, routes, series, interval, errors, percentiles):
+    span = events.t.max() - events.t.min() if len(events) > 1 else 0.0
+    print("=" * 80)
+    print(f"📒 EVENT LOG: {len(events):,} requests from {len(np.unique(events.vu)):,} virtual users "
+          f"over {span:.1f}s")
+    print("=" * 80)
+    print("\n⏱️  LATENCY BY ROUTE (ms)")
+    labels = "".join(f"{f'p{p:g}':>9}" for p in percentiles)
+    print(f"{'Route':<26}{'Count':>9}{'RPS':>8}{'Mean':>9}{labels}{'Max':>9}{'Err%':>7}{'Bytes':>9}")
+    for route, row in routes.items():
+        values = "".join(f"{value:>9.1f}" for value in row["percentiles_ms"].values())
+        size = f"{row['bytes_mean']:>9.0f}" if row["bytes_mean"] is not None else f"{'-':>9}"
+        print(f"{route:<26}{row['count']:>9,}{row['rps']:>8.1f}{row['mean_ms']:>9.1f}{values}"
+              f"{row['max_ms']:>9.1f}{row['error_rate'] * 100:>6.1f}%{size}")
+
+    print(f"\n📈 OVER TIME ({interval:g}s buckets)")
+    print(f"{'Offset s':>9}{'Requests':>10}{'RPS':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'Errors':>8}")
+    for row in series:
+        print(f"{row['offset_s']:>9.0f}{row['requests']:>10,}{row['rps']:>9.1f}{row['p50_ms']:>9.1f}"
+              f"{row['p95_ms']:>9.1f}{row['p99_ms']:>9.1f}{row['errors']:>8,}")
+
+    print("\n🚨 ERRORS AND REJECTIONS")
+    if not errors:
+        print("None")
+    for row in errors:
+        status = row["status"] or "no response"
+        print(f"{row['count']:>9,}  {row['route']:<26}{status!s:<13}{row['error'] or ''}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Analyse request event logs from backend_test.py --event-log")
+    parser.add_argument("paths", nargs="+", help="event log files (e.g. events-*.jsonl)")
+    parser.add_argument("--route", action="append",
+                        help="only analyse this route, e.g. 'GET /dashboard' (repeatable)")
+    parser.add_argument("--interval", type=float,
+                        help=f"seconds per time-series bucket (default: fit the run in {MAX_BUCKETS} rows)")
+    parser.add_argument("--percentiles", type=float, nargs="+", default=list(PERCENTILES),
+                        help="latency percentiles per route")
+    parser.add_argument("--top-errors", type=int, default=TOP_ERRORS,
+                        help="error combinations listed")
+    parser.add_argument("--json", metavar="PATH", help="also write the tables to a JSON file")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    if np is None:
+        sys.exit("analyze_events.py requires numpy: pip install numpy")
+    args = parse_args(argv)
+    start = time.perf_counter()
+    events = EventTable.load(args.paths)
+    loaded = time.perf_counter()
+    if args.route:
+        codes = [code for code, route in enumerate(events.routes) if route in args.route]
+        events = events.select(np.isin(events.route, codes))
+    if not len(events):
+        print("No events to analyse")
+        return 1
+
+    span = events.t.max() - events.t.min()
+    interval = args.interval or pick_interval(span)
+    routes = route_table(events, args.percentiles)
+    series = time_series(events, interval)
+    errors = error_breakdown(events, args.top_errors)
+    analysed = time.perf_counter()
+
+    print_report(events, routes, series, interval, errors, args.percentiles)
+    print(f"\nLoaded {len(events):,} events from {len(args.paths)} file(s) in {loaded - start:.2f}s, "
+          f"aggregated in {analysed - loaded:.2f}s")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"routes": routes, "interval_s": interval, "series": series, "errors": errors}, f, indent=2)
+        print(f"📝 Tables written to {args.json}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@ import { MongoClient } from 'mongodb'
 import { v4 as uuidv4 } from 'uuid'
 import { NextResponse } from 'next/server'
 import jwt from 'jsonwebtoken'
+import { brotliCompressSync, gzipSync, constants as zlibConstants } from 'zlib'
 
 // MongoDB connection
 let client
@@ -25,6 +26,268 @@ function handleCORS(response) {
   return response
 }
 
+// Response compression for the larger JSON payloads (dashboard, jobs, courses)
+const COMPRESSION_MIN_BYTES = 1024
+// Quality 4 keeps brotli close to gzip's speed on per-request payloads
+const BROTLI_QUALITY = 4
+
+// Picks br or gzip from an Accept-Encoding header by q-value, preferring br on ties
+function negotiateEncoding(acceptEncoding) {
+  const weights = new Map()
+  for (const part of (acceptEncoding || '').toLowerCase().split(',')) {
+    const [name, ...params] = part.trim().split(';')
+    const q = params.map(param => param.trim()).find(param => param.startsWith('q='))
+    weights.set(name, q ? parseFloat(q.slice(2)) || 0 : 1)
+  }
+  const weightOf = encoding => weights.get(encoding) ?? weights.get('*') ?? 0
+  const best = ['br', 'gzip'].reduce((a, b) => (weightOf(b) > weightOf(a) ? b : a))
+  return weightOf(best) > 0 ? best : null
+}
+
+function compressBody(encoding, body) {
+  if (encoding === 'br') {
+    return brotliCompressSync(body, { params: { [zlibConstants.BROTLI_PARAM_QUALITY]: BROTLI_QUALITY } })
+  }
+  return gzipSync(body)
+}
+
+// Top-level keys requested with ?fields=a,b,c, or null for everything
+function parseFields(searchParams) {
+  const fields = (searchParams.get('fields') || '').split(',').map(field => field.trim()).filter(Boolean)
+  return fields.length ? fields : null
+}
+
+function pickFields(object, fields) {
+  if (!fields) return object
+  return Object.fromEntries(fields.filter(field => field in object).map(field => [field, object[field]]))
+}
+
+// Collects per-phase durations for the Server-Timing response header.
+// Repeated phases (e.g. several db calls) are summed.
+function createServerTiming() {
+  const started = performance.now()
+  const phases = new Map()
+  const add = (name, start) => phases.set(name, (phases.get(name) || 0) + performance.now() - start)
+
+  return {
+    async measure(name, fn) {
+      const start = performance.now()
+      try {
+        return await fn()
+      } finally {
+        add(name, start)
+      }
+    },
+    measureSync(name, fn) {
+      const start = performance.now()
+      try {
+        return fn()
+      } finally {
+        add(name, start)
+      }
+    },
+    // Routes that compress pass the negotiated encoding (null for identity)
+    json(data, init = {}, encoding) {
+      let body = this.measureSync('serialize', () => JSON.stringify(data))
+      const headers = new Headers(init.headers)
+      headers.set('Content-Type', 'application/json')
+      if (encoding !== undefined) {
+        headers.set('Vary', 'Accept-Encoding')
+      }
+      if (encoding && Buffer.byteLength(body) >= COMPRESSION_MIN_BYTES) {
+        body = this.measureSync('compress', () => compressBody(encoding, body))
+        headers.set('Content-Encoding', encoding)
+      }
+      return new NextResponse(body, { ...init, headers })
+    },
+    header() {
+      const entries = [...phases].map(([name, dur]) => `${name};dur=${dur.toFixed(2)}`)
+      entries.push(`total;dur=${(performance.now() - started).toFixed(2)}`)
+      return entries.join(', ')
+    }
+  }
+}
+
+// Bounded LRU cache with a per-entry TTL; Map insertion order doubles as recency order.
+// Invalidated keys keep a tombstone until it expires, so a value computed from reads
+// that started before the invalidation is not cached.
+function createLruCache({ maxEntries, ttlMs }) {
+  const entries = new Map()
+  const counters = { hits: 0, misses: 0, evictions: 0, expirations: 0, invalidations: 0 }
+
+  function store(key, entry) {
+    entries.delete(key)
+    entries.set(key, entry)
+    while (entries.size > maxEntries) {
+      entries.delete(entries.keys().next().value)
+      counters.evictions++
+    }
+  }
+
+  return {
+    get(key) {
+      const entry = entries.get(key)
+      if (entry && entry.expiresAt <= Date.now()) {
+        entries.delete(key)
+        counters.expirations++
+      } else if (entry && !entry.invalidatedAt) {
+        entries.delete(key)
+        entries.set(key, entry)
+        counters.hits++
+        return entry.value
+      }
+      counters.misses++
+      return undefined
+    },
+    // maxAgeMs shortens the TTL for values that go stale sooner, e.g. tokens close to expiry
+    set(key, value, readStartedAt = Date.now(), maxAgeMs = ttlMs) {
+      const existing = entries.get(key)
+      if (existing?.invalidatedAt >= readStartedAt && existing.expiresAt > Date.now()) {
+        return
+      }
+      if (maxAgeMs <= 0) {
+        return
+      }
+      store(key, { value, expiresAt: Date.now() + Math.min(ttlMs, maxAgeMs) })
+    },
+    invalidate(key) {
+      counters.invalidations++
+      store(key, { invalidatedAt: Date.now(), expiresAt: Date.now() + ttlMs })
+    },
+    stats() {
+      const lookups = counters.hits + counters.misses
+      return { ...counters, size: entries.size, maxEntries, ttlMs, hitRate: lookups ? counters.hits / lookups : 0 }
+    }
+  }
+}
+
+// Per-user dashboard recommendations; skills only change on /assessment/submit,
+// which invalidates the user's entry
+const dashboardCache = createLruCache({
+  maxEntries: parseInt(process.env.DASHBOARD_CACHE_SIZE || '1000', 10),
+  ttlMs: parseInt(process.env.DASHBOARD_CACHE_TTL_MS || '300000', 10)
+})
+
+// Verified JWT claims by token, so a token's signature is checked once rather than on
+// every request. Entries never outlive the token's own exp. AUTH_CACHE_SIZE=0 disables it.
+const tokenCache = createLruCache({
+  maxEntries: parseInt(process.env.AUTH_CACHE_SIZE || '10000', 10),
+  ttlMs: parseInt(process.env.AUTH_CACHE_TTL_MS || '300000', 10)
+})
+
+// User documents by id for /auth/me and dashboard misses; /assessment/submit, the
+// only route that updates a user, invalidates the entry
+const userCache = createLruCache({
+  maxEntries: parseInt(process.env.USER_CACHE_SIZE || '10000', 10),
+  ttlMs: parseInt(process.env.USER_CACHE_TTL_MS || '60000', 10)
+})
+
+// Write-behind buffering for append-only collections. WRITE_BUFFER_MODE picks the
+// durability trade-off: 'off' does one insertOne per request, 'ack' answers once the
+// batch holding the record is written, 'async' answers right away (records still
+// buffered are lost if the process dies before the flush).
+const WRITE_BUFFER_MODES = ['off', 'ack', 'async']
+const WRITE_BUFFER_MODE = WRITE_BUFFER_MODES.includes(process.env.WRITE_BUFFER_MODE) ? process.env.WRITE_BUFFER_MODE : 'off'
+const WRITE_BUFFER_MAX_BATCH = parseInt(process.env.WRITE_BUFFER_MAX_BATCH || '500', 10)
+const WRITE_BUFFER_FLUSH_MS = parseInt(process.env.WRITE_BUFFER_FLUSH_MS || '20', 10)
+// Optional write concern for the batches, e.g. 'majority' or '1'
+const WRITE_BUFFER_W = process.env.WRITE_BUFFER_W
+
+// Groups inserts into unordered insertMany batches, flushed when maxBatch records
+// are pending or flushMs after the first one arrived
+function createWriteBuffer(collectionName, { mode, maxBatch, flushMs, w }) {
+  let pending = []
+  let timer = null
+  const counters = { writes: 0, written: 0, failed: 0, batches: 0, largestBatch: 0 }
+  const options = { ordered: false }
+  if (w) {
+    options.writeConcern = { w: isNaN(Number(w)) ? w : Number(w) }
+  }
+
+  async function flush(db) {
+    clearTimeout(timer)
+    timer = null
+    const batch = pending
+    pending = []
+    if (!batch.length) {
+      return
+    }
+    counters.batches++
+    counters.largestBatch = Math.max(counters.largestBatch, batch.length)
+    try {
+      await db.collection(collectionName).insertMany(batch.map(entry => entry.record), options)
+      counters.written += batch.length
+      batch.forEach(entry => entry.resolve())
+    } catch (error) {
+      console.error(`Buffered insert into ${collectionName} failed:`, error)
+      // An unordered bulk write reports the failed records by index; the rest were written
+      const failed = new Set([].concat(error.writeErrors || []).map(writeError => writeError.index))
+      batch.forEach((entry, index) => {
+        if (failed.size && !failed.has(index)) {
+          counters.written++
+          entry.resolve()
+        } else {
+          counters.failed++
+          entry.reject(error)
+        }
+      })
+    }
+  }
+
+  return {
+    // Resolves once the record is written ('off', 'ack') or queued ('async')
+    insert(db, record) {
+      counters.writes++
+      if (mode === 'off') {
+        return db.collection(collectionName).insertOne(record).then(
+          () => { counters.written++ },
+          error => { counters.failed++; throw error }
+        )
+      }
+      const written = new Promise((resolve, reject) => pending.push({ record, resolve, reject }))
+      if (pending.length >= maxBatch) {
+        flush(db)
+      } else {
+        timer ||= setTimeout(() => flush(db), flushMs)
+      }
+      if (mode === 'async') {
+        written.catch(() => {})
+        return Promise.resolve()
+      }
+      return written
+    },
+    flush,
+    stats() {
+      return { ...counters, pending: pending.length, mode, maxBatch, flushMs }
+    }
+  }
+}
+
+const writeBuffers = Object.fromEntries(['chat_messages', 'job_applications'].map(name => [
+  name,
+  createWriteBuffer(name, {
+    mode: WRITE_BUFFER_MODE,
+    maxBatch: WRITE_BUFFER_MAX_BATCH,
+    flushMs: WRITE_BUFFER_FLUSH_MS,
+    w: WRITE_BUFFER_W
+  })
+]))
+
+const CHAT_HISTORY_LIMIT = 50
+const CHAT_HISTORY_MAX_LIMIT = 200
+
+let chatIndexReady
+
+function ensureChatIndex(db) {
+  chatIndexReady ||= db.collection('chat_messages')
+    .createIndex({ userId: 1, sessionId: 1, timestamp: -1 })
+    .catch(error => {
+      chatIndexReady = null
+      throw error
+    })
+  return chatIndexReady
+}
+
 // JWT helper functions
 function generateToken(userId) {
   return jwt.sign({ userId }, process.env.JWT_SECRET, { expiresIn: '7d' })
@@ -38,6 +301,32 @@ function verifyToken(token) {
   }
 }
 
+// verifyToken through tokenCache; invalid tokens are not cached
+function verifyTokenCached(token) {
+  const cached = tokenCache.get(token)
+  if (cached) {
+    return cached
+  }
+  const decoded = verifyToken(token)
+  if (decoded) {
+    tokenCache.set(token, decoded, undefined, decoded.exp ? decoded.exp * 1000 - Date.now() : undefined)
+  }
+  return decoded
+}
+
+async function findUser(db, userId) {
+  const readStartedAt = Date.now()
+  const cached = userCache.get(userId)
+  if (cached) {
+    return cached
+  }
+  const user = await db.collection('users').findOne({ id: userId }, { projection: { _id: 0 } })
+  if (user) {
+    userCache.set(userId, user, readStartedAt)
+  }
+  return user
+}
+
 function getAuthToken(request) {
   const authHeader = request.headers.get('authorization')
   if (authHeader?.startsWith('Bearer ')) {
@@ -46,11 +335,16 @@ function getAuthToken(request) {
   return null
 }
 
+// Catalog IDs are stable and sort in insertion order, so they double as the page cursor
+function catalogId(prefix, n) {
+  return `${prefix}-${String(n).padStart(8, '0')}`
+}
+
 // Mock Data Generators
 function generateMockJobs(userSkills = []) {
   const jobs = [
     {
-      id: uuidv4(),
+      id: catalogId('job', 1),
       title: "Frontend Developer",
       company: "TechStart India",
       location: "Mumbai",
@@ -63,7 +357,7 @@ function generateMockJobs(userSkills = []) {
       postedAt: new Date()
     },
     {
-      id: uuidv4(),
+      id: catalogId('job', 2),
       title: "Data Analyst",
       company: "Analytics Pro",
       location: "Bangalore",
@@ -76,7 +370,7 @@ function generateMockJobs(userSkills = []) {
       postedAt: new Date()
     },
     {
-      id: uuidv4(),
+      id: catalogId('job', 3),
       title: "Digital Marketing Executive",
       company: "MarketGrow",
       location: "Delhi",
@@ -89,7 +383,7 @@ function generateMockJobs(userSkills = []) {
       postedAt: new Date()
     },
     {
-      id: uuidv4(),
+      id: catalogId('job', 4),
       title: "Sales Associate",
       company: "SalesPro India",
       location: "Chennai",
@@ -102,7 +396,7 @@ function generateMockJobs(userSkills = []) {
       postedAt: new Date()
     },
     {
-      id: uuidv4(),
+      id: catalogId('job', 5),
       title: "Customer Support Specialist",
       company: "SupportPlus",
       location: "Pune",
@@ -115,7 +409,7 @@ function generateMockJobs(userSkills = []) {
       postedAt: new Date()
     },
     {
-      id: uuidv4(),
+      id: catalogId('job', 6),
       title: "Graphic Designer",
       company: "Creative Studio",
       location: "Hyderabad",
@@ -135,7 +429,7 @@ function generateMockJobs(userSkills = []) {
 function generateMockCourses() {
   return [
     {
-      id: uuidv4(),
+      id: catalogId('course', 1),
       title: "Full Stack Web Development",
       provider: "IBM SkillsBuild",
       description: "Learn to build complete web applications with modern technologies",
@@ -146,7 +440,7 @@ function generateMockCourses() {
       level: "Beginner"
     },
     {
-      id: uuidv4(),
+      id: catalogId('course', 2),
       title: "Data Science Fundamentals",
       provider: "IBM SkillsBuild",
       description: "Master the basics of data science and analytics",
@@ -157,7 +451,7 @@ function generateMockCourses() {
       level: "Beginner"
     },
     {
-      id: uuidv4(),
+      id: catalogId('course', 3),
       title: "Digital Marketing Certification",
       provider: "NSDC",
       description: "Comprehensive digital marketing skills for career growth",
@@ -168,7 +462,7 @@ function generateMockCourses() {
       level: "Intermediate"
     },
     {
-      id: uuidv4(),
+      id: catalogId('course', 4),
       title: "Business Communication",
       provider: "Coursera",
       description: "Improve professional communication skills",
@@ -179,7 +473,7 @@ function generateMockCourses() {
       level: "Beginner"
     },
     {
-      id: uuidv4(),
+      id: catalogId('course', 5),
       title: "Python Programming",
       provider: "IBM SkillsBuild",
       description: "Learn Python programming from basics to advanced",
@@ -190,7 +484,7 @@ function generateMockCourses() {
       level: "Beginner"
     },
     {
-      id: uuidv4(),
+      id: catalogId('course', 6),
       title: "AI and Machine Learning",
       provider: "Coursera",
       description: "Introduction to AI and ML concepts and applications",
@@ -203,6 +497,119 @@ function generateMockCourses() {
   ]
 }
 
+// Job and course catalogs, stored in MongoDB and served a page at a time
+const CATALOG_PAGE_SIZE = 20
+const CATALOG_MAX_PAGE_SIZE = 100
+const CATALOG_SEED_BATCH = 1000
+const CATALOG_LOCATIONS = ["Mumbai", "Bangalore", "Delhi", "Chennai", "Pune", "Hyderabad", "Kolkata", "Ahmedabad"]
+
+const CATALOGS = {
+  jobs: { collection: 'jobs', prefix: 'job', builtIn: generateMockJobs, filters: ['location', 'remote', 'skills'] },
+  courses: { collection: 'courses', prefix: 'course', builtIn: generateMockCourses, filters: ['provider', 'level', 'skills'] }
+}
+
+let catalogReady
+
+// Creates the catalog indexes and upserts the built-in jobs and courses, once per process
+function ensureCatalog(db) {
+  catalogReady ||= Promise.all(Object.values(CATALOGS).map(async catalog => {
+    const collection = db.collection(catalog.collection)
+    await Promise.all([
+      collection.createIndex({ id: 1 }, { unique: true }),
+      ...catalog.filters.map(field => collection.createIndex({ [field]: 1, id: 1 }))
+    ])
+    await collection.bulkWrite(catalog.builtIn().map(item => ({
+      updateOne: { filter: { id: item.id }, update: { $setOnInsert: item }, upsert: true }
+    })))
+  })).catch(error => {
+    catalogReady = null
+    throw error
+  })
+  return catalogReady
+}
+
+function encodeCursor(id) {
+  return Buffer.from(id).toString('base64url')
+}
+
+function decodeCursor(catalog, cursor) {
+  const id = Buffer.from(cursor, 'base64url').toString()
+  return new RegExp(`^${catalog.prefix}-\\d{8,}$`).test(id) ? id : null
+}
+
+// One page of a catalog ordered by id; filters are exact matches, skills matches any listed skill,
+// and ?fields= limits each item to those keys (plus id, which the cursor needs)
+async function listCatalog(db, catalog, searchParams) {
+  const limit = Math.min(Math.max(parseInt(searchParams.get('limit'), 10) || CATALOG_PAGE_SIZE, 1), CATALOG_MAX_PAGE_SIZE)
+  const query = {}
+
+  const cursor = searchParams.get('cursor')
+  if (cursor) {
+    const after = decodeCursor(catalog, cursor)
+    if (!after) {
+      return null
+    }
+    query.id = { $gt: after }
+  }
+
+  for (const field of catalog.filters) {
+    const value = searchParams.get(field)
+    if (value === null || value === '') continue
+    if (field === 'skills') {
+      query.skills = { $in: value.split(',').map(skill => skill.trim()).filter(Boolean) }
+    } else if (field === 'remote') {
+      query.remote = value === 'true'
+    } else {
+      query[field] = value
+    }
+  }
+
+  const projection = { _id: 0 }
+  const fields = parseFields(searchParams)
+  if (fields) {
+    for (const field of ['id', ...fields]) {
+      if (field !== '_id') projection[field] = 1
+    }
+  }
+
+  // One extra item tells whether another page follows
+  const items = await db.collection(catalog.collection)
+    .find(query, { projection })
+    .sort({ id: 1 })
+    .limit(limit + 1)
+    .toArray()
+  const page = items.slice(0, limit)
+  return { items: page, nextCursor: items.length > limit ? encodeCursor(page[page.length - 1].id) : null }
+}
+
+// Synthetic entry n for large-catalog benchmarks, varied from the built-in templates
+function generateCatalogItem(catalog, templates, n) {
+  const template = templates[n % templates.length]
+  const item = { ...template, id: catalogId(catalog.prefix, n), title: `${template.title} #${n}` }
+  if ('location' in template) {
+    // Every template appears in every location, a third of them remote
+    const round = Math.floor(n / templates.length)
+    item.location = CATALOG_LOCATIONS[round % CATALOG_LOCATIONS.length]
+    item.remote = Math.floor(round / CATALOG_LOCATIONS.length) % 3 === 0
+  }
+  return item
+}
+
+// Grows a catalog to at least `target` entries; returns the resulting size
+async function seedCatalog(db, catalog, target) {
+  const collection = db.collection(catalog.collection)
+  const existing = await collection.countDocuments()
+  const templates = catalog.builtIn()
+  for (let start = existing + 1; start <= target; start += CATALOG_SEED_BATCH) {
+    const batch = []
+    for (let n = start; n < Math.min(start + CATALOG_SEED_BATCH, target + 1); n++) {
+      batch.push(generateCatalogItem(catalog, templates, n))
+    }
+    await collection.insertMany(batch, { ordered: false })
+  }
+  return Math.max(existing, target)
+}
+
 function generateSkillVector(assessmentData) {
   // Simple skill scoring based on assessment
   const skills = []
@@ -248,6 +655,47 @@ function generateSkillVector(assessmentData) {
   ]
 }
 
+function buildDashboardRecommendations(user, userSkills) {
+  // Generate personalized recommendations
+  const jobs = generateMockJobs(userSkills.map(s => s.skillName))
+  const courses = generateMockCourses()
+  
+  // Filter courses based on user's skill gaps
+  const userSkillNames = new Set(userSkills.map(s => s.skillName.toLowerCase()))
+  const recommendedCourses = courses.filter(course =>
+    course.skills.some(skill => !userSkillNames.has(skill.toLowerCase()))
+  ).slice(0, 6)
+  
+  return {
+    skills: userSkills.map(s => ({ name: s.skillName, level: s.level })),
+    jobs,
+    courses,
+    recommendedCourses,
+    profileCompletion: user.assessmentCompleted ? 85 : 45
+  }
+}
+
+let warmUpReady
+
+// Does the first-request work up front: checks the MongoDB pool, builds the
+// catalog and chat indexes and runs the recommendation code once. Resolves to
+// the time it took, once per process.
+function warmUp(db) {
+  warmUpReady ||= (async () => {
+    const started = Date.now()
+    await db.command({ ping: 1 })
+    await Promise.all([ensureCatalog(db), ensureChatIndex(db)])
+    const skills = generateSkillVector({ skills: ['Programming', 'Communication', 'Data Analysis'] })
+    buildDashboardRecommendations({}, skills.map(skill => ({ skillName: skill.name, level: skill.level })))
+    generateChatResponse('How can I improve my resume?')
+    return Date.now() - started
+  })().catch(error => {
+    warmUpReady = null
+    throw error
+  })
+  return warmUpReady
+}
+
 function generateChatResponse(message, language = 'en') {
   // Check for Watson Assistant API key
   if (process.env.WATSON_ASSISTANT_API_KEY) {
@@ -281,41 +729,151 @@ function generateChatResponse(message, language = 'en') {
   return "I'm here to help with your career journey! You can ask me about job search strategies, resume writing, interview preparation, skill development, or career planning. What would you like to know?"
 }
 
+// Replies are streamed a few words at a time
+const CHAT_STREAM_WORDS = 3
+
+function* generateChatResponseChunks(message, language = 'en') {
+  const words = generateChatResponse(message, language).split(' ')
+  for (let i = 0; i < words.length; i += CHAT_STREAM_WORDS) {
+    const chunk = words.slice(i, i + CHAT_STREAM_WORDS).join(' ')
+    yield i + CHAT_STREAM_WORDS < words.length ? `${chunk} ` : chunk
+  }
+}
+
+function sseEvent(event, data) {
+  return `event: ${event}\ndata: ${JSON.stringify(data)}\n\n`
+}
+
+// Streams a chat reply as server-sent events: `session` (sent first),
+// one `chunk` per piece of text, then `done` with the full reply.
+// Once the client disconnects nothing more is generated, sent or stored.
+function streamChatResponse(db, { userId, message, language, sessionId }) {
+  const encoder = new TextEncoder()
+  let cancelled = false
+  const body = new ReadableStream({
+    async start(controller) {
+      const send = (event, data) => {
+        if (cancelled) return
+        try {
+          controller.enqueue(encoder.encode(sseEvent(event, data)))
+        } catch {
+          // The stream was closed under us, e.g. by a disconnect racing cancel()
+          cancelled = true
+        }
+      }
+      send('session', { sessionId })
+      try {
+        let response = ''
+        for (const chunk of generateChatResponseChunks(message, language)) {
+          if (cancelled) return
+          response += chunk
+          send('chunk', { text: chunk })
+          // Let each chunk flush before producing the next one
+          await new Promise(resolve => setTimeout(resolve, 0))
+        }
+        if (cancelled) return
+
+        await writeBuffers.chat_messages.insert(db, {
+          id: uuidv4(),
+          userId,
+          sessionId,
+          userMessage: message,
+          botResponse: response,
+          language,
+          timestamp: new Date()
+        })
+        send('done', { response, sessionId })
+      } catch (error) {
+        console.error('Chat stream error:', error)
+        send('error', { error: "Internal server error" })
+      }
+      if (!cancelled) {
+        try {
+          controller.close()
+        } catch {
+          cancelled = true
+        }
+      }
+    },
+    cancel() {
+      cancelled = true
+    }
+  })
+
+  return new NextResponse(body, {
+    headers: {
+      'Content-Type': 'text/event-stream; charset=utf-8',
+      'Cache-Control': 'no-cache, no-transform',
+      'Connection': 'keep-alive'
+    }
+  })
+}
+
 // OPTIONS handler for CORS
 export async function OPTIONS() {
   return handleCORS(new NextResponse(null, { status: 200 }))
 }
 
 // Route handler function
-async function handleRoute(request, { params }) {
+async function routeRequest(request, { params }, timing) {
   const { path = [] } = params
   const route = `/${path.join('/')}`
   const method = request.method
+  const { searchParams } = new URL(request.url)
 
   try {
-    const db = await connectToMongo()
+    const db = await timing.measure('connect', connectToMongo)
 
     // Root endpoint
     if (route === '/' && method === 'GET') {
-      return handleCORS(NextResponse.json({ message: "EmpowerYouth API is running!" }))
+      return handleCORS(timing.json({ message: "EmpowerYouth API is running!" }))
+    }
+
+    // Readiness: 200 once this instance has warmed up, for load balancer checks
+    // and the WARMUP_ON_START hook in instrumentation.js
+    if (route === '/ready' && method === 'GET') {
+      const warmUpMs = await timing.measure('db', () => warmUp(db))
+      return handleCORS(timing.json({ ready: true, warmUpMs }))
+    }
+
+    // Cache statistics (per server instance); off unless CATALOG_SEED_ENABLED=true
+    if (route === '/cache/stats' && method === 'GET') {
+      if (process.env.CATALOG_SEED_ENABLED !== 'true') {
+        return handleCORS(timing.json({ error: "Cache statistics are disabled" }, { status: 403 }))
+      }
+      return handleCORS(timing.json({
+        dashboard: dashboardCache.stats(),
+        tokens: tokenCache.stats(),
+        users: userCache.stats()
+      }))
+    }
+
+    // Write buffer statistics (per server instance); off unless CATALOG_SEED_ENABLED=true
+    if (route === '/writes/stats' && method === 'GET') {
+      if (process.env.CATALOG_SEED_ENABLED !== 'true') {
+        return handleCORS(timing.json({ error: "Write statistics are disabled" }, { status: 403 }))
+      }
+      return handleCORS(timing.json(Object.fromEntries(
+        Object.entries(writeBuffers).map(([name, buffer]) => [name, buffer.stats()])
+      )))
     }
 
     // Auth Routes
     if (route === '/auth/register' && method === 'POST') {
-      const body = await request.json()
+      const body = await timing.measure('parse', () => request.json())
       const { name, email, phone, password, location, experience } = body
       
       if (!name || !email || !phone || !password) {
-        return handleCORS(NextResponse.json(
+        return handleCORS(timing.json(
           { error: "All fields are required" }, 
           { status: 400 }
         ))
       }
 
       // Check if user already exists
-      const existingUser = await db.collection('users').findOne({ email })
+      const existingUser = await timing.measure('db', () => db.collection('users').findOne({ email }))
       if (existingUser) {
-        return handleCORS(NextResponse.json(
+        return handleCORS(timing.json(
           { error: "User already exists" }, 
           { status: 400 }
         ))
@@ -334,12 +892,12 @@ async function handleRoute(request, { params }) {
         assessmentCompleted: false
       }
 
-      await db.collection('users').insertOne(user)
+      await timing.measure('db', () => db.collection('users').insertOne(user))
       
-      const token = generateToken(userId)
+      const token = timing.measureSync('auth', () => generateToken(userId))
       const { ...userWithoutPassword } = user
       
-      return handleCORS(NextResponse.json({
+      return handleCORS(timing.json({
         user: userWithoutPassword,
         token
       }))
@@ -348,134 +906,147 @@ async function handleRoute(request, { params }) {
     if (route === '/auth/me' && method === 'GET') {
       const token = getAuthToken(request)
       if (!token) {
-        return handleCORS(NextResponse.json({ error: "No token provided" }, { status: 401 }))
+        return handleCORS(timing.json({ error: "No token provided" }, { status: 401 }))
       }
       
-      const decoded = verifyToken(token)
+      const decoded = timing.measureSync('auth', () => verifyTokenCached(token))
       if (!decoded) {
-        return handleCORS(NextResponse.json({ error: "Invalid token" }, { status: 401 }))
+        return handleCORS(timing.json({ error: "Invalid token" }, { status: 401 }))
       }
       
-      const user = await db.collection('users').findOne({ id: decoded.userId })
+      const user = await timing.measure('db', () => findUser(db, decoded.userId))
       if (!user) {
-        return handleCORS(NextResponse.json({ error: "User not found" }, { status: 404 }))
+        return handleCORS(timing.json({ error: "User not found" }, { status: 404 }))
       }
       
       const { _id, ...userResponse } = user
-      return handleCORS(NextResponse.json(userResponse))
+      return handleCORS(timing.json(userResponse))
     }
 
     // Assessment Routes
     if (route === '/assessment/submit' && method === 'POST') {
       const token = getAuthToken(request)
       if (!token) {
-        return handleCORS(NextResponse.json({ error: "Authentication required" }, { status: 401 }))
+        return handleCORS(timing.json({ error: "Authentication required" }, { status: 401 }))
       }
       
-      const decoded = verifyToken(token)
+      const decoded = timing.measureSync('auth', () => verifyTokenCached(token))
       if (!decoded) {
-        return handleCORS(NextResponse.json({ error: "Invalid token" }, { status: 401 }))
+        return handleCORS(timing.json({ error: "Invalid token" }, { status: 401 }))
       }
 
-      const assessmentData = await request.json()
-      const skillVector = generateSkillVector(assessmentData)
+      const assessmentData = await timing.measure('parse', () => request.json())
+      const skillVector = timing.measureSync('compute', () => generateSkillVector(assessmentData))
       
-      // Update user with assessment results
-      await db.collection('users').updateOne(
-        { id: decoded.userId },
-        { 
-          $set: { 
-            skillVector,
-            assessmentData,
-            assessmentCompleted: true,
-            updatedAt: new Date()
+      await timing.measure('db', async () => {
+        // Update user with assessment results
+        await db.collection('users').updateOne(
+          { id: decoded.userId },
+          { 
+            $set: { 
+              skillVector,
+              assessmentData,
+              assessmentCompleted: true,
+              updatedAt: new Date()
+            }
           }
+        )
+        
+        // Store skills separately
+        await db.collection('user_skills').deleteMany({ userId: decoded.userId })
+        for (const skill of skillVector) {
+          await db.collection('user_skills').insertOne({
+            id: uuidv4(),
+            userId: decoded.userId,
+            skillName: skill.name,
+            level: skill.level,
+            createdAt: new Date()
+          })
         }
-      )
-      
-      // Store skills separately
-      await db.collection('user_skills').deleteMany({ userId: decoded.userId })
-      for (const skill of skillVector) {
-        await db.collection('user_skills').insertOne({
-          id: uuidv4(),
-          userId: decoded.userId,
-          skillName: skill.name,
-          level: skill.level,
-          createdAt: new Date()
-        })
-      }
+      })
+      userCache.invalidate(decoded.userId)
+      dashboardCache.invalidate(decoded.userId)
       
-      return handleCORS(NextResponse.json({ success: true, skillVector }))
+      return handleCORS(timing.json({ success: true, skillVector }))
     }
 
     // Dashboard Route
     if (route === '/dashboard' && method === 'GET') {
       const token = getAuthToken(request)
       if (!token) {
-        return handleCORS(NextResponse.json({ error: "Authentication required" }, { status: 401 }))
+        return handleCORS(timing.json({ error: "Authentication required" }, { status: 401 }))
       }
       
-      const decoded = verifyToken(token)
+      const decoded = timing.measureSync('auth', () => verifyTokenCached(token))
       if (!decoded) {
-        return handleCORS(NextResponse.json({ error: "Invalid token" }, { status: 401 }))
+        return handleCORS(timing.json({ error: "Invalid token" }, { status: 401 }))
       }
       
-      const user = await db.collection('users').findOne({ id: decoded.userId })
-      if (!user) {
-        return handleCORS(NextResponse.json({ error: "User not found" }, { status: 404 }))
+      const readStartedAt = Date.now()
+      let recommendations = dashboardCache.get(decoded.userId)
+      const cacheStatus = recommendations ? 'HIT' : 'MISS'
+      if (!recommendations) {
+        const user = await timing.measure('db', () => findUser(db, decoded.userId))
+        if (!user) {
+          return handleCORS(timing.json({ error: "User not found" }, { status: 404 }))
+        }
+        
+        const userSkills = await timing.measure('db', () => db.collection('user_skills')
+          .find({ userId: decoded.userId })
+          .toArray())
+        
+        recommendations = timing.measureSync('compute', () => buildDashboardRecommendations(user, userSkills))
+        dashboardCache.set(decoded.userId, recommendations, readStartedAt)
       }
       
-      const userSkills = await db.collection('user_skills')
-        .find({ userId: decoded.userId })
-        .toArray()
-      
-      // Generate personalized recommendations
-      const jobs = generateMockJobs(userSkills.map(s => s.skillName))
-      const courses = generateMockCourses()
-      
-      // Filter courses based on user's skill gaps
-      const recommendedCourses = courses.filter(course => {
-        const userSkillNames = userSkills.map(s => s.skillName.toLowerCase())
-        return course.skills.some(skill => 
-          !userSkillNames.includes(skill.toLowerCase())
-        )
-      }).slice(0, 6)
-      
       const dashboardData = {
-        skills: userSkills.map(s => ({ name: s.skillName, level: s.level })),
-        jobMatches: jobs,
-        jobs: jobs,
-        courses: courses,
-        recommendedCourses,
+        skills: recommendations.skills,
+        jobMatches: recommendations.jobs,
+        jobs: recommendations.jobs,
+        courses: recommendations.courses,
+        recommendedCourses: recommendations.recommendedCourses,
         progress: {
-          profileCompletion: user.assessmentCompleted ? 85 : 45,
+          profileCompletion: recommendations.profileCompletion,
           coursesCompleted: Math.floor(Math.random() * 5) + 1,
           jobApplications: Math.floor(Math.random() * 15) + 5
         }
       }
       
-      return handleCORS(NextResponse.json(dashboardData))
+      return handleCORS(timing.json(
+        pickFields(dashboardData, parseFields(searchParams)),
+        { headers: { 'X-Cache': cacheStatus } },
+        negotiateEncoding(request.headers.get('accept-encoding'))
+      ))
     }
 
     // Chat Route
     if (route === '/chat' && method === 'POST') {
       const token = getAuthToken(request)
       if (!token) {
-        return handleCORS(NextResponse.json({ error: "Authentication required" }, { status: 401 }))
+        return handleCORS(timing.json({ error: "Authentication required" }, { status: 401 }))
       }
       
-      const decoded = verifyToken(token)
+      const decoded = timing.measureSync('auth', () => verifyTokenCached(token))
       if (!decoded) {
-        return handleCORS(NextResponse.json({ error: "Invalid token" }, { status: 401 }))
+        return handleCORS(timing.json({ error: "Invalid token" }, { status: 401 }))
       }
       
-      const { message, language = 'en', sessionId } = await request.json()
+      const { message, language = 'en', sessionId, stream = false } = await timing.measure('parse', () => request.json())
       
       if (!message) {
-        return handleCORS(NextResponse.json({ error: "Message is required" }, { status: 400 }))
+        return handleCORS(timing.json({ error: "Message is required" }, { status: 400 }))
       }
       
-      const response = generateChatResponse(message, language)
+      if (stream) {
+        return handleCORS(streamChatResponse(db, {
+          userId: decoded.userId,
+          message,
+          language,
+          sessionId: sessionId || uuidv4()
+        }))
+      }
+      
+      const response = timing.measureSync('compute', () => generateChatResponse(message, language))
       
       // Store chat message
       const chatRecord = {
@@ -488,52 +1059,136 @@ async function handleRoute(request, { params }) {
         timestamp: new Date()
       }
       
-      await db.collection('chat_messages').insertOne(chatRecord)
+      await timing.measure('db', () => writeBuffers.chat_messages.insert(db, chatRecord))
       
-      return handleCORS(NextResponse.json({ 
+      return handleCORS(timing.json({ 
         response,
         sessionId: chatRecord.sessionId 
       }))
     }
 
+    // Chat history: message count and the most recent messages of one session
+    if (route === '/chat/history' && method === 'GET') {
+      const token = getAuthToken(request)
+      if (!token) {
+        return handleCORS(timing.json({ error: "Authentication required" }, { status: 401 }))
+      }
+      
+      const decoded = timing.measureSync('auth', () => verifyTokenCached(token))
+      if (!decoded) {
+        return handleCORS(timing.json({ error: "Invalid token" }, { status: 401 }))
+      }
+      
+      const sessionId = searchParams.get('sessionId')
+      if (!sessionId) {
+        return handleCORS(timing.json({ error: "Session ID is required" }, { status: 400 }))
+      }
+      const limit = Math.min(
+        Math.max(parseInt(searchParams.get('limit') ?? CHAT_HISTORY_LIMIT, 10) || 0, 0),
+        CHAT_HISTORY_MAX_LIMIT
+      )
+      
+      const filter = { userId: decoded.userId, sessionId }
+      await timing.measure('db', () => ensureChatIndex(db))
+      const [count, messages] = await timing.measure('db', () => Promise.all([
+        db.collection('chat_messages').countDocuments(filter),
+        limit ? db.collection('chat_messages')
+          .find(filter, { projection: { _id: 0, userId: 0 } })
+          .sort({ timestamp: -1 })
+          .limit(limit)
+          .toArray() : []
+      ]))
+      
+      return handleCORS(timing.json({ sessionId, count, messages: messages.reverse() }))
+    }
+
     // Jobs Route  
     if (route === '/jobs' && method === 'GET') {
       const token = getAuthToken(request)
       if (!token) {
-        return handleCORS(NextResponse.json({ error: "Authentication required" }, { status: 401 }))
+        return handleCORS(timing.json({ error: "Authentication required" }, { status: 401 }))
+      }
+      if (!timing.measureSync('auth', () => verifyTokenCached(token))) {
+        return handleCORS(timing.json({ error: "Invalid token" }, { status: 401 }))
       }
       
-      const jobs = generateMockJobs()
-      return handleCORS(NextResponse.json({ jobs }))
+      await timing.measure('db', () => ensureCatalog(db))
+      const page = await timing.measure('db', () => listCatalog(db, CATALOGS.jobs, searchParams))
+      if (!page) {
+        return handleCORS(timing.json({ error: "Invalid cursor" }, { status: 400 }))
+      }
+      return handleCORS(timing.json(
+        { jobs: page.items, nextCursor: page.nextCursor },
+        {},
+        negotiateEncoding(request.headers.get('accept-encoding'))
+      ))
     }
 
     // Courses Route
     if (route === '/courses' && method === 'GET') {
       const token = getAuthToken(request)
       if (!token) {
-        return handleCORS(NextResponse.json({ error: "Authentication required" }, { status: 401 }))
+        return handleCORS(timing.json({ error: "Authentication required" }, { status: 401 }))
+      }
+      if (!timing.measureSync('auth', () => verifyTokenCached(token))) {
+        return handleCORS(timing.json({ error: "Invalid token" }, { status: 401 }))
       }
       
-      const courses = generateMockCourses()
-      return handleCORS(NextResponse.json({ courses }))
+      await timing.measure('db', () => ensureCatalog(db))
+      const page = await timing.measure('db', () => listCatalog(db, CATALOGS.courses, searchParams))
+      if (!page) {
+        return handleCORS(timing.json({ error: "Invalid cursor" }, { status: 400 }))
+      }
+      return handleCORS(timing.json(
+        { courses: page.items, nextCursor: page.nextCursor },
+        {},
+        negotiateEncoding(request.headers.get('accept-encoding'))
+      ))
+    }
+
+    // Catalog seeding for large-catalog benchmarks; off unless CATALOG_SEED_ENABLED=true
+    if (route === '/catalog/seed' && method === 'POST') {
+      if (process.env.CATALOG_SEED_ENABLED !== 'true') {
+        return handleCORS(timing.json({ error: "Catalog seeding is disabled" }, { status: 403 }))
+      }
+      
+      const token = getAuthToken(request)
+      if (!token || !timing.measureSync('auth', () => verifyTokenCached(token))) {
+        return handleCORS(timing.json({ error: "Authentication required" }, { status: 401 }))
+      }
+      
+      const targets = await timing.measure('parse', () => request.json())
+      await timing.measure('db', () => ensureCatalog(db))
+      const sizes = {}
+      for (const [name, catalog] of Object.entries(CATALOGS)) {
+        const target = parseInt(targets[name], 10) || 0
+        sizes[name] = await timing.measure('db', () => seedCatalog(db, catalog, target))
+      }
+      return handleCORS(timing.json({ success: true, ...sizes }))
     }
 
     // Apply to Job Route
     if (route === '/apply' && method === 'POST') {
       const token = getAuthToken(request)
       if (!token) {
-        return handleCORS(NextResponse.json({ error: "Authentication required" }, { status: 401 }))
+        return handleCORS(timing.json({ error: "Authentication required" }, { status: 401 }))
       }
       
-      const decoded = verifyToken(token)
+      const decoded = timing.measureSync('auth', () => verifyTokenCached(token))
       if (!decoded) {
-        return handleCORS(NextResponse.json({ error: "Invalid token" }, { status: 401 }))
+        return handleCORS(timing.json({ error: "Invalid token" }, { status: 401 }))
       }
       
-      const { jobId } = await request.json()
+      const { jobId } = await timing.measure('parse', () => request.json())
       
       if (!jobId) {
-        return handleCORS(NextResponse.json({ error: "Job ID is required" }, { status: 400 }))
+        return handleCORS(timing.json({ error: "Job ID is required" }, { status: 400 }))
+      }
+      
+      await timing.measure('db', () => ensureCatalog(db))
+      const job = await timing.measure('db', () => db.collection('jobs').findOne({ id: jobId }, { projection: { _id: 1 } }))
+      if (!job) {
+        return handleCORS(timing.json({ error: "Job not found" }, { status: 404 }))
       }
       
       const application = {
@@ -544,29 +1199,40 @@ async function handleRoute(request, { params }) {
         status: 'applied'
       }
       
-      await db.collection('job_applications').insertOne(application)
+      await timing.measure('db', () => writeBuffers.job_applications.insert(db, application))
       
-      return handleCORS(NextResponse.json({ 
+      return handleCORS(timing.json({ 
         success: true,
         message: "Application submitted successfully!"
       }))
     }
 
     // Route not found
-    return handleCORS(NextResponse.json(
+    return handleCORS(timing.json(
       { error: `Route ${route} not found` }, 
       { status: 404 }
     ))
 
   } catch (error) {
     console.error('API Error:', error)
-    return handleCORS(NextResponse.json(
+    return handleCORS(timing.json(
       { error: "Internal server error" }, 
       { status: 500 }
     ))
   }
 }
 
+async function handleRoute(request, context) {
+  const timing = createServerTiming()
+  const response = await routeRequest(request, context, timing)
+  // Backend phase timings are only exposed when SERVER_TIMING_ENABLED=true
+  if (process.env.SERVER_TIMING_ENABLED === 'true') {
+    response.headers.set('Server-Timing', timing.header())
+    response.headers.set('Timing-Allow-Origin', '*')
+  }
+  return response
+}
+
 // Export all HTTP methods
 export const GET = handleRoute
 export const POST = handleRoute
@@ -4,30 +4,784 @@ EmpowerYouth AI Career Coach - Backend API Testing
 Tests all backend endpoints comprehensively
 """
 
+import argparse
+import base64
+import io
+import itertools
+import math
+import os
+import queue
+import random
+import signal
+import socket
+import subprocess
+import sys
+import threading
 import requests
+import statistics
+import urllib3
 import json
 import uuid
 import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlencode, urlparse
+from urllib3.util.retry import Retry
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from response_schemas import validate as validate_schema
 
 # Configuration
 BASE_URL = "http://localhost:3000/api"
-TEST_USER_DATA = {
-    "name": "Priya Sharma",
-    "email": f"priya.sharma.{uuid.uuid4().hex[:8]}@example.com",
-    "phone": "+91-9876543210",
-    "password": "SecurePass123!",
-    "location": "Mumbai",
-    "experience": "fresher"
+REQUEST_TIMEOUT = 30
+CONNECT_TIMEOUT = 5
+POOL_SIZE = 10
+CONNECT_RETRIES = 2
+TOKEN_CACHE_FILE = ".token_cache.json"
+TOKEN_EXPIRY_MARGIN = 3600
+SEED_CONCURRENCY = 64
+FUNCTIONAL_WORKERS = 4
+EVENT_LOG_MAX_MB = 100
+EVENT_LOG_QUEUE = 100_000
+EVENT_LOG_BATCH = 1000
+PROFILE_INTERVAL_MS = 10.0
+PROFILE_OUTPUT = "profile.folded"
+PROFILE_TOP_FUNCTIONS = 15
+# Leaf functions where a sampled thread is blocked rather than running Python code
+PROFILE_IDLE_FRAMES = {"readinto", "recv_into", "wait", "select", "poll", "do_poll", "accept",
+                       "_wait_for_tstate_lock"}
+BASELINE_FILE = "benchmark_baselines.json"
+MOCK_BASELINE_TARGET = "mock"
+REGRESSION_THRESHOLD = 0.10
+REGRESSION_ALPHA = 0.05
+MIN_COMPARE_SAMPLES = 5
+DASHBOARD_CACHE_PROBES = 50
+CATALOG_PAGE_SIZE = 100
+WRITE_BURST_USERS = 20
+WRITE_BURST_CONCURRENCY = 100
+WRITE_VERIFY_TIMEOUT = 10.0
+DASHBOARD_CACHE_MIN_HIT_RATE = 0.9
+# Validate 1 in N checked responses against response_schemas (0 disables)
+VALIDATE_EVERY = 1
+VERBOSE = True
+# Encodings advertised to the API; br only when the brotli module is installed
+ACCEPT_ENCODING = "br, gzip" if brotli else "gzip"
+
+def new_user_data():
+    """Build registration data with a unique email"""
+    return {
+        "name": "Priya Sharma",
+        "email": f"priya.sharma.{uuid.uuid4().hex[:8]}@example.com",
+        "phone": "+91-9876543210",
+        "password": "SecurePass123!",
+        "location": "Mumbai",
+        "experience": "fresher"
+    }
+
+TEST_USER_DATA = new_user_data()
+
+class UserState:
+    """Isolated state for one user's journey through the API"""
+
+    # Virtual user numbers, as recorded in the event log
+    ids = itertools.count(1)
+
+    def __init__(self, user_data=None):
+        self.vu = next(self.ids)
+        self.user_data = user_data if user_data is not None else new_user_data()
+        self.auth_token = None
+        self.user_id = None
+        self.session_id = None
+        self.job_ids = []
+
+    def to_cache(self):
+        return {"user": self.user_data, "token": self.auth_token, "userId": self.user_id}
+
+    @classmethod
+    def from_cache(cls, entry):
+        state = cls(entry["user"])
+        state.auth_token = entry["token"]
+        state.user_id = entry["userId"]
+        return state
+
+# State of the single scripted user in the functional run
+default_state = UserState(TEST_USER_DATA)
+api_client = None
+# Already registered users loaded from the token cache (--reuse-tokens)
+cached_users = []
+
+# What decode_body raises on a corrupt body
+DECODE_ERRORS = (zlib.error,) + ((brotli.error,) if brotli is not None else ())
+
+def decode_body(raw, encoding):
+    """Undo a gzip, deflate or br Content-Encoding; other bodies are returned as is"""
+    encoding = (encoding or "").strip().lower()
+    if encoding == "gzip":
+        return zlib.decompress(raw, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        return zlib.decompress(raw)
+    if encoding == "br" and brotli is not None:
+        return brotli.decompress(raw)
+    return raw
+
+# orjson parses several times faster than json; both raise json.JSONDecodeError subclasses
+json_loads = orjson.loads if orjson is not None else json.loads
+
+def json_body(response):
+    """Decoded JSON body of a response, parsed once however many checks read it"""
+    try:
+        return response.json_body
+    except AttributeError:
+        response.json_body = body = json_loads(response.content)
+        return body
+
+class ApiClient:
+    """Pooled keep-alive HTTP client shared by every test"""
+
+    def __init__(self, base_url=BASE_URL, pool_size=POOL_SIZE, retries=CONNECT_RETRIES,
+                 timeout=REQUEST_TIMEOUT, connect_timeout=CONNECT_TIMEOUT,
+                 accept_encoding=ACCEPT_ENCODING):
+        self.base_url = base_url
+        self.timeout = (connect_timeout, timeout)
+        # Only retry failures that happen before the request reaches the server,
+        # so POSTs are never replayed
+        retry = Retry(total=retries, connect=retries, read=0, status=0, other=0,
+                      backoff_factor=0.2, raise_on_status=False)
+        self.adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size,
+                                   max_retries=retry, pool_block=True)
+        self.session = requests.Session()
+        self.session.headers["Connection"] = "keep-alive"
+        self.session.headers["Accept-Encoding"] = accept_encoding
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+
+    def request(self, method, endpoint, data=None, headers=None, stream=False):
+        """Send a request through the shared session
+
+        Non-streamed bodies are read undecoded and decompressed here, so the
+        response carries wire_bytes and decode_ms alongside the usual content.
+        Failures while reading or decoding the body are raised as the requests
+        exceptions requests itself would have raised.
+        """
+        url = f"{self.base_url}{endpoint}"
+        response = self.session.request(method, url, json=data, headers=headers, timeout=self.timeout,
+                                        stream=True)
+        if stream:
+            return response
+        try:
+            raw = response.raw.read(decode_content=False)
+        except urllib3.exceptions.HTTPError as e:
+            raise requests.exceptions.ConnectionError(e, request=response.request) from e
+        finally:
+            # Hands the connection back to the pool, or drops it after a failed read
+            response.raw.release_conn()
+        start = time.perf_counter()
+        try:
+            response._content = decode_body(raw, response.headers.get("Content-Encoding"))
+        except DECODE_ERRORS as e:
+            raise requests.exceptions.ContentDecodingError(e, request=response.request) from e
+        response.decode_ms = (time.perf_counter() - start) * 1000
+        response.wire_bytes = len(raw)
+        return response
+
+    def connection_stats(self):
+        """Return counts of connections opened vs. reused across all pools"""
+        opened = sent = 0
+        pools = self.adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools[key]
+            opened += pool.num_connections
+            sent += pool.num_requests
+        return {"requests": sent, "opened": opened, "reused": max(sent - opened, 0)}
+
+    def close(self):
+        self.session.close()
+
+def configure_client(**kwargs):
+    """Replace the shared client, e.g. with CLI-provided pool/timeout settings"""
+    global api_client
+    if api_client is not None:
+        api_client.close()
+    api_client = ApiClient(**kwargs)
+    return api_client
+
+def get_client():
+    """Return the shared client, creating one with default settings if needed"""
+    if api_client is None:
+        configure_client()
+    return api_client
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram (about 1% relative precision, mergeable)"""
+
+    GROWTH = 1.02
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def bucket_of(self, ms):
+        # Bucket i holds values in [GROWTH**(i-1), GROWTH**i) microseconds
+        us = ms * 1000.0
+        return 0 if us < 1 else int(math.log(us) / math.log(self.GROWTH)) + 1
+
+    def bucket_value(self, index):
+        """Representative latency (ms) of a bucket: its geometric midpoint"""
+        return 0.0 if index == 0 else self.GROWTH ** (index - 0.5) / 1000.0
+
+    def record(self, ms):
+        index = self.bucket_of(ms)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def merge(self, other):
+        for index, n in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + n
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, pct):
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * pct / 100.0)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self.bucket_value(index), self.max)
+        return self.max
+
+    def to_dict(self):
+        return {"buckets": {str(i): n for i, n in self.buckets.items()},
+                "count": self.count, "total": self.total, "max": self.max}
+
+    @classmethod
+    def from_dict(cls, data):
+        hist = cls()
+        hist.buckets = {int(i): n for i, n in data["buckets"].items()}
+        hist.count = data["count"]
+        hist.total = data["total"]
+        hist.max = data["max"]
+        return hist
+
+# Server-Timing entries (as emitted by route.js) folded into the phases the harness reports
+PHASE_GROUPS = {
+    "auth": ("auth",),
+    "db": ("connect", "db"),
+    "compute": ("parse", "compute", "serialize", "compress"),
 }
+PHASES = {"network": "Network", "auth": "Auth", "db": "DB", "compute": "Compute", "other": "Other"}
+
+def parse_server_timing(header):
+    """Map Server-Timing metric names to durations in ms; entries without dur are skipped"""
+    timings = {}
+    for entry in (header or "").split(","):
+        name, *params = entry.strip().split(";")
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "dur":
+                try:
+                    timings[name.strip()] = timings.get(name.strip(), 0.0) + float(value.strip('"'))
+                except ValueError:
+                    pass
+    return timings
+
+def phase_breakdown(elapsed_ms, header):
+    """Split a request's client-side latency into PHASES, or None without server timings
+
+    network is everything outside the server's total (transfer, queueing, client
+    overhead); other is server time not covered by a named phase.
+    """
+    timings = parse_server_timing(header)
+    server_ms = timings.get("total")
+    if server_ms is None:
+        return None
+    phases = {name: sum(timings.get(metric, 0.0) for metric in metrics)
+              for name, metrics in PHASE_GROUPS.items()}
+    phases["network"] = max(elapsed_ms - server_ms, 0.0)
+    phases["other"] = max(server_ms - sum(phases[name] for name in PHASE_GROUPS), 0.0)
+    return phases
+
+class EndpointStats:
+    """Latency histogram, error count and per-phase histograms for one (method, route)"""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.errors = 0
+        self.phases = {}
+        self.decode = LatencyHistogram()
+        self.wire_bytes = 0
+        self.body_bytes = 0
+
+    def record_transfer(self, wire_bytes, body_bytes, decode_ms):
+        self.decode.record(decode_ms)
+        self.wire_bytes += wire_bytes
+        self.body_bytes += body_bytes
+
+    def record_phases(self, phases):
+        for name, ms in phases.items():
+            hist = self.phases.get(name)
+            if hist is None:
+                hist = self.phases[name] = LatencyHistogram()
+            hist.record(ms)
+
+    def merge(self, other):
+        self.latency.merge(other.latency)
+        self.errors += other.errors
+        for name, hist in other.phases.items():
+            self.phases.setdefault(name, LatencyHistogram()).merge(hist)
+        self.decode.merge(other.decode)
+        self.wire_bytes += other.wire_bytes
+        self.body_bytes += other.body_bytes
+
+def is_error_status(status):
+    """Transport failures, 5xx and 429 count as errors; other 4xx are expected by the tests"""
+    return status is None or status >= 500 or status == 429
+
+class MetricsRegistry:
+    """Thread-safe per-endpoint request metrics for one run"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.endpoints = {}
+        self.started = None
+        self.finished = None
+
+    def record(self, method, endpoint, elapsed_ms, status, phases=None, transfer=None):
+        """transfer is (wire bytes, decoded bytes, decode ms) when the body was read"""
+        key = f"{method} {endpoint.split('?', 1)[0]}"
+        now = time.monotonic()
+        with self.lock:
+            if self.started is None:
+                self.started = now - elapsed_ms / 1000.0
+            self.finished = now
+            stats = self.endpoints.get(key)
+            if stats is None:
+                stats = self.endpoints[key] = EndpointStats()
+            stats.latency.record(elapsed_ms)
+            if phases:
+                stats.record_phases(phases)
+            if transfer:
+                stats.record_transfer(*transfer)
+            if is_error_status(status):
+                stats.errors += 1
+
+    def reset(self):
+        """Drop everything recorded so far, e.g. after a setup phase"""
+        with self.lock:
+            self.endpoints = {}
+            self.started = None
+            self.finished = None
+
+    def drain(self):
+        """to_state() and reset() in one step, so no request falls between them"""
+        drained = MetricsRegistry()
+        with self.lock:
+            drained.endpoints, drained.started, drained.finished = self.endpoints, self.started, self.finished
+            self.endpoints, self.started, self.finished = {}, None, None
+        return drained.to_state()
+
+    def to_state(self):
+        """Compact, JSON-friendly copy of the recorded metrics (histogram buckets, not samples)"""
+        with self.lock:
+            return {
+                "started": self.started,
+                "finished": self.finished,
+                "endpoints": {key: {"latency": stats.latency.to_dict(), "errors": stats.errors,
+                                    "phases": {name: hist.to_dict() for name, hist in stats.phases.items()},
+                                    "decode": stats.decode.to_dict(), "wire_bytes": stats.wire_bytes,
+                                    "body_bytes": stats.body_bytes}
+                              for key, stats in self.endpoints.items()},
+            }
+
+    def merge_state(self, state):
+        """Fold in metrics recorded by another process (monotonic clocks are system-wide)"""
+        with self.lock:
+            if state["started"] is not None:
+                self.started = state["started"] if self.started is None else min(self.started, state["started"])
+                self.finished = state["finished"] if self.finished is None else max(self.finished, state["finished"])
+            for key, data in state["endpoints"].items():
+                other = EndpointStats()
+                other.latency = LatencyHistogram.from_dict(data["latency"])
+                other.errors = data["errors"]
+                other.phases = {name: LatencyHistogram.from_dict(hist)
+                                for name, hist in data.get("phases", {}).items()}
+                if "decode" in data:
+                    other.decode = LatencyHistogram.from_dict(data["decode"])
+                    other.wire_bytes = data["wire_bytes"]
+                    other.body_bytes = data["body_bytes"]
+                stats = self.endpoints.get(key)
+                if stats is None:
+                    stats = self.endpoints[key] = EndpointStats()
+                stats.merge(other)
+
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return self.finished - self.started
+
+    def snapshot(self):
+        """Summary rows per endpoint, as printed and exported to JSON"""
+        elapsed = self.elapsed()
+        rows = {}
+        with self.lock:
+            for key, stats in sorted(self.endpoints.items()):
+                hist = stats.latency
+                rows[key] = {
+                    "count": hist.count,
+                    "rps": hist.count / elapsed if elapsed else 0.0,
+                    "mean_ms": hist.mean(),
+                    "p50_ms": hist.percentile(50),
+                    "p95_ms": hist.percentile(95),
+                    "p99_ms": hist.percentile(99),
+                    "max_ms": hist.max,
+                    "error_rate": stats.errors / hist.count if hist.count else 0.0,
+                }
+                if stats.phases:
+                    rows[key]["phases"] = self.phase_rows(stats.phases)
+                if stats.decode.count:
+                    rows[key]["transfer"] = {
+                        "wire_bytes_mean": stats.wire_bytes / stats.decode.count,
+                        "body_bytes_mean": stats.body_bytes / stats.decode.count,
+                        "decode_p50_ms": stats.decode.percentile(50),
+                        "decode_p95_ms": stats.decode.percentile(95),
+                    }
+        return rows
+
+    @staticmethod
+    def phase_rows(phases):
+        """Percentiles per phase plus its share of the timed requests' total latency"""
+        overall = sum(hist.total for hist in phases.values())
+        return {
+            name: {
+                "mean_ms": hist.mean(),
+                "p50_ms": hist.percentile(50),
+                "p95_ms": hist.percentile(95),
+                "p99_ms": hist.percentile(99),
+                "share": hist.total / overall if overall else 0.0,
+            }
+            for name, hist in phases.items()
+        }
+
+    def export_json(self, path, base_url):
+        with self.lock:
+            histograms = {key: stats.latency.to_dict() for key, stats in self.endpoints.items()}
+        report = {
+            "base_url": base_url,
+            "elapsed_s": self.elapsed(),
+            "endpoints": self.snapshot(),
+            "histograms": histograms,
+        }
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
 
-# Global variables for test state
-auth_token = None
-user_id = None
-session_id = None
+metrics = MetricsRegistry()
+
+class EventLog:
+    """One JSON line per request, written by a background thread to size-rotated files
+
+    emit() never blocks the request loop: if the writer falls EVENT_LOG_QUEUE
+    records behind, new records are dropped and counted instead. events.jsonl
+    is written as events-0001.jsonl, events-0002.jsonl, ... The first file is
+    opened here, so an unwritable path raises OSError straight away.
+    """
+
+    def __init__(self, path, max_bytes=EVENT_LOG_MAX_MB * 2**20, queue_size=EVENT_LOG_QUEUE):
+        root, ext = os.path.splitext(path)
+        self.pattern = f"{root}-{{:04d}}{ext or '.jsonl'}"
+        self.max_bytes = max_bytes
+        self.queue = queue.Queue(queue_size)
+        self.lock = threading.Lock()
+        self.files = []
+        self.written = 0
+        self.dropped = 0
+        self.files.append(self.pattern.format(1))
+        self.file = open(self.files[0], "w")
+        self.thread = threading.Thread(target=self.run, name="event-log", daemon=True)
+        self.thread.start()
+
+    def emit(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self.lock:
+                self.dropped += 1
+
+    def run(self):
+        f, size = self.file, 0
+        try:
+            while True:
+                batch = [self.queue.get()]
+                try:
+                    while len(batch) < EVENT_LOG_BATCH and batch[-1] is not None:
+                        batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    pass
+                records = [record for record in batch if record is not None]
+                if records:
+                    if size >= self.max_bytes:
+                        f.close()
+                        self.files.append(self.pattern.format(len(self.files) + 1))
+                        f, size = open(self.files[-1], "w"), 0
+                    lines = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+                    f.write(lines)
+                    f.flush()
+                    size += len(lines)
+                    self.written += len(records)
+                if batch[-1] is None:
+                    return
+        finally:
+            f.close()
+
+    def close(self):
+        """Write out everything emitted so far and stop the writer
+
+        Does not wait on a writer that has died (e.g. the disk filled up),
+        whose queue would never drain.
+        """
+        while self.thread.is_alive():
+            try:
+                self.queue.put(None, timeout=1.0)
+                break
+            except queue.Full:
+                continue
+        self.thread.join()
+        if not self.written and len(self.files) == 1:
+            # e.g. the parent of --processes workers, which write their own files
+            os.remove(self.files.pop())
+
+# Set by --event-log; make_request emits one record per request when present
+event_log = None
+
+def start_event_log(path, max_mb=EVENT_LOG_MAX_MB):
+    global event_log
+    event_log = EventLog(path, int(max_mb * 2**20))
+    return event_log
+
+def stop_event_log():
+    """Close the event log; returns it (for its counters) or None if none was started"""
+    global event_log
+    log, event_log = event_log, None
+    if log is not None:
+        log.close()
+    return log
+
+class EndpointOverhead:
+    """Harness CPU spent on one endpoint's requests, next to their latency and server time"""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.server = LatencyHistogram()
+        self.request_cpu_ms = 0.0
+        self.after_cpu_ms = 0.0
+
+class ClientProfiler:
+    """Opt-in (--profile) profile of the harness itself
+
+    A sampler thread walks every thread's stack each interval and weights it by
+    the CPU time that thread used since the previous sample, so idle threads
+    (waiting on sockets, locks or sleeps) drop out and the collapsed stacks form
+    a CPU flamegraph. A thread found blocked in a PROFILE_IDLE_FRAMES call spent
+    the interval's CPU before it blocked, so that is charged to the last stack
+    it was seen running instead. make_request adds per-endpoint thread CPU time: while the
+    request is in flight (requests/urllib3, header parsing, decoding) and after
+    it returns until the thread's next request (checks, JSON parsing, logging).
+    """
+
+    def __init__(self, interval_ms=PROFILE_INTERVAL_MS):
+        self.interval = interval_ms / 1000.0
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.endpoints = {}
+        self.stacks = {}
+        self.samples = 0
+        self.sampler_cpu_ms = 0.0
+        # Per-thread CPU clocks are POSIX-only; elsewhere every sample weighs one interval
+        self.cpu_weighted = hasattr(time, "pthread_getcpuclockid")
+        self.clocks = {}
+        self.cpu_seen = {}
+        self.names = {}
+        self.busy = {}
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="profiler", daemon=True)
+
+    def start(self):
+        self.started = time.perf_counter()
+        for ident in sys._current_frames():
+            self.cpu_delta(ident)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+        self.elapsed = time.perf_counter() - self.started
+
+    def cpu_delta(self, ident):
+        """CPU seconds thread ident used since it was last seen (0 when it has exited)"""
+        if not self.cpu_weighted:
+            return self.interval
+        try:
+            clock = self.clocks.get(ident)
+            if clock is None:
+                clock = self.clocks[ident] = time.pthread_getcpuclockid(ident)
+            now = time.clock_gettime(clock)
+        except OSError:
+            self.clocks.pop(ident, None)
+            return 0.0
+        before = self.cpu_seen.get(ident, 0.0)
+        self.cpu_seen[ident] = now
+        # A reused thread id starts a new clock
+        return now - before if now >= before else now
+
+    def frame_name(self, code):
+        name = self.names.get(code)
+        if name is None:
+            name = f"{getattr(code, 'co_qualname', code.co_name)} ({os.path.basename(code.co_filename)})"
+            self.names[code] = name = name.replace(";", ":")
+        return name
+
+    def run(self):
+        own = threading.get_ident()
+        while not self.stopped.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                weight = self.cpu_delta(ident)
+                if weight <= 0:
+                    continue
+                idle = frame.f_code.co_name in PROFILE_IDLE_FRAMES
+                names = []
+                while frame is not None:
+                    names.append(self.frame_name(frame.f_code))
+                    frame = frame.f_back
+                stack = ";".join(reversed(names))
+                if idle:
+                    stack = self.busy.get(ident, stack)
+                else:
+                    self.busy[ident] = stack
+                self.stacks[stack] = self.stacks.get(stack, 0.0) + weight
+            self.samples += 1
+        self.sampler_cpu_ms = time.thread_time() * 1000
+
+    def begin_request(self):
+        """Thread CPU clock at the start of a request; charges the time since the
+        thread's previous response to that response's endpoint"""
+        now = time.thread_time()
+        previous = getattr(self.local, "previous", None)
+        if previous is not None:
+            key, returned = previous
+            with self.lock:
+                self.endpoints[key].after_cpu_ms += (now - returned) * 1000
+        return now
+
+    def end_request(self, method, endpoint, cpu_start, elapsed_ms, server_ms):
+        now = time.thread_time()
+        key = (method, endpoint.split("?", 1)[0])
+        with self.lock:
+            stats = self.endpoints.get(key)
+            if stats is None:
+                stats = self.endpoints[key] = EndpointOverhead()
+            stats.latency.record(elapsed_ms)
+            if server_ms is not None:
+                stats.server.record(server_ms)
+            stats.request_cpu_ms += (now - cpu_start) * 1000
+        self.local.previous = (key, now)
+
+    def functions(self):
+        """{frame: [self seconds, total seconds]} from the sampled stacks"""
+        totals = {}
+        for stack, weight in self.stacks.items():
+            frames = stack.split(";")
+            for name in set(frames):
+                totals.setdefault(name, [0.0, 0.0])[1] += weight
+            totals[frames[-1]][0] += weight
+        return totals
+
+    def write_folded(self, path):
+        """Collapsed stacks, one 'frame;frame;... microseconds' line each, for
+        flamegraph.pl, speedscope or inferno"""
+        with open(path, "w") as f:
+            for stack, weight in sorted(self.stacks.items()):
+                if round(weight * 1e6):
+                    f.write(f"{stack} {round(weight * 1e6)}\n")
+
+# Set by --profile; make_request reports per-endpoint harness CPU to it when present
+profiler = None
+
+def print_profile_summary(profile, output, top=PROFILE_TOP_FUNCTIONS):
+    print("\n" + "=" * 80)
+    print("🔬 CLIENT PROFILE")
+    print("=" * 80)
+    print("Harness overhead by endpoint (ms per request; CPU is this process's thread CPU time)")
+    print(f"{'Endpoint':<36}{'Count':>7}{'Latency':>9}{'Server':>9}{'CPU in':>9}{'CPU after':>10}{'Share':>7}")
+    for (method, endpoint), stats in sorted(profile.endpoints.items(), key=lambda item: item[0][1]):
+        count = stats.latency.count
+        server = f"{stats.server.percentile(50):>9.2f}" if stats.server.count else f"{'-':>9}"
+        request_cpu = stats.request_cpu_ms / count
+        # Share of the measured latency that was the harness's own CPU, not the server or the network
+        share = request_cpu / stats.latency.mean() if stats.latency.mean() else 0.0
+        print(f"{method + ' ' + endpoint:<36}{count:>7}{stats.latency.percentile(50):>9.2f}{server}"
+              f"{request_cpu:>9.3f}{stats.after_cpu_ms / count:>10.3f}{share:>7.1%}")
+    print("Latency and Server are p50s; CPU in is spent while the request is timed, "
+          "CPU after processing the response before the thread's next request")
+
+    functions = profile.functions()
+    sampled = sum(profile.stacks.values())
+    unit = "CPU" if profile.cpu_weighted else "wall"
+    print(f"\nTop functions by {unit} time ({profile.samples} samples, {sampled * 1000:.0f} ms sampled "
+          f"over {profile.elapsed:.1f}s; sampler used {profile.sampler_cpu_ms:.0f} ms CPU)")
+    print(f"{'Self ms':>9}{'Total ms':>10}{'Self%':>7}  Function")
+    for name, (own, total) in sorted(functions.items(), key=lambda item: -item[1][0])[:top]:
+        print(f"{own * 1000:>9.1f}{total * 1000:>10.1f}{own / sampled if sampled else 0.0:>7.1%}  {name}")
+    profile.write_folded(output)
+    print(f"\n🔥 {len(profile.stacks)} collapsed stacks written to {output} "
+          f"(flamegraph.pl {output} > flame.svg, or open it in speedscope)")
+
+def start_profiler(interval_ms=PROFILE_INTERVAL_MS):
+    global profiler
+    profiler = ClientProfiler(interval_ms)
+    profiler.start()
+    return profiler
+
+def stop_profiler():
+    """Stop the sampler; returns the profiler (for its report) or None if none was started"""
+    global profiler
+    profile, profiler = profiler, None
+    if profile is not None:
+        profile.stop()
+    return profile
+
+def print_header(title):
+    """Print a section banner for a test"""
+    if not VERBOSE:
+        return
+    print("=" * 60)
+    print(f"TESTING: {title}")
+    print("=" * 60)
 
 def log_test(test_name, status, details=""):
     """Log test results with timestamp"""
+    if not VERBOSE:
+        return
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     status_symbol = "✅" if status == "PASS" else "❌" if status == "FAIL" else "⚠️"
     print(f"[{timestamp}] {status_symbol} {test_name}: {status}")
@@ -35,572 +789,816 @@ def log_test(test_name, status, details=""):
         print(f"    Details: {details}")
     print()
 
-def make_request(method, endpoint, data=None, headers=None, auth_required=False):
+def make_request(method, endpoint, data=None, headers=None, auth_required=False, state=None,
+                 stream=False):
     """Make HTTP request with proper error handling"""
-    url = f"{BASE_URL}{endpoint}"
+    state = state or default_state
     
     # Add auth header if required
-    if auth_required and auth_token:
+    if auth_required and state.auth_token:
         if not headers:
             headers = {}
-        headers["Authorization"] = f"Bearer {auth_token}"
+        headers["Authorization"] = f"Bearer {state.auth_token}"
     
+    if method not in ("GET", "POST", "PUT", "DELETE"):
+        raise ValueError(f"Unsupported method: {method}")
+    
+    # Streamed responses return once headers arrive, so they are kept apart
+    label = f"{endpoint} (stream)" if stream else endpoint
+    profile = profiler
+    cpu_start = profile.begin_request() if profile is not None else None
+    started_at = time.time()
+    start = time.perf_counter()
     try:
-        if method == "GET":
-            response = requests.get(url, headers=headers, timeout=30)
-        elif method == "POST":
-            response = requests.post(url, json=data, headers=headers, timeout=30)
-        elif method == "PUT":
-            response = requests.put(url, json=data, headers=headers, timeout=30)
-        elif method == "DELETE":
-            response = requests.delete(url, headers=headers, timeout=30)
-        else:
-            raise ValueError(f"Unsupported method: {method}")
-            
-        return response
+        response = get_client().request(method, endpoint, data=data, headers=headers, stream=stream)
     except requests.exceptions.RequestException as e:
-        print(f"Request failed: {e}")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if profile is not None:
+            profile.end_request(method, label, cpu_start, elapsed_ms, None)
+        metrics.record(method, label, elapsed_ms, None)
+        if event_log is not None:
+            event_log.emit(request_event(started_at, state, method, label, None, elapsed_ms, None,
+                                         type(e).__name__))
+        if VERBOSE:
+            print(f"Request failed: {e}")
         return None
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    phases = phase_breakdown(elapsed_ms, response.headers.get("Server-Timing"))
+    if profile is not None:
+        profile.end_request(method, label, cpu_start, elapsed_ms,
+                            elapsed_ms - phases["network"] if phases else None)
+    transfer = None
+    if not stream:
+        transfer = (response.wire_bytes, len(response.content), response.decode_ms)
+    metrics.record(method, label, elapsed_ms, response.status_code, phases, transfer)
+    if event_log is not None:
+        error = response_error(response) if not stream else None
+        event_log.emit(request_event(started_at, state, method, label, response.status_code, elapsed_ms,
+                                     response.wire_bytes if not stream else None, error))
+    return response
 
-def test_root_endpoint():
-    """Test the root API endpoint"""
-    print("=" * 60)
-    print("TESTING: Root API Endpoint")
-    print("=" * 60)
-    
-    response = make_request("GET", "/")
-    
+def request_event(started_at, state, method, endpoint, status, elapsed_ms, wire_bytes, error):
+    """Compact event log record of one request; error is only present on failures"""
+    record = {"t": round(started_at, 4), "vu": state.vu, "route": f"{method} {endpoint.split('?', 1)[0]}",
+              "status": status, "ms": round(elapsed_ms, 3), "bytes": wire_bytes}
+    if error:
+        record["error"] = error
+    return record
+
+def response_error(response):
+    """Error message of a failed response for the event log, None for a success"""
+    if response.status_code < 400:
+        return None
+    try:
+        return json_body(response).get("error")
+    except (ValueError, AttributeError):
+        return f"HTTP {response.status_code}"
+
+def print_event_log_summary(log):
+    if log is not None and log.files:
+        print(f"📝 {log.written} request events written to {', '.join(log.files)}"
+              + (f" ({log.dropped} dropped)" if log.dropped else ""))
+
+# Shared fixtures for the sync and async test flows
+ASSESSMENT_DATA = {
+    "interests": ["Technology", "Business"],
+    "skills": ["Programming", "Communication", "Data Analysis"],
+    "goals": ["Get a good job", "Learn new skills"],
+    "challenges": ["Lack of experience", "Interview anxiety"],
+    "workPreference": "remote",
+    "careerStage": "entry-level"
+}
+
+CHAT_TEST_MESSAGES = [
+    {"message": "How can I improve my resume?", "expected_keywords": ["resume", "tips"]},
+    {"message": "Tell me about interview preparation", "expected_keywords": ["interview", "preparation"]},
+    {"message": "What career options do I have?", "expected_keywords": ["career", "opportunities"]},
+    {"message": "How can I learn new skills?", "expected_keywords": ["skill", "development"]}
+]
+
+# Dashboard sections a bandwidth-conscious client asks for with ?fields=
+DASHBOARD_FIELDS = ["skills", "recommendedCourses", "progress"]
+
+# Second assessment with different skills, to check the dashboard cache is invalidated
+ALT_ASSESSMENT_DATA = {
+    "interests": ["Creative Arts"],
+    "skills": ["Design", "Sales"],
+    "goals": ["Start a business"],
+    "challenges": ["Limited network"],
+    "workPreference": "hybrid",
+    "careerStage": "career-change"
+}
+
+PROTECTED_ENDPOINTS = [
+    ("GET", "/auth/me"),
+    ("POST", "/assessment/submit"),
+    ("GET", "/dashboard"),
+    ("POST", "/chat"),
+    ("GET", "/jobs"),
+    ("GET", "/courses"),
+    ("POST", "/apply")
+]
+
+# Response checks, shared by the sync tests below and backend_test_async.py
+
+class SchemaSampler:
+    """Validates 1 in every N checked responses against response_schemas (--validate-every)
+
+    every=1 checks every response, every=0 none; skipped responses are still
+    decoded and get the checks' own assertions.
+    """
+
+    def __init__(self, every=VALIDATE_EVERY):
+        self.every = every
+        self.ticks = itertools.count()
+        self.lock = threading.Lock()
+        self.validated = 0
+        self.failures = {}
+
+    def check(self, method, route, status, data):
+        """Error message when this response is sampled and does not match its schema"""
+        if self.every <= 0 or (self.every > 1 and next(self.ticks) % self.every):
+            return None
+        problem = validate_schema(method, route, status, data)
+        with self.lock:
+            self.validated += 1
+            if problem:
+                key = f"{method} {route}"
+                count, first = self.failures.get(key, (0, problem))
+                self.failures[key] = (count + 1, first)
+        return problem
+
+    def to_state(self):
+        with self.lock:
+            return {"validated": self.validated, "failures": dict(self.failures)}
+
+    def merge_state(self, state):
+        """Add counts from another process's to_state()"""
+        with self.lock:
+            self.validated += state["validated"]
+            for key, (count, first) in state["failures"].items():
+                total, kept = self.failures.get(key, (0, first))
+                self.failures[key] = (total + count, kept)
+
+schema_checks = SchemaSampler()
+
+def checked_json(test_name, method, route, response, status=200):
+    """Decoded body of a response with the expected status that, when sampled, matches
+    its route's schema; logs the failure and returns None otherwise"""
     if response is None:
-        log_test("Root Endpoint", "FAIL", "Request failed")
+        log_test(test_name, "FAIL", "Request failed")
+        return None
+    if response.status_code != status:
+        if status == 200:
+            log_test(test_name, "FAIL", f"Status: {response.status_code}, Response: {response.text}")
+        else:
+            log_test(test_name, "FAIL", f"Expected {status}, got {response.status_code}")
+        return None
+    try:
+        data = json_body(response)
+    except json.JSONDecodeError:
+        log_test(test_name, "FAIL", "Invalid JSON response")
+        return None
+    problem = schema_checks.check(method, route, status, data)
+    if problem:
+        log_test(test_name, "FAIL", f"Unexpected response shape: {problem}")
+        return None
+    return data
+
+# What reading an unexpected body shape raises, e.g. a list where an object was expected
+MALFORMED_RESPONSE_ERRORS = (LookupError, TypeError, AttributeError)
+
+def run_check(check, *args):
+    """Run a test or check; with --validate-every N a malformed response that was not
+    sampled fails the check instead of raising out of it"""
+    try:
+        return bool(check(*args))
+    except MALFORMED_RESPONSE_ERRORS as e:
+        log_test(getattr(check, "__name__", "check"), "FAIL", f"Malformed response: {e!r}")
         return False
-    
-    if response.status_code == 200:
-        try:
-            data = response.json()
-            if "message" in data and "EmpowerYouth API is running" in data["message"]:
-                log_test("Root Endpoint", "PASS", f"API is running: {data['message']}")
-                return True
-            else:
-                log_test("Root Endpoint", "FAIL", f"Unexpected response: {data}")
-                return False
-        except json.JSONDecodeError:
-            log_test("Root Endpoint", "FAIL", "Invalid JSON response")
-            return False
-    else:
-        log_test("Root Endpoint", "FAIL", f"Status: {response.status_code}, Response: {response.text}")
+
+def require_token(test_name, state):
+    """Fail a test up front when the user has no auth token"""
+    if not state.auth_token:
+        log_test(test_name, "FAIL", "No auth token available")
         return False
+    return True
 
-def test_user_registration():
-    """Test user registration endpoint"""
-    global auth_token, user_id
-    
-    print("=" * 60)
-    print("TESTING: User Registration System")
-    print("=" * 60)
-    
-    # Test successful registration
-    response = make_request("POST", "/auth/register", TEST_USER_DATA)
-    
-    if response is None:
-        log_test("User Registration", "FAIL", "Request failed")
+def check_root_endpoint(response):
+    data = checked_json("Root Endpoint", "GET", "/", response)
+    if data is None:
+        return False
+    if "EmpowerYouth API is running" in data["message"]:
+        log_test("Root Endpoint", "PASS", f"API is running: {data['message']}")
+        return True
+    log_test("Root Endpoint", "FAIL", f"Unexpected response: {data}")
+    return False
+
+def check_user_registration(response, state):
+    data = checked_json("User Registration", "POST", "/auth/register", response)
+    if data is None:
         return False
+    state.auth_token = data["token"]
+    state.user_id = data["user"]["id"]
+    log_test("User Registration", "PASS", f"User created with ID: {state.user_id}")
     
-    if response.status_code == 200:
-        try:
-            data = response.json()
-            if "user" in data and "token" in data:
-                auth_token = data["token"]
-                user_id = data["user"]["id"]
-                log_test("User Registration", "PASS", f"User created with ID: {user_id}")
-                
-                # Verify user data
-                user = data["user"]
-                if (user["name"] == TEST_USER_DATA["name"] and 
-                    user["email"] == TEST_USER_DATA["email"] and
-                    user["phone"] == TEST_USER_DATA["phone"]):
-                    log_test("User Data Validation", "PASS", "All user fields correctly stored")
-                else:
-                    log_test("User Data Validation", "FAIL", "User data mismatch")
-                    return False
-                
-                return True
-            else:
-                log_test("User Registration", "FAIL", f"Missing user or token in response: {data}")
-                return False
-        except json.JSONDecodeError:
-            log_test("User Registration", "FAIL", "Invalid JSON response")
-            return False
-    else:
-        log_test("User Registration", "FAIL", f"Status: {response.status_code}, Response: {response.text}")
+    # Verify user data
+    user = data["user"]
+    if (user["name"] == state.user_data["name"] and 
+        user["email"] == state.user_data["email"] and
+        user["phone"] == state.user_data["phone"]):
+        log_test("User Data Validation", "PASS", "All user fields correctly stored")
+        return True
+    log_test("User Data Validation", "FAIL", "User data mismatch")
+    return False
+
+def check_duplicate_registration(response):
+    data = checked_json("Duplicate Registration", "POST", "/auth/register", response, status=400)
+    if data is None:
         return False
+    if "already exists" in data["error"].lower():
+        log_test("Duplicate Registration", "PASS", "Correctly rejected duplicate email")
+        return True
+    log_test("Duplicate Registration", "FAIL", f"Unexpected error message: {data}")
+    return False
 
-def test_duplicate_registration():
-    """Test duplicate email handling"""
-    print("=" * 60)
-    print("TESTING: Duplicate Email Handling")
-    print("=" * 60)
-    
-    # Try to register with same email
-    response = make_request("POST", "/auth/register", TEST_USER_DATA)
-    
-    if response is None:
-        log_test("Duplicate Registration", "FAIL", "Request failed")
+def check_auth_me(response, state):
+    data = checked_json("Auth Me Endpoint", "GET", "/auth/me", response)
+    if data is None:
         return False
-    
-    if response.status_code == 400:
-        try:
-            data = response.json()
-            if "error" in data and "already exists" in data["error"].lower():
-                log_test("Duplicate Registration", "PASS", "Correctly rejected duplicate email")
-                return True
-            else:
-                log_test("Duplicate Registration", "FAIL", f"Unexpected error message: {data}")
-                return False
-        except json.JSONDecodeError:
-            log_test("Duplicate Registration", "FAIL", "Invalid JSON response")
-            return False
-    else:
-        log_test("Duplicate Registration", "FAIL", f"Expected 400, got {response.status_code}")
+    if data["id"] == state.user_id:
+        log_test("Auth Me Endpoint", "PASS", f"Successfully retrieved user: {data['name']}")
+        return True
+    log_test("Auth Me Endpoint", "FAIL", f"User ID mismatch: {data}")
+    return False
+
+def check_invalid_token(response):
+    if checked_json("Invalid Token", "GET", "/auth/me", response, status=401) is None:
         return False
+    log_test("Invalid Token", "PASS", "Correctly rejected invalid token")
+    return True
 
-def test_auth_me_endpoint():
-    """Test the /auth/me endpoint"""
-    print("=" * 60)
-    print("TESTING: Authentication Token Validation")
-    print("=" * 60)
-    
-    if not auth_token:
-        log_test("Auth Me Endpoint", "FAIL", "No auth token available")
+def check_career_assessment(response):
+    data = checked_json("Career Assessment", "POST", "/assessment/submit", response)
+    if data is None:
         return False
-    
-    # Test with valid token
-    response = make_request("GET", "/auth/me", auth_required=True)
-    
-    if response is None:
-        log_test("Auth Me Endpoint", "FAIL", "Request failed")
+    skill_vector = data["skillVector"]
+    log_test("Career Assessment", "PASS", f"Assessment processed, {len(skill_vector)} skills generated")
+    log_test("Skill Vector Generation", "PASS", f"Skills: {[s['name'] for s in skill_vector[:3]]}")
+    return True
+
+def check_dashboard(response):
+    data = checked_json("Dashboard API", "GET", "/dashboard", response)
+    if data is None:
         return False
-    
-    if response.status_code == 200:
-        try:
-            data = response.json()
-            if "id" in data and data["id"] == user_id:
-                log_test("Auth Me Endpoint", "PASS", f"Successfully retrieved user: {data['name']}")
-                return True
-            else:
-                log_test("Auth Me Endpoint", "FAIL", f"User ID mismatch or missing: {data}")
-                return False
-        except json.JSONDecodeError:
-            log_test("Auth Me Endpoint", "FAIL", "Invalid JSON response")
-            return False
-    else:
-        log_test("Auth Me Endpoint", "FAIL", f"Status: {response.status_code}, Response: {response.text}")
+    log_test("Dashboard API", "PASS", "All dashboard components present")
+    if data["jobMatches"]:
+        log_test("Job Matching", "PASS", f"Found {len(data['jobMatches'])} job matches")
+    if data["recommendedCourses"]:
+        log_test("Course Recommendations", "PASS",
+                 f"Found {len(data['recommendedCourses'])} course recommendations")
+    log_test("Progress Tracking", "PASS", f"Profile completion: {data['progress']['profileCompletion']}%")
+    return True
+
+def check_dashboard_cache_hits(samples):
+    """Check repeated dashboard reads are served from cache; samples are (response, ms) pairs"""
+    failed = [response for response, _ in samples if response is None or response.status_code != 200]
+    if failed:
+        log_test("Dashboard Cache Hits", "FAIL", f"{len(failed)}/{len(samples)} dashboard requests failed")
         return False
 
-def test_invalid_token():
-    """Test invalid token handling"""
-    print("=" * 60)
-    print("TESTING: Invalid Token Handling")
-    print("=" * 60)
-    
-    # Test with invalid token
-    headers = {"Authorization": "Bearer invalid_token_123"}
-    response = make_request("GET", "/auth/me", headers=headers)
-    
-    if response is None:
-        log_test("Invalid Token", "FAIL", "Request failed")
+    statuses = [response.headers.get("X-Cache") for response, _ in samples]
+    if not any(statuses):
+        log_test("Dashboard Cache Hits", "WARN", "Server does not report X-Cache; skipping hit checks")
+        return True
+
+    hits, misses = LatencyHistogram(), LatencyHistogram()
+    for status, (_, ms) in zip(statuses, samples):
+        (hits if status == "HIT" else misses).record(ms)
+    hit_rate = hits.count / len(samples)
+    details = (f"{hits.count}/{len(samples)} hits, hit p50 {hits.percentile(50):.1f} ms, "
+               f"p95 {hits.percentile(95):.1f} ms")
+    if misses.count:
+        details += f", miss p50 {misses.percentile(50):.1f} ms"
+
+    if hit_rate < DASHBOARD_CACHE_MIN_HIT_RATE:
+        log_test("Dashboard Cache Hits", "FAIL", details)
         return False
-    
-    if response.status_code == 401:
-        try:
-            data = response.json()
-            if "error" in data:
-                log_test("Invalid Token", "PASS", "Correctly rejected invalid token")
-                return True
-            else:
-                log_test("Invalid Token", "FAIL", f"Missing error message: {data}")
-                return False
-        except json.JSONDecodeError:
-            log_test("Invalid Token", "FAIL", "Invalid JSON response")
-            return False
+    if misses.count and hits.percentile(50) > misses.percentile(50):
+        log_test("Dashboard Cache Hits", "WARN", details + " (hits are not faster than misses)")
     else:
-        log_test("Invalid Token", "FAIL", f"Expected 401, got {response.status_code}")
+        log_test("Dashboard Cache Hits", "PASS", details)
+    return True
+
+def check_dashboard_freshness(submit_response, response):
+    """Check the dashboard reflects an assessment submitted just before it"""
+    if submit_response is None or submit_response.status_code != 200:
+        log_test("Dashboard Cache Invalidation", "FAIL", "Assessment submission failed")
+        return False
+    if response is None or response.status_code != 200:
+        log_test("Dashboard Cache Invalidation", "FAIL", "Dashboard request failed")
         return False
 
-def test_career_assessment():
-    """Test career assessment submission"""
-    print("=" * 60)
-    print("TESTING: Career Assessment API")
-    print("=" * 60)
-    
-    if not auth_token:
-        log_test("Career Assessment", "FAIL", "No auth token available")
+    expected = sorted(skill["name"] for skill in json_body(submit_response)["skillVector"])
+    served = sorted(skill["name"] for skill in json_body(response)["skills"])
+    if served != expected:
+        log_test("Dashboard Cache Invalidation", "FAIL", f"Stale skills {served}, expected {expected}")
         return False
-    
-    # Sample assessment data
-    assessment_data = {
-        "interests": ["Technology", "Business"],
-        "skills": ["Programming", "Communication", "Data Analysis"],
-        "goals": ["Get a good job", "Learn new skills"],
-        "challenges": ["Lack of experience", "Interview anxiety"],
-        "workPreference": "remote",
-        "careerStage": "entry-level"
-    }
-    
-    response = make_request("POST", "/assessment/submit", assessment_data, auth_required=True)
-    
-    if response is None:
-        log_test("Career Assessment", "FAIL", "Request failed")
+    if response.headers.get("X-Cache") == "HIT":
+        log_test("Dashboard Cache Invalidation", "FAIL", "Dashboard served from cache after a new assessment")
         return False
-    
-    if response.status_code == 200:
-        try:
-            data = response.json()
-            if "success" in data and data["success"] and "skillVector" in data:
-                skill_vector = data["skillVector"]
-                if len(skill_vector) > 0:
-                    log_test("Career Assessment", "PASS", f"Assessment processed, {len(skill_vector)} skills generated")
-                    
-                    # Verify skill structure
-                    first_skill = skill_vector[0]
-                    if "name" in first_skill and "level" in first_skill:
-                        log_test("Skill Vector Generation", "PASS", f"Skills: {[s['name'] for s in skill_vector[:3]]}")
-                        return True
-                    else:
-                        log_test("Skill Vector Generation", "FAIL", "Invalid skill structure")
-                        return False
-                else:
-                    log_test("Career Assessment", "FAIL", "Empty skill vector")
-                    return False
-            else:
-                log_test("Career Assessment", "FAIL", f"Unexpected response: {data}")
-                return False
-        except json.JSONDecodeError:
-            log_test("Career Assessment", "FAIL", "Invalid JSON response")
+    log_test("Dashboard Cache Invalidation", "PASS", f"Fresh skills right after assessment: {', '.join(served)}")
+    return True
+
+def check_sparse_fields(dashboard_response, jobs_response):
+    """Check ?fields= trims the dashboard to the requested sections and jobs to the requested keys"""
+    for name, response in (("dashboard", dashboard_response), ("jobs", jobs_response)):
+        if response is None or response.status_code != 200:
+            log_test("Sparse Fieldsets", "FAIL", f"{name} request failed")
             return False
-    else:
-        log_test("Career Assessment", "FAIL", f"Status: {response.status_code}, Response: {response.text}")
+
+    sections = sorted(json_body(dashboard_response))
+    if sections != sorted(DASHBOARD_FIELDS):
+        log_test("Sparse Fieldsets", "FAIL", f"Dashboard returned {sections}, expected {sorted(DASHBOARD_FIELDS)}")
+        return False
+    jobs = json_body(jobs_response).get("jobs", [])
+    extra = {key for job in jobs for key in job} - {"id", "title"}
+    if not jobs or extra:
+        log_test("Sparse Fieldsets", "FAIL", f"Jobs carried unrequested fields: {sorted(extra)}")
         return False
 
-def test_dashboard_api():
-    """Test personalized dashboard API"""
-    print("=" * 60)
-    print("TESTING: Personalized Dashboard API")
-    print("=" * 60)
+    encoding = dashboard_response.headers.get("Content-Encoding", "identity")
+    log_test("Sparse Fieldsets", "PASS",
+             f"Dashboard {len(dashboard_response.content)} bytes ({encoding}: "
+             f"{getattr(dashboard_response, 'wire_bytes', len(dashboard_response.content))} on the wire)")
+    return True
+
+def log_cache_stats(response):
+    if response is not None and response.status_code == 200:
+        stats = json_body(response).get("dashboard", {})
+        log_test("Dashboard Cache Stats", "PASS",
+                 f"hits {stats.get('hits')}, misses {stats.get('misses')}, "
+                 f"evictions {stats.get('evictions')}, hit rate {stats.get('hitRate', 0) * 100:.1f}%")
+
+def chat_request_data(test_case, state):
+    return {
+        "message": test_case["message"],
+        "language": "en",
+        "sessionId": state.session_id
+    }
+
+def check_chat_message(i, test_case, response, state):
+    """Check one chat reply; returns False when the conversation should stop"""
+    if response is None:
+        log_test(f"Chat Message {i+1}", "FAIL", "Request failed")
+        return True
     
-    if not auth_token:
-        log_test("Dashboard API", "FAIL", "No auth token available")
+    data = checked_json(f"Chat Message {i+1}", "POST", "/chat", response)
+    if data is None:
         return False
+    state.session_id = data["sessionId"]  # Store for next message
+    bot_response = data["response"].lower()
     
-    response = make_request("GET", "/dashboard", auth_required=True)
-    
+    # Check if response contains expected keywords
+    if any(keyword in bot_response for keyword in test_case["expected_keywords"]):
+        log_test(f"Chat Message {i+1}", "PASS", f"Relevant response for: '{test_case['message'][:30]}...'")
+    else:
+        log_test(f"Chat Message {i+1}", "WARN", f"Generic response for: '{test_case['message'][:30]}...'")
+    return True
+
+def parse_chat_stream_line(line, event, events, started):
+    """Apply one server-sent event line; returns the name of the event being read"""
+    if line.startswith("event: "):
+        return line[7:]
+    if line.startswith("data: "):
+        events.append((event, json_loads(line[6:]), time.perf_counter() - started))
+    return event
+
+def read_chat_stream(response, started):
+    """Parse a server-sent event chat reply into (event, data, seconds since started)"""
+    events = []
+    event = None
+    try:
+        for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+            event = parse_chat_stream_line(line, event, events, started)
+    except (requests.exceptions.RequestException, json.JSONDecodeError):
+        events.append(("error", {"error": "Broken event stream"}, time.perf_counter() - started))
+    finally:
+        response.close()
+    return events
+
+def check_streaming_chat(response, events):
     if response is None:
-        log_test("Dashboard API", "FAIL", "Request failed")
+        log_test("Streaming Chat", "FAIL", "Request failed")
         return False
     
-    if response.status_code == 200:
-        try:
-            data = response.json()
-            
-            # Check required dashboard components
-            required_fields = ["skills", "jobMatches", "jobs", "courses", "recommendedCourses", "progress"]
-            missing_fields = [field for field in required_fields if field not in data]
-            
-            if not missing_fields:
-                log_test("Dashboard API", "PASS", "All dashboard components present")
-                
-                # Test job matches
-                if len(data["jobMatches"]) > 0:
-                    job = data["jobMatches"][0]
-                    if "title" in job and "company" in job and "matchPercentage" in job:
-                        log_test("Job Matching", "PASS", f"Found {len(data['jobMatches'])} job matches")
-                    else:
-                        log_test("Job Matching", "FAIL", "Invalid job structure")
-                        return False
-                
-                # Test course recommendations
-                if len(data["recommendedCourses"]) > 0:
-                    course = data["recommendedCourses"][0]
-                    if "title" in course and "provider" in course:
-                        log_test("Course Recommendations", "PASS", f"Found {len(data['recommendedCourses'])} course recommendations")
-                    else:
-                        log_test("Course Recommendations", "FAIL", "Invalid course structure")
-                        return False
-                
-                # Test progress tracking
-                progress = data["progress"]
-                if "profileCompletion" in progress and "coursesCompleted" in progress:
-                    log_test("Progress Tracking", "PASS", f"Profile completion: {progress['profileCompletion']}%")
-                else:
-                    log_test("Progress Tracking", "FAIL", "Invalid progress structure")
-                    return False
-                
-                return True
-            else:
-                log_test("Dashboard API", "FAIL", f"Missing fields: {missing_fields}")
-                return False
-                
-        except json.JSONDecodeError:
-            log_test("Dashboard API", "FAIL", "Invalid JSON response")
-            return False
-    else:
-        log_test("Dashboard API", "FAIL", f"Status: {response.status_code}, Response: {response.text}")
+    if response.status_code != 200:
+        log_test("Streaming Chat", "FAIL", f"Status: {response.status_code}")
         return False
+    if not response.headers.get("Content-Type", "").startswith("text/event-stream"):
+        log_test("Streaming Chat", "FAIL", f"Not an event stream: {response.headers.get('Content-Type')}")
+        return False
+    
+    names = [name for name, _, _ in events]
+    chunks = [data["text"] for name, data, _ in events if name == "chunk"]
+    if not names or names[0] != "session" or "sessionId" not in events[0][1]:
+        log_test("Streaming Chat", "FAIL", f"sessionId was not sent first: {names[:3]}")
+        return False
+    if not chunks or names[-1] != "done":
+        log_test("Streaming Chat", "FAIL", f"Incomplete stream: {names}")
+        return False
+    if "".join(chunks) != events[-1][1].get("response"):
+        log_test("Streaming Chat", "FAIL", "Streamed chunks do not add up to the final reply")
+        return False
+    
+    first_chunk = next(t for name, _, t in events if name == "chunk")
+    log_test("Streaming Chat", "PASS", f"{len(chunks)} chunks, first after {first_chunk * 1000:.1f} ms, "
+             f"done after {events[-1][2] * 1000:.1f} ms")
+    return True
 
-def test_ai_chatbot():
-    """Test AI chatbot API"""
-    global session_id
+def check_jobs(response):
+    data = checked_json("Jobs API", "GET", "/jobs", response)
+    if data is None:
+        return False
+    if not data["jobs"]:
+        log_test("Jobs API", "FAIL", "No jobs found in response")
+        return False
+    log_test("Jobs API", "PASS", f"Found {len(data['jobs'])} jobs with complete data")
+    return True
+
+def check_courses(response):
+    data = checked_json("Courses API", "GET", "/courses", response)
+    if data is None:
+        return False
+    if not data["courses"]:
+        log_test("Courses API", "FAIL", "No courses found in response")
+        return False
     
-    print("=" * 60)
-    print("TESTING: AI Chatbot API")
-    print("=" * 60)
+    # Check for different providers
+    providers = set(c["provider"] for c in data["courses"])
+    expected_providers = {"IBM SkillsBuild", "Coursera", "NSDC"}
+    if expected_providers.intersection(providers):
+        log_test("Courses API", "PASS", f"Found {len(data['courses'])} courses from providers: {list(providers)}")
+    else:
+        log_test("Courses API", "WARN", f"Unexpected providers: {list(providers)}")
+    return True
+
+def first_job_id(jobs_response):
+    """Pick the job to apply to from a /jobs response, or None"""
+    if jobs_response and jobs_response.status_code == 200:
+        jobs_data = json_body(jobs_response)
+        if "jobs" in jobs_data and len(jobs_data["jobs"]) > 0:
+            return jobs_data["jobs"][0]["id"]
+        log_test("Job Application", "FAIL", "No jobs available to apply to")
+        return None
+    log_test("Job Application", "FAIL", "Could not fetch jobs for application test")
+    return None
+
+def check_job_application(response):
+    if checked_json("Job Application", "POST", "/apply", response) is None:
+        return False
+    log_test("Job Application", "PASS", "Successfully applied to job")
+    return True
+
+def check_auth_required(endpoint, response):
+    if response is None:
+        log_test(f"Auth Required {endpoint}", "FAIL", "Request failed")
+        return False
     
-    if not auth_token:
-        log_test("AI Chatbot", "FAIL", "No auth token available")
+    if response.status_code == 401:
+        log_test(f"Auth Required {endpoint}", "PASS", "Correctly requires authentication")
+        return True
+    else:
+        log_test(f"Auth Required {endpoint}", "FAIL", f"Expected 401, got {response.status_code}")
         return False
+
+# Sync tests
+
+def test_root_endpoint():
+    """Test the root API endpoint"""
+    print_header("Root API Endpoint")
     
-    # Test different types of questions
-    test_messages = [
-        {"message": "How can I improve my resume?", "expected_keywords": ["resume", "tips"]},
-        {"message": "Tell me about interview preparation", "expected_keywords": ["interview", "preparation"]},
-        {"message": "What career options do I have?", "expected_keywords": ["career", "opportunities"]},
-        {"message": "How can I learn new skills?", "expected_keywords": ["skill", "development"]}
-    ]
-    
-    for i, test_case in enumerate(test_messages):
-        chat_data = {
-            "message": test_case["message"],
-            "language": "en",
-            "sessionId": session_id
-        }
-        
-        response = make_request("POST", "/chat", chat_data, auth_required=True)
-        
-        if response is None:
-            log_test(f"Chat Message {i+1}", "FAIL", "Request failed")
-            continue
-        
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                if "response" in data and "sessionId" in data:
-                    session_id = data["sessionId"]  # Store for next message
-                    bot_response = data["response"].lower()
-                    
-                    # Check if response contains expected keywords
-                    has_keywords = any(keyword in bot_response for keyword in test_case["expected_keywords"])
-                    
-                    if has_keywords:
-                        log_test(f"Chat Message {i+1}", "PASS", f"Relevant response for: '{test_case['message'][:30]}...'")
-                    else:
-                        log_test(f"Chat Message {i+1}", "WARN", f"Generic response for: '{test_case['message'][:30]}...'")
-                else:
-                    log_test(f"Chat Message {i+1}", "FAIL", f"Missing response or sessionId: {data}")
-                    return False
-            except json.JSONDecodeError:
-                log_test(f"Chat Message {i+1}", "FAIL", "Invalid JSON response")
-                return False
-        else:
-            log_test(f"Chat Message {i+1}", "FAIL", f"Status: {response.status_code}")
-            return False
+    response = make_request("GET", "/")
+    return check_root_endpoint(response)
+
+def test_user_registration(state=None):
+    """Test user registration endpoint"""
+    state = state or default_state
     
-    log_test("AI Chatbot Overall", "PASS", "Chat functionality working with mock responses")
-    return True
+    print_header("User Registration System")
+    
+    # Test successful registration
+    response = make_request("POST", "/auth/register", state.user_data, state=state)
+    return check_user_registration(response, state)
 
-def test_jobs_api():
-    """Test jobs listing API"""
-    print("=" * 60)
-    print("TESTING: Jobs API")
-    print("=" * 60)
+def test_duplicate_registration(state=None):
+    """Test duplicate email handling"""
+    state = state or default_state
+    print_header("Duplicate Email Handling")
     
-    if not auth_token:
-        log_test("Jobs API", "FAIL", "No auth token available")
+    # Try to register with same email
+    response = make_request("POST", "/auth/register", state.user_data, state=state)
+    return check_duplicate_registration(response)
+
+def test_auth_me_endpoint(state=None):
+    """Test the /auth/me endpoint"""
+    state = state or default_state
+    print_header("Authentication Token Validation")
+    
+    if not require_token("Auth Me Endpoint", state):
         return False
     
-    response = make_request("GET", "/jobs", auth_required=True)
+    # Test with valid token
+    response = make_request("GET", "/auth/me", auth_required=True, state=state)
+    return check_auth_me(response, state)
+
+def test_invalid_token():
+    """Test invalid token handling"""
+    print_header("Invalid Token Handling")
+    
+    # Test with invalid token
+    headers = {"Authorization": "Bearer invalid_token_123"}
+    response = make_request("GET", "/auth/me", headers=headers)
+    return check_invalid_token(response)
+
+def test_career_assessment(state=None):
+    """Test career assessment submission"""
+    state = state or default_state
+    print_header("Career Assessment API")
     
-    if response is None:
-        log_test("Jobs API", "FAIL", "Request failed")
+    if not require_token("Career Assessment", state):
         return False
     
-    if response.status_code == 200:
-        try:
-            data = response.json()
-            if "jobs" in data and len(data["jobs"]) > 0:
-                job = data["jobs"][0]
-                required_fields = ["id", "title", "company", "location", "salary", "skills"]
-                missing_fields = [field for field in required_fields if field not in job]
-                
-                if not missing_fields:
-                    log_test("Jobs API", "PASS", f"Found {len(data['jobs'])} jobs with complete data")
-                    return True
-                else:
-                    log_test("Jobs API", "FAIL", f"Job missing fields: {missing_fields}")
-                    return False
-            else:
-                log_test("Jobs API", "FAIL", "No jobs found in response")
-                return False
-        except json.JSONDecodeError:
-            log_test("Jobs API", "FAIL", "Invalid JSON response")
-            return False
-    else:
-        log_test("Jobs API", "FAIL", f"Status: {response.status_code}, Response: {response.text}")
+    response = make_request("POST", "/assessment/submit", ASSESSMENT_DATA, auth_required=True, state=state)
+    return check_career_assessment(response)
+
+def test_dashboard_api(state=None):
+    """Test personalized dashboard API"""
+    state = state or default_state
+    print_header("Personalized Dashboard API")
+    
+    if not require_token("Dashboard API", state):
         return False
+    
+    response = make_request("GET", "/dashboard", auth_required=True, state=state)
+    return check_dashboard(response)
 
-def test_courses_api():
-    """Test courses listing API"""
-    print("=" * 60)
-    print("TESTING: Courses API")
-    print("=" * 60)
+def test_dashboard_cache(state=None):
+    """Hammer the dashboard, then check a new assessment invalidates the cached recommendations"""
+    state = state or default_state
+    print_header("Dashboard Recommendation Cache")
     
-    if not auth_token:
-        log_test("Courses API", "FAIL", "No auth token available")
+    if not require_token("Dashboard Cache", state):
         return False
     
-    response = make_request("GET", "/courses", auth_required=True)
+    # Resubmitting invalidates the cache, so the first read is a miss to compare hits against
+    make_request("POST", "/assessment/submit", ASSESSMENT_DATA, auth_required=True, state=state)
+    samples = []
+    for _ in range(DASHBOARD_CACHE_PROBES):
+        start = time.perf_counter()
+        response = make_request("GET", "/dashboard", auth_required=True, state=state)
+        samples.append((response, (time.perf_counter() - start) * 1000))
+    if not check_dashboard_cache_hits(samples):
+        return False
     
-    if response is None:
-        log_test("Courses API", "FAIL", "Request failed")
+    submit_response = make_request("POST", "/assessment/submit", ALT_ASSESSMENT_DATA, auth_required=True, state=state)
+    response = make_request("GET", "/dashboard", auth_required=True, state=state)
+    fresh = check_dashboard_freshness(submit_response, response)
+    log_cache_stats(make_request("GET", "/cache/stats"))
+    return fresh
+
+def test_sparse_fields(state=None):
+    """Test ?fields= projections on the dashboard and jobs listing"""
+    state = state or default_state
+    print_header("Sparse Fieldsets")
+    
+    if not require_token("Sparse Fieldsets", state):
         return False
     
-    if response.status_code == 200:
-        try:
-            data = response.json()
-            if "courses" in data and len(data["courses"]) > 0:
-                course = data["courses"][0]
-                required_fields = ["id", "title", "provider", "description", "duration", "skills"]
-                missing_fields = [field for field in required_fields if field not in course]
-                
-                if not missing_fields:
-                    # Check for different providers
-                    providers = set(c["provider"] for c in data["courses"])
-                    expected_providers = {"IBM SkillsBuild", "Coursera", "NSDC"}
-                    
-                    if expected_providers.intersection(providers):
-                        log_test("Courses API", "PASS", f"Found {len(data['courses'])} courses from providers: {list(providers)}")
-                        return True
-                    else:
-                        log_test("Courses API", "WARN", f"Unexpected providers: {list(providers)}")
-                        return True
-                else:
-                    log_test("Courses API", "FAIL", f"Course missing fields: {missing_fields}")
-                    return False
-            else:
-                log_test("Courses API", "FAIL", "No courses found in response")
-                return False
-        except json.JSONDecodeError:
-            log_test("Courses API", "FAIL", "Invalid JSON response")
+    dashboard_response = make_request("GET", f"/dashboard?fields={','.join(DASHBOARD_FIELDS)}",
+                                      auth_required=True, state=state)
+    jobs_response = make_request("GET", "/jobs?fields=title", auth_required=True, state=state)
+    return check_sparse_fields(dashboard_response, jobs_response)
+
+def test_ai_chatbot(state=None):
+    """Test AI chatbot API"""
+    state = state or default_state
+    
+    print_header("AI Chatbot API")
+    
+    if not require_token("AI Chatbot", state):
+        return False
+    
+    # Test different types of questions
+    for i, test_case in enumerate(CHAT_TEST_MESSAGES):
+        response = make_request("POST", "/chat", chat_request_data(test_case, state), auth_required=True, state=state)
+        if not check_chat_message(i, test_case, response, state):
             return False
-    else:
-        log_test("Courses API", "FAIL", f"Status: {response.status_code}, Response: {response.text}")
+    
+    log_test("AI Chatbot Overall", "PASS", "Chat functionality working with mock responses")
+    return True
+
+def stream_chat_message(message, state):
+    """Send one streamed chat message; returns (response, events)"""
+    data = {"message": message, "language": "en", "sessionId": state.session_id, "stream": True}
+    started = time.perf_counter()
+    response = make_request("POST", "/chat", data, auth_required=True, state=state, stream=True)
+    if response is None or response.status_code != 200:
+        return response, []
+    events = read_chat_stream(response, started)
+    if events and events[0][0] == "session":
+        state.session_id = events[0][1].get("sessionId", state.session_id)
+    return response, events
+
+def test_streaming_chat(state=None):
+    """Test streamed chat replies (server-sent events)"""
+    state = state or default_state
+    print_header("Streaming Chat API")
+    
+    if not require_token("Streaming Chat", state):
         return False
+    
+    response, events = stream_chat_message(CHAT_TEST_MESSAGES[0]["message"], state)
+    return check_streaming_chat(response, events)
 
-def test_job_application():
+def test_jobs_api(state=None):
+    """Test jobs listing API"""
+    state = state or default_state
+    print_header("Jobs API")
+    
+    if not require_token("Jobs API", state):
+        return False
+    
+    response = make_request("GET", "/jobs", auth_required=True, state=state)
+    return check_jobs(response)
+
+def test_courses_api(state=None):
+    """Test courses listing API"""
+    state = state or default_state
+    print_header("Courses API")
+    
+    if not require_token("Courses API", state):
+        return False
+    
+    response = make_request("GET", "/courses", auth_required=True, state=state)
+    return check_courses(response)
+
+def test_job_application(state=None):
     """Test job application API"""
-    print("=" * 60)
-    print("TESTING: Job Application API")
-    print("=" * 60)
+    state = state or default_state
+    print_header("Job Application API")
     
-    if not auth_token:
-        log_test("Job Application", "FAIL", "No auth token available")
+    if not require_token("Job Application", state):
         return False
     
     # First get a job ID
-    jobs_response = make_request("GET", "/jobs", auth_required=True)
-    if jobs_response and jobs_response.status_code == 200:
-        jobs_data = jobs_response.json()
-        if "jobs" in jobs_data and len(jobs_data["jobs"]) > 0:
-            job_id = jobs_data["jobs"][0]["id"]
-            
-            # Apply to the job
-            application_data = {"jobId": job_id}
-            response = make_request("POST", "/apply", application_data, auth_required=True)
-            
-            if response is None:
-                log_test("Job Application", "FAIL", "Request failed")
-                return False
-            
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    if "success" in data and data["success"]:
-                        log_test("Job Application", "PASS", "Successfully applied to job")
-                        return True
-                    else:
-                        log_test("Job Application", "FAIL", f"Application failed: {data}")
-                        return False
-                except json.JSONDecodeError:
-                    log_test("Job Application", "FAIL", "Invalid JSON response")
-                    return False
-            else:
-                log_test("Job Application", "FAIL", f"Status: {response.status_code}, Response: {response.text}")
-                return False
-        else:
-            log_test("Job Application", "FAIL", "No jobs available to apply to")
-            return False
-    else:
-        log_test("Job Application", "FAIL", "Could not fetch jobs for application test")
+    jobs_response = make_request("GET", "/jobs", auth_required=True, state=state)
+    job_id = first_job_id(jobs_response)
+    if job_id is None:
         return False
+    
+    # Apply to the job
+    application_data = {"jobId": job_id}
+    response = make_request("POST", "/apply", application_data, auth_required=True, state=state)
+    return check_job_application(response)
 
 def test_authentication_required_endpoints():
     """Test that protected endpoints require authentication"""
-    print("=" * 60)
-    print("TESTING: Authentication Required Endpoints")
-    print("=" * 60)
-    
-    protected_endpoints = [
-        ("GET", "/auth/me"),
-        ("POST", "/assessment/submit"),
-        ("GET", "/dashboard"),
-        ("POST", "/chat"),
-        ("GET", "/jobs"),
-        ("GET", "/courses"),
-        ("POST", "/apply")
-    ]
+    print_header("Authentication Required Endpoints")
     
     all_protected = True
     
-    for method, endpoint in protected_endpoints:
-        response = make_request(method, endpoint, {"test": "data"} if method == "POST" else None)
-        
-        if response is None:
-            log_test(f"Auth Required {endpoint}", "FAIL", "Request failed")
-            all_protected = False
-            continue
-        
-        if response.status_code == 401:
-            log_test(f"Auth Required {endpoint}", "PASS", "Correctly requires authentication")
-        else:
-            log_test(f"Auth Required {endpoint}", "FAIL", f"Expected 401, got {response.status_code}")
+    # The probes are independent: send them together, then check them in order
+    with ThreadPoolExecutor(max_workers=len(PROTECTED_ENDPOINTS)) as pool:
+        responses = list(pool.map(
+            lambda probe: make_request(probe[0], probe[1], {"test": "data"} if probe[0] == "POST" else None),
+            PROTECTED_ENDPOINTS))
+    for (method, endpoint), response in zip(PROTECTED_ENDPOINTS, responses):
+        if not check_auth_required(endpoint, response):
             all_protected = False
     
     return all_protected
 
-def run_all_tests():
-    """Run all backend tests"""
+# The functional suite as a dependency graph: (name, test, names of the tests it
+# needs). Every test gets the run's UserState explicitly; tests that change what
+# others read (Dashboard Cache resubmits the assessment) depend on those readers.
+FUNCTIONAL_SUITE = [
+    ("Root Endpoint", lambda state: test_root_endpoint(), ()),
+    ("User Registration", test_user_registration, ()),
+    ("Duplicate Email Handling", test_duplicate_registration, ("User Registration",)),
+    ("Auth Token Validation", test_auth_me_endpoint, ("User Registration",)),
+    ("Invalid Token Handling", lambda state: test_invalid_token(), ()),
+    ("Career Assessment", test_career_assessment, ("User Registration",)),
+    ("Dashboard API", test_dashboard_api, ("Career Assessment",)),
+    ("Sparse Fieldsets", test_sparse_fields, ("Career Assessment",)),
+    ("Dashboard Cache", test_dashboard_cache, ("Dashboard API", "Sparse Fieldsets")),
+    ("AI Chatbot", test_ai_chatbot, ("User Registration",)),
+    # Continues the chat session AI Chatbot opened
+    ("Streaming Chat", test_streaming_chat, ("AI Chatbot",)),
+    ("Jobs API", test_jobs_api, ("User Registration",)),
+    ("Courses API", test_courses_api, ("User Registration",)),
+    ("Job Application", test_job_application, ("User Registration",)),
+    ("Authentication Protection", lambda state: test_authentication_required_endpoints(), ()),
+]
+
+class ThreadOutput:
+    """sys.stdout stand-in that holds back each capturing thread's output, so parallel tests print whole"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, "buffer", None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def capture(self, fn, *args):
+        """Call fn(*args) with this thread's output buffered; returns (result, output)"""
+        self.local.buffer = io.StringIO()
+        try:
+            return fn(*args), self.local.buffer.getvalue()
+        finally:
+            self.local.buffer = None
+
+def run_test_graph(suite, state, workers=FUNCTIONAL_WORKERS):
+    """Run suite entries once their dependencies passed, up to workers at a time
+
+    Returns {name: (passed, seconds)}. A test whose dependency failed is not
+    run and counts as failed.
+    """
+    names = {name for name, _, _ in suite}
+    for name, _, dependencies in suite:
+        unknown = set(dependencies) - names
+        if unknown:
+            raise ValueError(f"{name} depends on unknown tests: {', '.join(sorted(unknown))}")
+    
+    def timed(test):
+        start = time.perf_counter()
+        passed = bool(test(state))
+        return passed, time.perf_counter() - start
+    
+    results, running = {}, {}
+    output = ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while True:
+                # Skipping a test can make others skippable, so repeat until nothing changes
+                changed = True
+                while changed:
+                    changed = False
+                    for name, test, dependencies in suite:
+                        if name in results or name in running.values():
+                            continue
+                        if any(dependency in results and not results[dependency][0] for dependency in dependencies):
+                            log_test(name, "FAIL", "Skipped: a test it depends on failed")
+                            results[name] = (False, 0.0)
+                            changed = True
+                        elif all(dependency in results for dependency in dependencies):
+                            running[pool.submit(output.capture, timed, test)] = name
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    results[name], text = future.result()
+                    output.stream.write(text)
+    finally:
+        sys.stdout = output.stream
+    
+    stuck = names - set(results)
+    if stuck:
+        raise ValueError(f"Dependency cycle between: {', '.join(sorted(stuck))}")
+    return results
+
+def run_all_tests(workers=FUNCTIONAL_WORKERS):
+    """Run all backend tests, independent ones in parallel"""
     print("🚀 Starting EmpowerYouth Backend API Tests")
     print("=" * 80)
+    print(f"Workers: {workers}")
+    
+    state = UserState(TEST_USER_DATA)
+    start = time.perf_counter()
+    results = run_test_graph(FUNCTIONAL_SUITE, state, workers)
+    elapsed = time.perf_counter() - start
+    test_results = [(name, results[name][0]) for name, _, _ in FUNCTIONAL_SUITE]
     
-    test_results = []
-    
-    # High Priority Tests
-    print("\n🔥 HIGH PRIORITY TESTS")
-    test_results.append(("Root Endpoint", test_root_endpoint()))
-    test_results.append(("User Registration", test_user_registration()))
-    test_results.append(("Duplicate Email Handling", test_duplicate_registration()))
-    test_results.append(("Auth Token Validation", test_auth_me_endpoint()))
-    test_results.append(("Invalid Token Handling", test_invalid_token()))
-    test_results.append(("Career Assessment", test_career_assessment()))
-    test_results.append(("Dashboard API", test_dashboard_api()))
-    
-    # Medium Priority Tests
-    print("\n⚡ MEDIUM PRIORITY TESTS")
-    test_results.append(("AI Chatbot", test_ai_chatbot()))
-    test_results.append(("Jobs API", test_jobs_api()))
-    test_results.append(("Courses API", test_courses_api()))
-    test_results.append(("Job Application", test_job_application()))
-    test_results.append(("Authentication Protection", test_authentication_required_endpoints()))
-    
-    # Summary
+    print_summary(test_results)
+    print(f"⏱️  Suite took {elapsed:.2f}s on {workers} worker(s); "
+          f"the tests add up to {sum(seconds for _, seconds in results.values()):.2f}s")
+    print_latency_summary()
+    
+    stats = get_client().connection_stats()
+    print(f"🔌 Connections: {stats['opened']} opened, {stats['reused']} reused "
+          f"over {stats['requests']} requests")
+    
+    return test_results
+
+def print_summary(test_results):
+    """Print the pass/fail summary of a functional run"""
     print("\n" + "=" * 80)
     print("📊 TEST SUMMARY")
     print("=" * 80)
@@ -620,8 +1618,1973 @@ def run_all_tests():
         print("⚠️  Most tests passed. Minor issues detected.")
     else:
         print("🚨 Multiple test failures. Backend needs attention.")
+
+def print_latency_summary():
+    """Print per-endpoint latency percentiles, throughput and error rate"""
+    rows = metrics.snapshot()
+    if not rows:
+        return
+    print("\n" + "=" * 80)
+    print("⏱️  LATENCY SUMMARY (ms)")
+    print("=" * 80)
+    print(f"{'Endpoint':<26}{'Count':>7}{'RPS':>8}{'Mean':>8}{'p50':>8}"
+          f"{'p95':>8}{'p99':>8}{'Max':>8}{'Err%':>7}")
+    for key, row in rows.items():
+        print(f"{key:<26}{row['count']:>7}{row['rps']:>8.1f}{row['mean_ms']:>8.1f}"
+              f"{row['p50_ms']:>8.1f}{row['p95_ms']:>8.1f}{row['p99_ms']:>8.1f}"
+              f"{row['max_ms']:>8.1f}{row['error_rate'] * 100:>6.1f}%")
+    print_transfer_summary(rows)
+    print_phase_summary(rows)
+    print_schema_summary()
+
+def print_schema_summary():
+    if not schema_checks.validated:
+        return
+    sampled = "every response" if schema_checks.every == 1 else f"1 in {schema_checks.every}"
+    failed = sum(count for count, _ in schema_checks.failures.values())
+    print(f"🧾 Schema checks: {schema_checks.validated} responses validated ({sampled}), {failed} failed"
+          f"{'' if orjson is None else ', decoded with orjson'}")
+    for key, (count, first) in sorted(schema_checks.failures.items()):
+        print(f"   {key}: {count} failed, e.g. {first}")
+
+def print_transfer_summary(rows):
+    """Print mean bytes on the wire vs. decoded, and decompression time per endpoint"""
+    rows = {key: row["transfer"] for key, row in rows.items() if "transfer" in row}
+    if not rows:
+        return
+    print("\n" + "=" * 80)
+    print("📦 TRANSFER SUMMARY")
+    print("=" * 80)
+    print(f"{'Endpoint':<26}{'Wire KiB':>10}{'Body KiB':>10}{'Ratio':>8}{'Decode p50':>12}{'p95 ms':>9}")
+    for key, row in rows.items():
+        ratio = row["wire_bytes_mean"] / row["body_bytes_mean"] if row["body_bytes_mean"] else 1.0
+        print(f"{key:<26}{row['wire_bytes_mean'] / 1024:>10.2f}{row['body_bytes_mean'] / 1024:>10.2f}"
+              f"{ratio:>8.2f}{row['decode_p50_ms']:>12.3f}{row['decode_p95_ms']:>9.3f}")
+
+def print_phase_summary(rows):
+    """Print where time goes per endpoint, from the server's Server-Timing headers"""
+    rows = {key: row["phases"] for key, row in rows.items() if "phases" in row}
+    if not rows:
+        return
+    print("\n" + "=" * 80)
+    print("🧩 PHASE BREAKDOWN (Server-Timing)")
+    print("=" * 80)
+    header = "".join(f"{label:>10}" for label in PHASES.values())
+    for title, column, fmt in (("Share of latency", "share", lambda v: f"{v * 100:>9.1f}%"),
+                               ("p50 (ms)", "p50_ms", lambda v: f"{v:>10.2f}"),
+                               ("p95 (ms)", "p95_ms", lambda v: f"{v:>10.2f}"),
+                               ("p99 (ms)", "p99_ms", lambda v: f"{v:>10.2f}")):
+        print(f"\n{title:<26}{header}")
+        for key, phases in rows.items():
+            cells = "".join(fmt(phases[name][column]) if name in phases else f"{'-':>10}" for name in PHASES)
+            print(f"{key:<26}{cells}")
+
+# Steps a virtual user replays in load mode
+USER_JOURNEY = [
+    ("User Registration", test_user_registration),
+    ("Career Assessment", test_career_assessment),
+    ("Dashboard API", test_dashboard_api),
+    ("AI Chatbot", test_ai_chatbot),
+    ("Jobs API", test_jobs_api),
+    ("Courses API", test_courses_api),
+    ("Job Application", test_job_application),
+]
+
+def run_user_journey(state):
+    """Run the journey for one user; registration is skipped once the user has a token"""
+    results = []
+    for name, test in USER_JOURNEY:
+        if test is test_user_registration and state.auth_token:
+            continue
+        results.append((name, run_check(test, state)))
+    return results
+
+class LoadResults:
+    """Thread-safe pass/fail counters per journey step"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.journeys = 0
+        self.steps = {}
+
+    def record(self, journey_results):
+        with self.lock:
+            self.journeys += 1
+            for name, passed in journey_results:
+                counts = self.steps.setdefault(name, [0, 0])
+                counts[0 if passed else 1] += 1
+
+def drive_virtual_users(users, concurrency, duration=0):
+    """Replay the journey for N virtual users on C threads; returns (results, elapsed)"""
+    global VERBOSE
+    results = LoadResults()
+    pending = list(range(users))
+    # Cached users already hold a token, so their journeys skip registration
+    states = take_cached_users(users)
+    states += [UserState() for _ in range(users - len(states))]
+    pending_lock = threading.Lock()
+    start = time.monotonic()
+    deadline = start + duration if duration else None
     
-    return test_results
+    def worker():
+        # Virtual users are served round-robin so every one of them gets
+        # iterations even when concurrency < users
+        while True:
+            with pending_lock:
+                if not pending:
+                    return
+                vu = pending.pop(0)
+            results.record(run_user_journey(states[vu]))
+            if deadline is not None and time.monotonic() < deadline:
+                with pending_lock:
+                    pending.append(vu)
+    
+    VERBOSE = False
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for future in [pool.submit(worker) for _ in range(concurrency)]:
+                future.result()
+    finally:
+        VERBOSE = True
+    return results, time.monotonic() - start
+
+def run_load_test(users, concurrency=None, duration=0):
+    """Replay the user journey with N virtual users, C at a time, optionally for S seconds"""
+    concurrency = concurrency or users
+    
+    print("🚀 Starting EmpowerYouth Load Test")
+    print("=" * 80)
+    print(f"Virtual users: {users}, concurrency: {concurrency}, "
+          f"duration: {f'{duration}s' if duration else 'single pass'}")
+    
+    results, elapsed = drive_virtual_users(users, concurrency, duration)
+    
+    print_load_summary(results, elapsed)
+    print_latency_summary()
+    
+    stats = get_client().connection_stats()
+    print(f"🔌 Connections: {stats['opened']} opened, {stats['reused']} reused "
+          f"over {stats['requests']} requests")
+    
+    return results
+
+# Multi-process load: each worker process drives its share of the virtual
+# users and ships back histogram buckets, which merge cheaply in the parent
+
+def split_evenly(total, parts):
+    return [total // parts + (1 if i < total % parts else 0) for i in range(parts)]
+
+def load_worker(client_options, users, concurrency, duration, cache_entries=(), event_log_options=None,
+                validate_every=VALIDATE_EVERY):
+    """Entry point of a load worker process; returns its results in compact form"""
+    configure_client(**client_options)
+    schema_checks.every = validate_every
+    cached_users[:] = [UserState.from_cache(entry) for entry in cache_entries]
+    if event_log_options:
+        # One set of files per worker: events.jsonl becomes events-<pid>-0001.jsonl, ...
+        path, max_mb = event_log_options
+        root, ext = os.path.splitext(path)
+        start_event_log(f"{root}-{os.getpid()}{ext}", max_mb)
+    try:
+        results, elapsed = drive_virtual_users(users, concurrency, duration)
+        return {
+            "journeys": results.journeys,
+            "steps": results.steps,
+            "elapsed": elapsed,
+            "metrics": metrics.to_state(),
+            "schemas": schema_checks.to_state(),
+            "connections": get_client().connection_stats(),
+        }
+    finally:
+        api_client.close()
+        stop_event_log()
+
+def run_multiprocess_load_test(processes, client_options, users, concurrency=None, duration=0,
+                               event_log_options=None):
+    """Spread the load test over K worker processes and merge their reports"""
+    concurrency = concurrency or users
+    processes = max(1, min(processes, users))
+    
+    print("🚀 Starting EmpowerYouth Load Test")
+    print("=" * 80)
+    print(f"Virtual users: {users}, concurrency: {concurrency}, processes: {processes}, "
+          f"duration: {f'{duration}s' if duration else 'single pass'}")
+    
+    shares = zip(split_evenly(users, processes), split_evenly(concurrency, processes))
+    start = time.monotonic()
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [pool.submit(load_worker, client_options, n, max(c, 1), duration,
+                               [state.to_cache() for state in take_cached_users(n)], event_log_options,
+                               schema_checks.every)
+                   for n, c in shares]
+        reports = [future.result() for future in futures]
+    elapsed = time.monotonic() - start
+    
+    merge_start = time.perf_counter()
+    results = LoadResults()
+    connections = {"requests": 0, "opened": 0, "reused": 0}
+    metrics.reset()
+    for report in reports:
+        results.journeys += report["journeys"]
+        for name, (passed, failed) in report["steps"].items():
+            counts = results.steps.setdefault(name, [0, 0])
+            counts[0] += passed
+            counts[1] += failed
+        metrics.merge_state(report["metrics"])
+        schema_checks.merge_state(report["schemas"])
+        for key in connections:
+            connections[key] += report["connections"][key]
+    merge_ms = (time.perf_counter() - merge_start) * 1000
+    payload = sum(len(json.dumps(report)) for report in reports)
+    
+    print_load_summary(results, elapsed)
+    print_latency_summary()
+    print(f"🔌 Connections: {connections['opened']} opened, {connections['reused']} reused "
+          f"over {connections['requests']} requests")
+    print(f"🧩 Merged {processes} worker reports ({payload / 1024:.1f} KiB) in {merge_ms:.2f} ms")
+    return results
+
+def print_load_summary(results, elapsed, unit="Journeys"):
+    """Print journey throughput and per-step pass/fail counts of a load run"""
+    print("\n" + "=" * 80)
+    print("📊 LOAD TEST SUMMARY")
+    print("=" * 80)
+    print(f"{unit} completed: {results.journeys} in {elapsed:.1f}s "
+          f"({results.journeys / elapsed:.2f} {unit.lower()}/s)")
+    for name, (passed, failed) in results.steps.items():
+        status = "✅" if not failed else "❌"
+        print(f"{status} {name}: {passed} passed, {failed} failed")
+
+# Bulk seeding: register and assess many users up front and cache their
+# tokens, so later runs can skip registration until the tokens expire
+
+def token_expiry(token):
+    """Expiry (epoch seconds) from a JWT payload, without verifying it; None if absent"""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError):
+        return None
+    return claims.get("exp")
+
+def read_token_cache(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def load_token_cache(path, base_url):
+    """Cached users for base_url whose tokens are not about to expire"""
+    cutoff = time.time() + TOKEN_EXPIRY_MARGIN
+    entries = read_token_cache(path).get(base_url, {}).values()
+    return [UserState.from_cache(entry) for entry in entries
+            if entry.get("exp") is None or entry["exp"] > cutoff]
+
+def save_token_cache(path, base_url, states):
+    """Add users to the cache (keyed by email) and drop expired entries"""
+    cache = read_token_cache(path)
+    users = cache.setdefault(base_url, {})
+    for state in states:
+        users[state.user_data["email"]] = dict(state.to_cache(), exp=token_expiry(state.auth_token))
+    now = time.time()
+    cache[base_url] = {email: entry for email, entry in users.items()
+                       if entry.get("exp") is None or entry["exp"] > now}
+    with open(path, "w") as f:
+        json.dump(cache, f)
+    return len(cache[base_url])
+
+def seed_users(count, concurrency, cache_path, base_url):
+    """Register and assess users in parallel with varied answers, then cache their tokens"""
+    global VERBOSE
+    print("🌱 Seeding EmpowerYouth users")
+    print("=" * 80)
+    print(f"Users: {count}, concurrency: {concurrency}, cache: {cache_path}")
+    
+    states = [UserState() for _ in range(count)]
+    done = [0]
+    done_lock = threading.Lock()
+    step = max(count // 10, 1)
+    
+    def seed(index):
+        state = states[index]
+        rng = random.Random(index)
+        if test_user_registration(state):
+            make_request("POST", "/assessment/submit", payload_random_assessment(state, rng),
+                         auth_required=True, state=state)
+        with done_lock:
+            done[0] += 1
+            if done[0] % step == 0:
+                print(f"   {done[0]}/{count} users seeded")
+    
+    VERBOSE = False
+    start = time.monotonic()
+    try:
+        with ThreadPoolExecutor(max_workers=min(concurrency, count)) as pool:
+            list(pool.map(seed, range(count)))
+    finally:
+        VERBOSE = True
+    elapsed = time.monotonic() - start
+    
+    seeded = [state for state in states if state.auth_token]
+    total = save_token_cache(cache_path, base_url, seeded)
+    print(f"\n✅ Seeded {len(seeded)}/{count} users in {elapsed:.1f}s ({len(seeded) / elapsed:.1f} users/s)")
+    print(f"💾 Token cache now holds {total} users for {base_url}")
+    return seeded
+
+# Streaming chat benchmark: many concurrent chat sessions, each streaming
+# every prompt, timed to first byte, first chunk, between chunks and to done
+
+class StreamTimings:
+    """Thread-safe histograms of streamed chat timings"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.first_byte = LatencyHistogram()
+        self.first_chunk = LatencyHistogram()
+        self.gaps = LatencyHistogram()
+        self.total = LatencyHistogram()
+        self.sessions = LatencyHistogram()
+        self.failures = 0
+
+    def record(self, events):
+        chunk_times = [t for name, _, t in events if name == "chunk"]
+        with self.lock:
+            if not chunk_times or events[-1][0] != "done":
+                self.failures += 1
+                return
+            self.first_byte.record(events[0][2] * 1000)
+            self.first_chunk.record(chunk_times[0] * 1000)
+            for earlier, later in zip(chunk_times, chunk_times[1:]):
+                self.gaps.record((later - earlier) * 1000)
+            self.total.record(events[-1][2] * 1000)
+
+def run_chat_stream_benchmark(sessions, concurrency):
+    """Stream all chat prompts in many concurrent sessions and report stream timings"""
+    global VERBOSE
+    print("🚀 Starting EmpowerYouth Streaming Chat Benchmark")
+    print("=" * 80)
+    print(f"Sessions: {sessions}, concurrency: {concurrency}, "
+          f"messages per session: {len(CHAT_TEST_MESSAGES)}")
+    
+    states = prepare_users(sessions)
+    if not states:
+        print("🚨 Could not register any users for the streaming benchmark")
+        return None
+    metrics.reset()
+    timings = StreamTimings()
+    
+    def session(state):
+        state.session_id = None
+        started = time.perf_counter()
+        for test_case in CHAT_TEST_MESSAGES:
+            _, events = stream_chat_message(test_case["message"], state)
+            timings.record(events)
+        with timings.lock:
+            timings.sessions.record((time.perf_counter() - started) * 1000)
+    
+    VERBOSE = False
+    start = time.monotonic()
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(session, states))
+    finally:
+        VERBOSE = True
+    elapsed = time.monotonic() - start
+    
+    print("\n" + "=" * 80)
+    print("📡 STREAMING CHAT SUMMARY (ms)")
+    print("=" * 80)
+    print(f"Sessions: {len(states)} in {elapsed:.1f}s, streams: {timings.total.count}, "
+          f"failed streams: {timings.failures}")
+    print(f"{'Timing':<26}{'Count':>7}{'Mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'Max':>9}")
+    for label, hist in (("Time to first byte", timings.first_byte),
+                        ("Time to first chunk", timings.first_chunk),
+                        ("Inter-chunk gap", timings.gaps),
+                        ("Total per message", timings.total),
+                        ("Total per session", timings.sessions)):
+        print(f"{label:<26}{hist.count:>7}{hist.mean():>9.1f}{hist.percentile(50):>9.1f}"
+              f"{hist.percentile(95):>9.1f}{hist.percentile(99):>9.1f}{hist.max:>9.1f}")
+    print_latency_summary()
+    return timings
+
+# Catalog benchmark: grow the job/course catalogs, then walk every page with the
+# cursor to see whether page latency and size stay flat at depth
+
+# (catalog, walk name, filters) walked by the catalog benchmark
+CATALOG_WALKS = [
+    ("jobs", "all", {}),
+    ("jobs", "remote", {"remote": "true"}),
+    ("jobs", "location+skills", {"location": "Pune", "skills": "Python,SQL"}),
+    ("courses", "all", {}),
+    ("courses", "skills", {"skills": "Python"}),
+]
+
+def depth_bucket(page):
+    """Label for a page number: 1, 2-10, 11-100, 101-1000, ..."""
+    if page == 1:
+        return "1"
+    upper = 10
+    while page > upper:
+        upper *= 10
+    return f"{upper // 10 + 1}-{upper}"
+
+def walk_catalog(name, filters, page_size, state):
+    """Fetch every page of a catalog listing; returns [(page, ms, wire bytes, body bytes)] and the item count"""
+    pages, items, cursor = [], 0, None
+    while True:
+        params = dict(filters, limit=page_size, **({"cursor": cursor} if cursor else {}))
+        start = time.perf_counter()
+        response = make_request("GET", f"/{name}?{urlencode(params)}", auth_required=True, state=state)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if response is None or response.status_code != 200:
+            print(f"🚨 /{name} page {len(pages) + 1} failed: "
+                  f"{response.status_code if response is not None else 'no response'}")
+            break
+        data = json_body(response)
+        pages.append((len(pages) + 1, elapsed_ms, response.wire_bytes, len(response.content)))
+        items += len(data.get(name, []))
+        cursor = data.get("nextCursor")
+        if not cursor:
+            break
+    return pages, items
+
+def run_catalog_benchmark(jobs, courses, page_size=CATALOG_PAGE_SIZE):
+    """Seed large catalogs, then report page latency and payload size by page depth"""
+    global VERBOSE
+    print("🚀 Starting EmpowerYouth Catalog Benchmark")
+    print("=" * 80)
+    print(f"Target catalog: {jobs} jobs, {courses} courses, page size: {page_size}")
+    
+    states = prepare_users(1)
+    if not states:
+        print("🚨 Could not register a user for the catalog benchmark")
+        return None
+    state = states[0]
+    
+    start = time.monotonic()
+    response = make_request("POST", "/catalog/seed", {"jobs": jobs, "courses": courses},
+                            auth_required=True, state=state)
+    if response is None or response.status_code != 200:
+        print(f"🚨 Catalog seeding failed: {response.text if response is not None else 'no response'}")
+        print("   The API only accepts /catalog/seed when CATALOG_SEED_ENABLED=true")
+        return None
+    sizes = json_body(response)
+    print(f"Catalog holds {sizes['jobs']} jobs, {sizes['courses']} courses "
+          f"(seeded in {time.monotonic() - start:.1f}s)")
+    metrics.reset()
+    
+    VERBOSE = False
+    try:
+        walks = [(name, walk, *walk_catalog(name, filters, page_size, state))
+                 for name, walk, filters in CATALOG_WALKS]
+    finally:
+        VERBOSE = True
+    
+    print("\n" + "=" * 80)
+    print("📚 CATALOG PAGINATION SUMMARY")
+    print("=" * 80)
+    print(f"{'Walk':<30}{'Pages':>7}{'Depth':>11}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'Wire KiB':>10}{'Body KiB':>10}")
+    for name, walk, pages, items in walks:
+        label = f"{name} {walk} ({items})"
+        buckets = {}
+        for page, ms, wire, body in pages:
+            buckets.setdefault(depth_bucket(page), []).append((ms, wire, body))
+        for depth, samples in buckets.items():
+            hist = LatencyHistogram()
+            for ms, _, _ in samples:
+                hist.record(ms)
+            wire_kib = sum(wire for _, wire, _ in samples) / len(samples) / 1024
+            body_kib = sum(body for _, _, body in samples) / len(samples) / 1024
+            print(f"{label:<30}{len(samples):>7}{depth:>11}{hist.percentile(50):>9.1f}"
+                  f"{hist.percentile(95):>9.1f}{hist.percentile(99):>9.1f}{wire_kib:>10.1f}{body_kib:>10.1f}")
+            label = ""
+    print_latency_summary()
+    return walks
+
+# Write burst: fire many chat messages at once, then read every session's history
+# back to check each acknowledged message was persisted. With write buffering the
+# API may answer before the batch is written, so the check polls for a while.
+
+def persisted_messages(state):
+    """Number of stored messages in the state's chat session, or None if the lookup failed"""
+    query = urlencode({"sessionId": state.session_id, "limit": 0})
+    response = make_request("GET", f"/chat/history?{query}", auth_required=True, state=state)
+    if response is None or response.status_code != 200:
+        return None
+    return json_body(response).get("count")
+
+def run_write_burst(messages, users=WRITE_BURST_USERS, concurrency=WRITE_BURST_CONCURRENCY,
+                    verify_timeout=WRITE_VERIFY_TIMEOUT):
+    """Send messages concurrent chat writes; returns True when every acknowledged one was persisted"""
+    global VERBOSE
+    print("🚀 Starting EmpowerYouth Write Burst Test")
+    print("=" * 80)
+    print(f"Messages: {messages}, users: {users}, concurrency: {concurrency}")
+    
+    states = prepare_users(users)
+    if not states:
+        print("🚨 Could not register any users for the write burst")
+        return False
+    for state in states:
+        state.session_id = str(uuid.uuid4())
+    metrics.reset()
+    lock = threading.Lock()
+    acknowledged = [0] * len(states)
+    
+    def send(i):
+        slot = i % len(states)
+        data = {"message": CHAT_TEST_MESSAGES[i % len(CHAT_TEST_MESSAGES)]["message"],
+                "sessionId": states[slot].session_id}
+        response = make_request("POST", "/chat", data, auth_required=True, state=states[slot])
+        if response is not None and response.status_code == 200:
+            with lock:
+                acknowledged[slot] += 1
+    
+    VERBOSE = False
+    try:
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(send, range(messages)))
+        burst_end = time.monotonic()
+        
+        persisted = [None] * len(states)
+        deadline = burst_end + verify_timeout
+        while True:
+            for slot, state in enumerate(states):
+                if persisted[slot] is None or persisted[slot] < acknowledged[slot]:
+                    persisted[slot] = persisted_messages(state)
+            settled = time.monotonic()
+            if all(p is not None and p >= a for p, a in zip(persisted, acknowledged)) or settled > deadline:
+                break
+            time.sleep(0.1)
+        stats_response = make_request("GET", "/writes/stats")
+    finally:
+        VERBOSE = True
+    
+    sent, acked = messages, sum(acknowledged)
+    stored = sum(p or 0 for p in persisted)
+    missing = sum(max(a - (p or 0), 0) for p, a in zip(persisted, acknowledged))
+    burst_elapsed = burst_end - start
+    
+    print("\n" + "=" * 80)
+    print("✍️  WRITE BURST SUMMARY")
+    print("=" * 80)
+    print(f"Sent: {sent}, acknowledged: {acked}, failed: {sent - acked}")
+    print(f"Burst took {burst_elapsed:.2f}s ({acked / burst_elapsed:,.0f} acknowledged writes/s)")
+    print(f"Persisted: {stored} of {acked} acknowledged, "
+          f"read back {settled - burst_end:.2f}s after the burst")
+    if stats_response is not None and stats_response.status_code == 200:
+        chat = json_body(stats_response).get("chat_messages", {})
+        print(f"Write buffer (one API instance): mode {chat.get('mode')}, {chat.get('batches')} batches, "
+              f"largest {chat.get('largestBatch')}, {chat.get('failed')} failed, {chat.get('pending')} pending")
+    if missing:
+        print(f"🚨 {missing} acknowledged messages were not persisted within {verify_timeout:.0f}s")
+    elif None in persisted:
+        print("🚨 Could not read back the history of every session")
+    else:
+        print("✅ Every acknowledged message was persisted")
+    print_latency_summary()
+    return not missing and None not in persisted
+
+# Open-loop load: requests follow an arrival schedule instead of waiting for
+# earlier responses, and latency is measured from the scheduled send time so
+# server stalls show up as latency rather than as fewer requests
+
+OPEN_LOOP_DURATION = 30.0
+
+OPEN_LOOP_TARGETS = {
+    "dashboard": ("GET", "/dashboard"),
+    "chat": ("POST", "/chat"),
+    "jobs": ("GET", "/jobs"),
+    "courses": ("GET", "/courses"),
+}
+
+def arrival_schedule(rate, duration, arrival="fixed", step_rate=0.0, step_interval=10.0, rng=None):
+    """Yield (offset_s, target_rate) for each request of an open-loop run"""
+    rng = rng or random.Random()
+    offset = 0.0
+    while True:
+        current_rate = rate
+        if arrival == "step":
+            current_rate = rate + step_rate * int(offset // step_interval)
+        if arrival == "poisson":
+            offset += rng.expovariate(current_rate)
+        else:
+            offset += 1.0 / current_rate
+        if offset >= duration:
+            return
+        yield offset, current_rate
+
+class OpenLoopPhase:
+    """Latency from scheduled send time and schedule lag for one target rate"""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.latency = LatencyHistogram()
+        self.lag = LatencyHistogram()
+        self.errors = 0
+        self.first = None
+        self.last = None
+
+class OpenLoopResults:
+    """Thread-safe per-phase results of an open-loop run"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.phases = {}
+
+    def record(self, rate, scheduled, started, finished, status):
+        with self.lock:
+            phase = self.phases.get(rate)
+            if phase is None:
+                phase = self.phases[rate] = OpenLoopPhase(rate)
+            phase.latency.record((finished - scheduled) * 1000)
+            phase.lag.record(max(started - scheduled, 0.0) * 1000)
+            if is_error_status(status):
+                phase.errors += 1
+            phase.first = scheduled if phase.first is None else min(phase.first, scheduled)
+            phase.last = finished if phase.last is None else max(phase.last, finished)
+
+def open_loop_request(target, state, index):
+    """Build the (method, endpoint, data) of the index-th open-loop request"""
+    method, endpoint = OPEN_LOOP_TARGETS[target]
+    data = None
+    if target == "chat":
+        test_case = CHAT_TEST_MESSAGES[index % len(CHAT_TEST_MESSAGES)]
+        data = {"message": test_case["message"], "language": "en", "sessionId": state.session_id}
+    return method, endpoint, data
+
+def take_cached_users(count):
+    """Remove and return up to count users from the token cache pool"""
+    taken = cached_users[:count]
+    del cached_users[:count]
+    return taken
+
+def prepare_users(count, concurrency=10):
+    """Register and assess users for runs that only exercise read/chat endpoints"""
+    global VERBOSE
+    ready = take_cached_users(count)
+    states = [UserState() for _ in range(count - len(ready))]
+    if not states:
+        return ready
+    
+    def setup(state):
+        if test_user_registration(state):
+            test_career_assessment(state)
+    
+    VERBOSE = False
+    try:
+        with ThreadPoolExecutor(max_workers=min(concurrency, count)) as pool:
+            list(pool.map(setup, states))
+    finally:
+        VERBOSE = True
+    return ready + [state for state in states if state.auth_token]
+
+def run_open_loop(target, rate, duration, arrival="fixed", step_rate=0.0, step_interval=10.0,
+                  users=10, max_in_flight=256):
+    """Send requests to one endpoint at a scheduled arrival rate"""
+    global VERBOSE
+    method, endpoint = OPEN_LOOP_TARGETS[target]
+    
+    print("🚀 Starting EmpowerYouth Open-Loop Load Test")
+    print("=" * 80)
+    print(f"Target: {method} {endpoint}, arrivals: {arrival}, rate: {rate}/s"
+          + (f" +{step_rate}/s every {step_interval}s" if arrival == "step" else "")
+          + f", duration: {duration}s")
+    
+    states = prepare_users(users)
+    if not states:
+        print("🚨 Could not register any users for the open-loop run")
+        return None
+    metrics.reset()
+    
+    results = OpenLoopResults()
+    
+    def fire(index, scheduled, current_rate):
+        started = time.monotonic()
+        state = states[index % len(states)]
+        req_method, req_endpoint, data = open_loop_request(target, state, index)
+        response = make_request(req_method, req_endpoint, data, auth_required=True, state=state)
+        results.record(current_rate, scheduled, started, time.monotonic(),
+                       response.status_code if response is not None else None)
+    
+    VERBOSE = False
+    dispatch_lag = LatencyHistogram()
+    start = time.monotonic()
+    try:
+        with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+            for index, (offset, current_rate) in enumerate(
+                    arrival_schedule(rate, duration, arrival, step_rate, step_interval)):
+                scheduled = start + offset
+                delay = scheduled - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                dispatch_lag.record(max(time.monotonic() - scheduled, 0.0) * 1000)
+                pool.submit(fire, index, scheduled, current_rate)
+    finally:
+        VERBOSE = True
+    
+    print_open_loop_summary(results, dispatch_lag, f"{method} {endpoint}")
+    print_latency_summary()
+    return results
+
+def print_open_loop_summary(results, dispatch_lag, label):
+    """Print latency from scheduled send time per target rate, and schedule lag"""
+    print("\n" + "=" * 80)
+    print(f"🎯 OPEN-LOOP SUMMARY: {label} (ms, measured from scheduled send time)")
+    print("=" * 80)
+    print(f"{'Target/s':>9}{'Sent':>8}{'Actual/s':>10}{'p50':>9}{'p95':>9}{'p99':>9}"
+          f"{'Max':>9}{'Err%':>7}{'Lag p99':>9}")
+    for rate, phase in sorted(results.phases.items()):
+        count = phase.latency.count
+        window = phase.last - phase.first if count > 1 else 0.0
+        actual = count / window if window else 0.0
+        print(f"{rate:>9g}{count:>8}{actual:>10.1f}{phase.latency.percentile(50):>9.1f}"
+              f"{phase.latency.percentile(95):>9.1f}{phase.latency.percentile(99):>9.1f}"
+              f"{phase.latency.max:>9.1f}{phase.errors / count * 100 if count else 0:>6.1f}%"
+              f"{phase.lag.percentile(99):>9.1f}")
+    print(f"\n⏳ Generator behind schedule: mean {dispatch_lag.mean():.2f} ms, "
+          f"p99 {dispatch_lag.percentile(99):.2f} ms, max {dispatch_lag.max:.2f} ms")
+    print("   (Lag p99 above also includes time waiting for a free worker)")
+
+# Capacity search: closed-loop steps of doubling concurrency against one endpoint,
+# stopping at the knee where throughput stops growing or p99 breaks the SLO
+
+CAPACITY_STEP_DURATION = 10.0
+CAPACITY_MAX_CONCURRENCY = 256
+CAPACITY_SLO_P99_MS = 500.0
+CAPACITY_MAX_ERROR_RATE = 0.01
+# Throughput a step must add over the previous one to count as still scaling
+CAPACITY_MIN_GAIN = 0.10
+
+class CapacityStep:
+    """Latency, request and error counts of one concurrency step"""
+
+    def __init__(self, concurrency):
+        self.concurrency = concurrency
+        self.lock = threading.Lock()
+        self.latency = LatencyHistogram()
+        self.requests = 0
+        self.errors = 0
+        self.elapsed = 0.0
+
+    def record(self, elapsed_ms, status):
+        with self.lock:
+            self.latency.record(elapsed_ms)
+            self.requests += 1
+            if is_error_status(status):
+                self.errors += 1
+
+    @property
+    def throughput(self):
+        """Successful requests per second"""
+        return (self.requests - self.errors) / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def error_rate(self):
+        return self.errors / self.requests if self.requests else 0.0
+
+def concurrency_steps(start, maximum):
+    """Doubling concurrency levels from start, ending with maximum"""
+    level = max(start, 1)
+    while level < maximum:
+        yield level
+        level *= 2
+    yield maximum
+
+def run_capacity_step(target, states, concurrency, duration):
+    """Keep concurrency requests in flight against target for duration seconds"""
+    step = CapacityStep(concurrency)
+    deadline = time.monotonic() + duration
+    
+    def worker(first_index):
+        state = states[first_index % len(states)]
+        index = first_index
+        while time.monotonic() < deadline:
+            method, endpoint, data = open_loop_request(target, state, index)
+            start = time.perf_counter()
+            response = make_request(method, endpoint, data, auth_required=True, state=state)
+            step.record((time.perf_counter() - start) * 1000,
+                        response.status_code if response is not None else None)
+            index += concurrency
+    
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, range(concurrency)))
+    step.elapsed = time.monotonic() - start
+    return step
+
+def knee_reason(steps, slo_p99_ms, max_error_rate, min_gain):
+    """Why the latest step is past the knee, or None while the endpoint still scales"""
+    last = steps[-1]
+    if last.error_rate > max_error_rate:
+        return f"error rate {last.error_rate:.1%} > {max_error_rate:.1%}"
+    if last.latency.percentile(99) > slo_p99_ms:
+        return f"p99 {last.latency.percentile(99):.0f} ms > SLO {slo_p99_ms:.0f} ms"
+    if len(steps) > 1 and last.throughput < steps[-2].throughput * (1 + min_gain):
+        gain = last.throughput / steps[-2].throughput - 1 if steps[-2].throughput else 0.0
+        return f"throughput {gain:+.0%} (< {min_gain:+.0%})"
+    return None
+
+def search_capacity(target, states, start, maximum, duration, slo_p99_ms, max_error_rate, min_gain):
+    """Step up concurrency until the knee; returns (steps, recommended step or None, reason)"""
+    method, endpoint = OPEN_LOOP_TARGETS[target]
+    steps = []
+    for concurrency in concurrency_steps(start, maximum):
+        steps.append(run_capacity_step(target, states, concurrency, duration))
+        step = steps[-1]
+        print(f"   {method} {endpoint} x{concurrency}: {step.throughput:.1f} req/s, "
+              f"p99 {step.latency.percentile(99):.1f} ms, errors {step.error_rate:.1%}")
+        reason = knee_reason(steps, slo_p99_ms, max_error_rate, min_gain)
+        if reason:
+            return steps, steps[-2] if len(steps) > 1 else None, reason
+    return steps, steps[-1], f"reached --max-concurrency {maximum}"
+
+def run_capacity_search(targets, users=10, start=1, maximum=CAPACITY_MAX_CONCURRENCY,
+                        duration=CAPACITY_STEP_DURATION, slo_p99_ms=CAPACITY_SLO_P99_MS,
+                        max_error_rate=CAPACITY_MAX_ERROR_RATE, min_gain=CAPACITY_MIN_GAIN):
+    """Find the recommended maximum concurrency of each target endpoint"""
+    global VERBOSE
+    print("🚀 Starting EmpowerYouth Capacity Search")
+    print("=" * 80)
+    print(f"Targets: {', '.join(targets)}, concurrency {start}..{maximum}, {duration:g}s per step, "
+          f"p99 SLO {slo_p99_ms:g} ms, max errors {max_error_rate:.1%}")
+    
+    states = prepare_users(users)
+    if not states:
+        print("🚨 Could not register any users for the capacity search")
+        return None
+    metrics.reset()
+    
+    results = {}
+    VERBOSE = False
+    try:
+        for target in targets:
+            results[target] = search_capacity(target, states, start, maximum, duration,
+                                              slo_p99_ms, max_error_rate, min_gain)
+    finally:
+        VERBOSE = True
+    
+    print_capacity_summary(results)
+    print_latency_summary()
+    return results
+
+def print_capacity_summary(results):
+    """Print the throughput/latency curve and recommended concurrency per target"""
+    print("\n" + "=" * 80)
+    print("📈 CAPACITY SEARCH SUMMARY")
+    print("=" * 80)
+    for target, (steps, recommended, reason) in results.items():
+        method, endpoint = OPEN_LOOP_TARGETS[target]
+        peak = max(step.throughput for step in steps) or 1.0
+        print(f"\n{method} {endpoint}")
+        print(f"{'Concurrency':>11}{'Req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'Err%':>7}  Throughput")
+        for step in steps:
+            bar = "█" * round(step.throughput / peak * 30)
+            marker = " ◀ recommended" if step is recommended else ""
+            print(f"{step.concurrency:>11}{step.throughput:>9.1f}{step.latency.percentile(50):>9.1f}"
+                  f"{step.latency.percentile(95):>9.1f}{step.latency.percentile(99):>9.1f}"
+                  f"{step.error_rate * 100:>6.1f}%  {bar}{marker}")
+        print(f"Stopped: {reason}")
+    
+    print(f"\n{'Endpoint':<24}{'Max concurrency':>16}{'Req/s':>9}{'p99 ms':>9}")
+    for target, (_, recommended, _) in results.items():
+        label = " ".join(OPEN_LOOP_TARGETS[target])
+        if recommended is None:
+            print(f"{label:<24}{'-':>16}   (fails the SLO at the lowest concurrency)")
+        else:
+            print(f"{label:<24}{recommended.concurrency:>16}{recommended.throughput:>9.1f}"
+                  f"{recommended.latency.percentile(99):>9.1f}")
+
+# Soak mode: the user journey at a steady rate for hours, sampling latency and the
+# server process's resources every interval, then testing each series for an
+# upward trend (slow leaks, growing collections, latency drift)
+
+SOAK_SAMPLE_INTERVAL = 60.0
+SOAK_MIN_SAMPLES = 8
+# Trend over the whole run, relative to the series median, below which it is ignored
+SOAK_MIN_DRIFT = 0.10
+SOAK_SERIES = [
+    ("p50_ms", "Latency p50 (ms)"),
+    ("p95_ms", "Latency p95 (ms)"),
+    ("p99_ms", "Latency p99 (ms)"),
+    ("rss_mb", "Server RSS (MiB)"),
+    ("fds", "Server open fds"),
+    ("sockets", "Server sockets"),
+]
+
+def find_server_pid(base_url):
+    """PID of the local process listening on base_url's port, found through /proc (Linux only)"""
+    url = urlparse(base_url)
+    if url.hostname not in ("localhost", "127.0.0.1", "::1"):
+        return None
+    port = url.port or (443 if url.scheme == "https" else 80)
+    inodes = set()
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(table) as f:
+                next(f)
+                for line in f:
+                    fields = line.split()
+                    # fields: sl, local address:port (hex), remote, state (0A = LISTEN), ..., inode
+                    if fields[3] == "0A" and int(fields[1].rsplit(":", 1)[1], 16) == port:
+                        inodes.add(f"socket:[{fields[9]}]")
+        except OSError:
+            continue
+    if not inodes:
+        return None
+    for pid in filter(str.isdigit, os.listdir("/proc")):
+        try:
+            fd_dir = f"/proc/{pid}/fd"
+            if any(os.readlink(f"{fd_dir}/{fd}") in inodes for fd in os.listdir(fd_dir)):
+                return int(pid)
+        except OSError:
+            continue
+    return None
+
+def process_resources(pid):
+    """RSS, open file descriptors and sockets of a process from /proc, or None if unreadable"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            rss_kb = next(int(line.split()[1]) for line in f if line.startswith("VmRSS:"))
+        fds = sockets = 0
+        for fd in os.listdir(f"/proc/{pid}/fd"):
+            try:
+                target = os.readlink(f"/proc/{pid}/fd/{fd}")
+            except OSError:
+                continue
+            fds += 1
+            sockets += target.startswith("socket:")
+        return {"rss_mb": rss_kb / 1024.0, "fds": fds, "sockets": sockets}
+    except (OSError, StopIteration):
+        return None
+
+def mann_kendall_increasing(values):
+    """One-sided Mann-Kendall p-value that the series trends upward (normal approximation, tie-corrected)"""
+    n = len(values)
+    s = sum((b > a) - (b < a) for i, a in enumerate(values) for b in values[i + 1:])
+    ties = {}
+    for value in values:
+        ties[value] = ties.get(value, 0) + 1
+    variance = (n * (n - 1) * (2 * n + 5) - sum(t * (t - 1) * (2 * t + 5) for t in ties.values())) / 18.0
+    if variance <= 0:
+        return 1.0
+    z = (s - 1) / math.sqrt(variance) if s > 0 else (s + 1) / math.sqrt(variance) if s < 0 else 0.0
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+def sen_slope(times, values):
+    """Median of the pairwise slopes: a trend estimate robust to outliers"""
+    slopes = [(values[j] - values[i]) / (times[j] - times[i])
+              for i in range(len(values)) for j in range(i + 1, len(values)) if times[j] > times[i]]
+    return statistics.median(slopes) if slopes else 0.0
+
+def soak_trends(samples, alpha=REGRESSION_ALPHA, min_drift=SOAK_MIN_DRIFT):
+    """Per series: (label, first, last, slope per hour, p-value, flagged)"""
+    trends = []
+    for key, label in SOAK_SERIES:
+        points = [(sample["elapsed_s"] / 3600.0, sample[key]) for sample in samples
+                  if sample.get(key) is not None]
+        if len(points) < SOAK_MIN_SAMPLES:
+            continue
+        times, values = zip(*points)
+        slope = sen_slope(times, values)
+        p_value = mann_kendall_increasing(values)
+        median = statistics.median(values)
+        drift = slope * (times[-1] - times[0]) / median if median else 0.0
+        trends.append((label, values[0], values[-1], slope, p_value,
+                       slope > 0 and p_value < alpha and drift > min_drift))
+    return trends
+
+def soak_sample(window, elapsed, journeys, resources):
+    """One interval's sample: latency over all endpoints, error rate and server resources"""
+    latency = LatencyHistogram()
+    errors = 0
+    for data in window["endpoints"].values():
+        latency.merge(LatencyHistogram.from_dict(data["latency"]))
+        errors += data["errors"]
+    sample = {
+        "elapsed_s": elapsed,
+        "journeys": journeys,
+        "requests": latency.count,
+        "p50_ms": latency.percentile(50) if latency.count else None,
+        "p95_ms": latency.percentile(95) if latency.count else None,
+        "p99_ms": latency.percentile(99) if latency.count else None,
+        "error_rate": errors / latency.count if latency.count else 0.0,
+    }
+    sample.update(resources or {"rss_mb": None, "fds": None, "sockets": None})
+    return sample
+
+def print_soak_sample(sample):
+    def show(value, spec):
+        return format(value, spec) if value is not None else f"{'-':>{spec.split('.')[0]}}"
+    print(f"{sample['elapsed_s'] / 60:>8.1f}{sample['journeys']:>9}{sample['requests']:>9}"
+          f"{show(sample['p50_ms'], '9.1f')}{show(sample['p95_ms'], '9.1f')}{show(sample['p99_ms'], '9.1f')}"
+          f"{sample['error_rate'] * 100:>6.1f}%{show(sample['rss_mb'], '10.1f')}"
+          f"{show(sample['fds'], '7')}{show(sample['sockets'], '9')}", flush=True)
+
+def run_soak(hours, rate, users=10, interval=SOAK_SAMPLE_INTERVAL, server_pid=None,
+             max_in_flight=256, base_url=BASE_URL, alpha=REGRESSION_ALPHA):
+    """Run the journey at rate journeys/s for hours; returns (samples, trends)"""
+    global VERBOSE
+    duration = hours * 3600
+    server_pid = server_pid or find_server_pid(base_url)
+    print("🚀 Starting EmpowerYouth Soak Test")
+    print("=" * 80)
+    print(f"Duration: {hours:g}h, rate: {rate:g} journeys/s, users: {users}, sample every {interval:g}s")
+    if server_pid is None:
+        print("⚠️  No local server process found; sampling latency only (pass --server-pid)")
+    else:
+        print(f"Sampling server process {server_pid}"
+              + (" (the in-process stand-in; includes the harness)" if server_pid == os.getpid() else ""))
+    
+    states = prepare_users(users)
+    if not states:
+        print("🚨 Could not register any users for the soak test")
+        return None
+    metrics.reset()
+    totals = MetricsRegistry()
+    results = LoadResults()
+    samples = []
+    stop = threading.Event()
+    
+    print(f"\n{'Minute':>8}{'Journeys':>9}{'Requests':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'Err%':>7}"
+          f"{'RSS MiB':>10}{'FDs':>7}{'Sockets':>9}")
+    
+    def sampler():
+        journeys_before = 0
+        while not stop.wait(interval):
+            window = metrics.drain()
+            totals.merge_state(window)
+            with results.lock:
+                journeys, journeys_before = results.journeys - journeys_before, results.journeys
+            samples.append(soak_sample(window, time.monotonic() - start, journeys,
+                                       process_resources(server_pid) if server_pid else None))
+            print_soak_sample(samples[-1])
+    
+    def journey(index):
+        results.record(run_user_journey(states[index % len(states)]))
+    
+    VERBOSE = False
+    start = time.monotonic()
+    sampling = threading.Thread(target=sampler, daemon=True)
+    sampling.start()
+    try:
+        with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+            for index, (offset, _) in enumerate(arrival_schedule(rate, duration)):
+                delay = start + offset - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(journey, index)
+    finally:
+        stop.set()
+        sampling.join()
+        VERBOSE = True
+        totals.merge_state(metrics.drain())
+        metrics.merge_state(totals.to_state())
+    
+    trends = soak_trends(samples, alpha)
+    print_soak_summary(samples, trends, time.monotonic() - start)
+    print_load_summary(results, time.monotonic() - start)
+    print_latency_summary()
+    return samples, trends
+
+def print_soak_summary(samples, trends, elapsed):
+    """Print each series' trend and flag significant upward drift"""
+    print("\n" + "=" * 80)
+    print(f"🧪 SOAK TREND SUMMARY ({len(samples)} samples over {elapsed / 3600:.2f}h)")
+    print("=" * 80)
+    if not trends:
+        print(f"Too few samples for trend tests (need {SOAK_MIN_SAMPLES})")
+        return
+    print(f"{'Series':<20}{'First':>10}{'Last':>10}{'Slope/h':>11}{'p-value':>10}  Verdict")
+    for label, first, last, slope, p_value, flagged in trends:
+        verdict = "📈 UPWARD TREND" if flagged else "✅ stable"
+        print(f"{label:<20}{first:>10.1f}{last:>10.1f}{slope:>+11.2f}{p_value:>10.4f}  {verdict}")
+    flagged = [label for label, *_, is_flagged in trends if is_flagged]
+    if flagged:
+        print(f"\n🚨 Significant upward trend in: {', '.join(flagged)}")
+
+# Cold start: first-request vs warm latency per route, against a server the
+# harness restarts before every run (--server-command) or one started by hand
+
+COLD_START_RUNS = 3
+COLD_START_WARM_SAMPLES = 20
+COLD_START_TIMEOUT = 120.0
+COLD_START_SESSION = "cold-start"
+
+# (method, endpoint, body builder) for every route, in the order a new user reaches them
+COLD_START_ROUTES = [
+    ("GET", "/", None),
+    ("POST", "/auth/register", lambda state: state.user_data),
+    ("GET", "/auth/me", None),
+    ("POST", "/assessment/submit", lambda state: ASSESSMENT_DATA),
+    ("GET", "/dashboard", None),
+    ("POST", "/chat", lambda state: {"message": CHAT_TEST_MESSAGES[0]["message"], "sessionId": COLD_START_SESSION}),
+    ("GET", f"/chat/history?sessionId={COLD_START_SESSION}&limit=1", None),
+    ("GET", "/jobs", None),
+    ("GET", "/courses", None),
+    ("POST", "/apply", lambda state: {"jobId": DEFAULT_JOB_ID}),
+]
+
+def start_server(command, base_url, timeout=COLD_START_TIMEOUT):
+    """Run command in its own process group; returns (process, seconds until base_url's port accepts connections)"""
+    url = urlparse(base_url)
+    address = (url.hostname, url.port or (443 if url.scheme == "https" else 80))
+    process = subprocess.Popen(command, shell=True, start_new_session=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    start = time.monotonic()
+    while time.monotonic() - start < timeout:
+        if process.poll() is not None:
+            raise RuntimeError(f"server command exited with status {process.returncode}")
+        try:
+            # A bare TCP connect, so nothing is compiled or connected before the first request
+            socket.create_connection(address, timeout=1).close()
+            return process, time.monotonic() - start
+        except OSError:
+            time.sleep(0.05)
+    stop_server(process)
+    raise RuntimeError(f"server was not listening on {address[0]}:{address[1]} after {timeout:.0f}s")
+
+def stop_server(process):
+    """Stop a start_server() process group, killing it if it ignores SIGTERM"""
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+    except ProcessLookupError:
+        pass
+
+def wait_until_ready(timeout=COLD_START_TIMEOUT):
+    """Poll /ready like a load balancer would; returns the seconds it took, or None on timeout"""
+    start = time.monotonic()
+    while time.monotonic() - start < timeout:
+        response = make_request("GET", "/ready")
+        if response is not None and response.status_code == 200:
+            return time.monotonic() - start
+        time.sleep(0.1)
+    return None
+
+def cold_start_pass(samples):
+    """Hit every route once as a new user; appends (ms, server ms, ok) to samples per route"""
+    state = UserState()
+    for method, endpoint, body in COLD_START_ROUTES:
+        start = time.perf_counter()
+        response = make_request(method, endpoint, body(state) if body else None, auth_required=True, state=state)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        ok = response is not None and response.status_code == 200
+        server_ms = parse_server_timing(response.headers.get("Server-Timing")).get("total") if ok else None
+        samples.setdefault(f"{method} {endpoint.split('?', 1)[0]}", []).append((elapsed_ms, server_ms, ok))
+        if endpoint == "/auth/register" and ok:
+            state.auth_token = json_body(response)["token"]
+
+def run_cold_start(command=None, runs=COLD_START_RUNS, warm_samples=COLD_START_WARM_SAMPLES,
+                   wait_ready=False, base_url=BASE_URL, timeout=COLD_START_TIMEOUT):
+    """Measure first-request and warm latency of every route; returns (first, warm) samples per route"""
+    global VERBOSE
+    runs = runs if command else 1
+    print("🚀 Starting EmpowerYouth Cold Start Test")
+    print("=" * 80)
+    print(f"Server: {command or base_url + ' (assumed freshly started)'}, runs: {runs}, "
+          f"warm passes per run: {warm_samples}" + (", waiting for /ready" if wait_ready else ""))
+    
+    first, warm, startup = {}, {}, []
+    VERBOSE = False
+    try:
+        for run in range(runs):
+            process, listening = None, None
+            if command:
+                try:
+                    process, listening = start_server(command, base_url, timeout)
+                except RuntimeError as e:
+                    print(f"🚨 Run {run + 1}: {e}")
+                    return None
+                # Pooled connections to the previous server are dead
+                get_client().close()
+            try:
+                ready = wait_until_ready(timeout) if wait_ready else None
+                startup.append((listening, ready))
+                cold_start_pass(first)
+                for _ in range(warm_samples):
+                    cold_start_pass(warm)
+            finally:
+                if process is not None:
+                    stop_server(process)
+                    get_client().close()
+            print(f"   Run {run + 1}: first GET / took {first['GET /'][-1][0]:.1f} ms"
+                  + (f", listening after {listening:.2f}s" if listening is not None else "")
+                  + (f", ready after {ready:.2f}s" if ready is not None else ""))
+    finally:
+        VERBOSE = True
+    
+    print_cold_start_summary(first, warm, startup)
+    print_latency_summary()
+    return first, warm
+
+def print_cold_start_summary(first, warm, startup):
+    """Print first-request vs warm latency per route"""
+    print("\n" + "=" * 80)
+    print("🧊 COLD START SUMMARY (ms; first request is the median over runs)")
+    print("=" * 80)
+    listening = [s for s, _ in startup if s is not None]
+    ready = [r for _, r in startup if r is not None]
+    if listening:
+        print(f"Process start to listening: median {statistics.median(listening):.2f}s")
+    if ready:
+        print(f"Listening to /ready passing: median {statistics.median(ready):.2f}s")
+    print(f"{'Route':<26}{'First':>9}{'Server':>9}{'Warm p50':>10}{'Warm p95':>10}{'First/warm':>12}")
+    for route, samples in first.items():
+        ok = [(ms, server_ms) for ms, server_ms, passed in samples if passed]
+        hist = LatencyHistogram()
+        for ms, _, passed in warm.get(route, []):
+            if passed:
+                hist.record(ms)
+        if not ok:
+            print(f"{route:<26}{'failed':>9}")
+            continue
+        first_ms = statistics.median(ms for ms, _ in ok)
+        server = [server_ms for _, server_ms in ok if server_ms is not None]
+        server_text = f"{statistics.median(server):>9.1f}" if server else f"{'-':>9}"
+        ratio = f"{first_ms / hist.percentile(50):>11.1f}x" if hist.count else f"{'-':>12}"
+        print(f"{route:<26}{first_ms:>9.1f}{server_text}{hist.percentile(50):>10.1f}"
+              f"{hist.percentile(95):>10.1f}{ratio}")
+    print("Server is the handler time from Server-Timing; the rest of a slow first request is "
+          "compilation, connection setup or queueing before the handler ran.")
+
+# Auth overhead microbenchmark: the same listing requests without a token,
+# with a token the server has not seen yet and with one it has already verified
+
+AUTH_BENCH_REQUESTS = 200
+AUTH_BENCH_FRESH_TOKENS = 20
+AUTH_BENCH_WARMUP = 5
+AUTH_BENCH_ROUTES = ["/jobs", "/courses"]
+AUTH_BENCH_VARIANTS = ["anonymous", "new token", "reused token"]
+
+def register_bench_user():
+    """Register a throwaway user and return its token, or None"""
+    state = UserState()
+    response = make_request("POST", "/auth/register", state.user_data, state=state)
+    if response is None or response.status_code != 200:
+        return None
+    return json_body(response)["token"]
+
+def auth_bench_request(endpoint, variant, token, samples):
+    """Time one GET outside make_request, so each variant gets its own metrics row"""
+    headers = {"Authorization": f"Bearer {token}"} if token else None
+    label = f"{endpoint} ({variant})"
+    start = time.perf_counter()
+    try:
+        response = get_client().request("GET", endpoint, headers=headers)
+    except requests.exceptions.RequestException:
+        metrics.record("GET", label, (time.perf_counter() - start) * 1000, None)
+        samples.setdefault((endpoint, variant), []).append(None)
+        return
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    header = response.headers.get("Server-Timing")
+    metrics.record("GET", label, elapsed_ms, response.status_code, phase_breakdown(elapsed_ms, header))
+    expected = 401 if variant == "anonymous" else 200
+    timings = parse_server_timing(header)
+    samples.setdefault((endpoint, variant), []).append(
+        (elapsed_ms, timings.get("total"), timings.get("auth", 0.0)) if response.status_code == expected else None)
+
+def token_cache_stats():
+    response = make_request("GET", "/cache/stats")
+    if response is None or response.status_code != 200:
+        return None
+    return json_body(response).get("tokens")
+
+def run_auth_bench(requests_per_variant=AUTH_BENCH_REQUESTS, fresh_tokens=AUTH_BENCH_FRESH_TOKENS):
+    """Compare anonymous, first-use and reused-token latency of the listing routes; returns samples"""
+    global VERBOSE
+    print("🚀 Starting EmpowerYouth Auth Overhead Benchmark")
+    print("=" * 80)
+    print(f"Routes: {', '.join(AUTH_BENCH_ROUTES)}, {requests_per_variant} anonymous and reused-token "
+          f"requests per route, {fresh_tokens} new tokens per route")
+    
+    VERBOSE = False
+    try:
+        reused = register_bench_user()
+        fresh = {endpoint: [register_bench_user() for _ in range(fresh_tokens)] for endpoint in AUTH_BENCH_ROUTES}
+        if reused is None or None in itertools.chain.from_iterable(fresh.values()):
+            print("🚨 Could not register benchmark users")
+            return None
+        for endpoint in AUTH_BENCH_ROUTES:
+            for _ in range(AUTH_BENCH_WARMUP):
+                get_client().request("GET", endpoint, headers={"Authorization": f"Bearer {reused}"})
+        metrics.reset()
+        before = token_cache_stats()
+        
+        # Variants are interleaved so drift in the server affects them alike
+        samples = {}
+        for i in range(requests_per_variant):
+            for endpoint in AUTH_BENCH_ROUTES:
+                auth_bench_request(endpoint, "anonymous", None, samples)
+                if i < fresh_tokens:
+                    auth_bench_request(endpoint, "new token", fresh[endpoint][i], samples)
+                auth_bench_request(endpoint, "reused token", reused, samples)
+        after = token_cache_stats()
+    finally:
+        VERBOSE = True
+    print_auth_bench_summary(samples, before, after)
+    return samples
+
+def print_auth_bench_summary(samples, before, after):
+    print("\n" + "=" * 80)
+    print("🔐 AUTH OVERHEAD (ms)")
+    print("=" * 80)
+    print(f"{'Route':<16}{'Variant':<14}{'Count':>7}{'p50':>8}{'p95':>8}{'Server':>8}{'Auth':>8}{'Auth%':>7}{'Failed':>8}")
+    for endpoint in AUTH_BENCH_ROUTES:
+        for variant in AUTH_BENCH_VARIANTS:
+            results = samples.get((endpoint, variant), [])
+            ok = [sample for sample in results if sample is not None]
+            if not ok:
+                print(f"{'GET ' + endpoint:<16}{variant:<14}{len(results):>7}{'-':>8}")
+                continue
+            latency = LatencyHistogram()
+            for ms, _, _ in ok:
+                latency.record(ms)
+            server = [server_ms for _, server_ms, _ in ok if server_ms is not None]
+            server_p50 = statistics.median(server) if server else None
+            auth_p50 = statistics.median(auth_ms for _, _, auth_ms in ok)
+            share = f"{auth_p50 / server_p50:>7.1%}" if server_p50 else f"{'-':>7}"
+            print(f"{'GET ' + endpoint:<16}{variant:<14}{len(ok):>7}{latency.percentile(50):>8.2f}"
+                  f"{latency.percentile(95):>8.2f}"
+                  + (f"{server_p50:>8.2f}" if server_p50 is not None else f"{'-':>8}")
+                  + f"{auth_p50:>8.3f}{share}{len(results) - len(ok):>8}")
+    print("Latency, Server (Server-Timing total) and Auth (its auth phase) are p50s. Anonymous requests are "
+          "rejected with 401 before any work, so they are the floor every request pays.")
+    
+    if before is not None and after is not None:
+        hits = after["hits"] - before["hits"]
+        misses = after["misses"] - before["misses"]
+        lookups = hits + misses
+        print(f"🗝️  Token cache: {hits} hits, {misses} misses ({hits / lookups if lookups else 0:.1%} hit rate), "
+              f"{after['evictions'] - before['evictions']} evictions, size {after['size']}/{after['maxEntries']}")
+    else:
+        print("🗝️  Server reports no token cache statistics")
+
+# Scenario-driven load: a JSON/YAML file declares a weighted action mix,
+# think times, payload generators and session lengths
+
+ASSESSMENT_CHOICES = {
+    "interests": ["Technology", "Business", "Healthcare", "Creative Arts", "Education"],
+    "skills": ["Programming", "Communication", "Data Analysis", "Design", "Sales"],
+    "goals": ["Get a good job", "Learn new skills", "Start a business", "Higher studies"],
+    "challenges": ["Lack of experience", "Interview anxiety", "Limited network", "Career confusion"],
+    "workPreference": ["remote", "office", "hybrid"],
+    "careerStage": ["student", "entry-level", "career-change"],
+}
+
+def payload_chat_message(state, rng):
+    test_case = rng.choice(CHAT_TEST_MESSAGES)
+    return {"message": test_case["message"], "language": "en", "sessionId": state.session_id}
+
+def payload_random_assessment(state, rng):
+    data = {}
+    for field, choices in ASSESSMENT_CHOICES.items():
+        if field in ("workPreference", "careerStage"):
+            data[field] = rng.choice(choices)
+        else:
+            data[field] = rng.sample(choices, rng.randint(1, 3))
+    return data
+
+# First built-in catalog job; catalog ids are stable, so it is always a valid application target
+DEFAULT_JOB_ID = "job-00000001"
+
+def payload_job_application(state, rng):
+    return {"jobId": rng.choice(state.job_ids) if state.job_ids else DEFAULT_JOB_ID}
+
+PAYLOAD_GENERATORS = {
+    "chat_message": payload_chat_message,
+    "assessment": lambda state, rng: ASSESSMENT_DATA,
+    "random_assessment": payload_random_assessment,
+    "job_application": payload_job_application,
+    "new_user": lambda state, rng: new_user_data(),
+}
+
+def remember_job_ids(response, state):
+    """Keep job ids from a jobs/dashboard response for later applications"""
+    if response is not None and response.status_code == 200:
+        data = json_body(response)
+        state.job_ids = [job["id"] for job in data.get("jobs", [])]
+
+# name -> (method, endpoint, default payload generator, check)
+SCENARIO_ACTIONS = {
+    "dashboard": ("GET", "/dashboard", None, lambda response, state: check_dashboard(response)),
+    "jobs": ("GET", "/jobs", None, lambda response, state: check_jobs(response)),
+    "courses": ("GET", "/courses", None, lambda response, state: check_courses(response)),
+    "chat": ("POST", "/chat", "chat_message",
+             lambda response, state: checked_json("Chat", "POST", "/chat", response) is not None),
+    "register": ("POST", "/auth/register", "new_user", None),
+    "assessment": ("POST", "/assessment/submit", "assessment",
+                   lambda response, state: check_career_assessment(response)),
+    "apply": ("POST", "/apply", "job_application",
+              lambda response, state: check_job_application(response)),
+}
+
+def load_scenario(path):
+    """Read and validate a scenario file (JSON, or YAML when PyYAML is installed)"""
+    with open(path) as f:
+        if path.endswith((".yml", ".yaml")):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("YAML scenarios require PyYAML: pip install pyyaml")
+            scenario = yaml.safe_load(f)
+        else:
+            scenario = json.load(f)
+    
+    actions = scenario.get("actions") or []
+    if not actions:
+        raise ValueError("scenario has no actions")
+    for action in actions:
+        if action.get("name") not in SCENARIO_ACTIONS:
+            raise ValueError(f"unknown action {action.get('name')!r}; "
+                             f"expected one of {sorted(SCENARIO_ACTIONS)}")
+        payload = action.get("payload", SCENARIO_ACTIONS[action["name"]][2])
+        if payload is not None and payload not in PAYLOAD_GENERATORS:
+            raise ValueError(f"unknown payload generator {payload!r}")
+        if action.get("weight", 1) <= 0:
+            raise ValueError(f"action {action['name']!r} needs a positive weight")
+        validate_think_time(action.get("think_time"), f"action {action['name']!r}")
+    validate_think_time(scenario.get("think_time"), "scenario")
+    session_length = scenario.get("session_length", {"min": 5, "max": 10})
+    if not 1 <= session_length.get("min", 0) <= session_length.get("max", 0):
+        raise ValueError("session_length needs 1 <= min <= max")
+    return scenario
+
+THINK_TIME_DISTRIBUTIONS = ("fixed", "exponential", "uniform")
+
+def validate_think_time(spec, where):
+    """Reject think times think_time() cannot sample"""
+    if not spec:
+        return
+    distribution = spec.get("distribution", "fixed")
+    if distribution not in THINK_TIME_DISTRIBUTIONS:
+        raise ValueError(f"{where}: unknown think time distribution {distribution!r}; "
+                         f"expected one of {list(THINK_TIME_DISTRIBUTIONS)}")
+    if distribution == "uniform":
+        if not 0 <= spec.get("min_ms", -1) <= spec.get("max_ms", -1):
+            raise ValueError(f"{where}: uniform think time needs 0 <= min_ms <= max_ms")
+    elif distribution == "exponential" and not spec.get("mean_ms", 0) > 0:
+        raise ValueError(f"{where}: exponential think time needs mean_ms > 0")
+    elif spec.get("mean_ms", 0) < 0:
+        raise ValueError(f"{where}: think time mean_ms must not be negative")
+
+def think_time(spec, rng):
+    """Seconds to pause after an action"""
+    if not spec:
+        return 0.0
+    distribution = spec.get("distribution", "fixed")
+    if distribution == "exponential":
+        return rng.expovariate(1000.0 / spec["mean_ms"])
+    if distribution == "uniform":
+        return rng.uniform(spec["min_ms"], spec["max_ms"]) / 1000.0
+    return spec.get("mean_ms", 0) / 1000.0
+
+def run_scenario_action(action, state, rng):
+    """Run one scenario action; returns (passed, session state to continue with)"""
+    name = action["name"]
+    method, endpoint, default_payload, check = SCENARIO_ACTIONS[name]
+    generator = action.get("payload", default_payload)
+    data = PAYLOAD_GENERATORS[generator](state, rng) if generator else None
+    
+    if name == "register":
+        # A sign-up: the session continues as the newly registered user
+        new_state = UserState(data)
+        response = make_request(method, endpoint, data, state=new_state)
+        passed = check_user_registration(response, new_state)
+        return passed, new_state if passed else state
+    
+    response = make_request(method, endpoint, data, auth_required=True, state=state)
+    passed = run_check(check, response, state)
+    if passed and name in ("jobs", "dashboard"):
+        remember_job_ids(response, state)
+    if passed and name == "chat":
+        state.session_id = json_body(response)["sessionId"]
+    return passed, state
+
+def run_scenario(scenario, users=None, concurrency=None, duration=None, seed=None):
+    """Run virtual users through weighted scenario sessions until the duration ends"""
+    global VERBOSE
+    users = users or scenario.get("users", 10)
+    concurrency = concurrency or scenario.get("concurrency", users)
+    duration = duration or scenario.get("duration", 60)
+    session_length = scenario.get("session_length", {"min": 5, "max": 10})
+    actions = scenario["actions"]
+    weights = [action.get("weight", 1) for action in actions]
+    
+    print(f"🚀 Starting EmpowerYouth Scenario: {scenario.get('name', 'unnamed')}")
+    print("=" * 80)
+    print(f"Virtual users: {users}, concurrency: {concurrency}, duration: {duration}s, "
+          f"actions: {', '.join(a['name'] + '=' + str(w) for a, w in zip(actions, weights))}")
+    
+    pool_users = prepare_users(scenario.get("user_pool", users))
+    if not pool_users:
+        print("🚨 Could not register any users for the scenario")
+        return None
+    metrics.reset()
+    
+    results = LoadResults()
+    # A user is checked out for a whole session, so no two sessions share one;
+    # with fewer users than concurrency, virtual users wait for a free one
+    idle_users = queue.Queue()
+    for state in pool_users:
+        idle_users.put(state)
+    start = time.monotonic()
+    deadline = start + duration
+    
+    def virtual_user(vu):
+        rng = random.Random(None if seed is None else seed + vu)
+        while time.monotonic() < deadline:
+            try:
+                state = idle_users.get(timeout=max(deadline - time.monotonic(), 0.001))
+            except queue.Empty:
+                break
+            state.session_id = None
+            session = []
+            for _ in range(rng.randint(session_length["min"], session_length["max"])):
+                if time.monotonic() >= deadline:
+                    break
+                action = rng.choices(actions, weights)[0]
+                passed, next_state = run_scenario_action(action, state, rng)
+                session.append((action["name"], passed))
+                if next_state is not state:
+                    # A sign-up: the session carries on as the new user
+                    idle_users.put(state)
+                    state = next_state
+                pause = think_time(action.get("think_time", scenario.get("think_time")), rng)
+                time.sleep(max(min(pause, deadline - time.monotonic()), 0))
+            idle_users.put(state)
+            results.record(session)
+    
+    VERBOSE = False
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(virtual_user, range(users)))
+    finally:
+        VERBOSE = True
+    elapsed = time.monotonic() - start
+    
+    print_load_summary(results, elapsed, unit="Sessions")
+    print_latency_summary()
+    return results
+
+# Benchmark baselines and regression detection
+
+def current_commit():
+    """Short git commit of the working tree, or "unknown" outside a checkout"""
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+    return result.stdout.strip() or "unknown"
+
+def load_baselines(path):
+    if not os.path.exists(path):
+        return {"runs": []}
+    with open(path) as f:
+        return json.load(f)
+
+def save_baseline(path, base_url, mode):
+    """Store this run's metrics, replacing any earlier run for the same commit, URL and mode"""
+    commit = current_commit()
+    store = load_baselines(path)
+    with metrics.lock:
+        histograms = {key: stats.latency.to_dict() for key, stats in metrics.endpoints.items()}
+    run = {
+        "commit": commit,
+        "base_url": base_url,
+        "mode": mode,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "endpoints": metrics.snapshot(),
+        "histograms": histograms,
+    }
+    store["runs"] = [r for r in store["runs"]
+                     if not (r["commit"] == commit and r["base_url"] == base_url and r.get("mode") == mode)]
+    store["runs"].append(run)
+    with open(path, "w") as f:
+        json.dump(store, f, indent=2)
+    return run
+
+def find_baseline(path, base_url, ref, mode):
+    """Pick the baseline run of the same mode for base_url: "latest" or a commit prefix"""
+    current = current_commit()
+    runs = [r for r in load_baselines(path)["runs"] if r["base_url"] == base_url and r.get("mode") == mode]
+    if ref == "latest":
+        runs = [r for r in runs if r["commit"] != current] or runs
+    else:
+        runs = [r for r in runs if r["commit"].startswith(ref)]
+    return runs[-1] if runs else None
+
+def mann_whitney_greater(baseline, candidate):
+    """One-sided Mann-Whitney U p-value that candidate latencies exceed baseline.
+
+    Works directly on the shared histogram buckets: values in one bucket are
+    treated as ties, using the normal approximation with tie correction.
+    """
+    n1, n2 = baseline.count, candidate.count
+    n = n1 + n2
+    u = 0.0
+    below = 0
+    tie_term = 0
+    for index in sorted(set(baseline.buckets) | set(candidate.buckets)):
+        a = baseline.buckets.get(index, 0)
+        b = candidate.buckets.get(index, 0)
+        u += b * (below + 0.5 * a)
+        below += a
+        tie_term += (a + b) ** 3 - (a + b)
+    mean = n1 * n2 / 2.0
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+def compare_to_baseline(baseline, threshold=REGRESSION_THRESHOLD, alpha=REGRESSION_ALPHA):
+    """Print a p95 comparison per endpoint and return the endpoints that regressed"""
+    print("\n" + "=" * 80)
+    print(f"📈 BASELINE COMPARISON (vs {baseline['commit']} from {baseline['timestamp']})")
+    print("=" * 80)
+    print(f"{'Endpoint':<26}{'Base p95':>10}{'New p95':>10}{'Change':>9}{'p-value':>10}  Verdict")
+    
+    regressions = []
+    current = metrics.snapshot()
+    with metrics.lock:
+        candidates = {key: stats.latency for key, stats in metrics.endpoints.items()}
+    for key, row in current.items():
+        if key not in baseline["histograms"]:
+            continue
+        base_hist = LatencyHistogram.from_dict(baseline["histograms"][key])
+        new_hist = candidates[key]
+        base_p95 = base_hist.percentile(95)
+        change = (row["p95_ms"] - base_p95) / base_p95 if base_p95 else 0.0
+        if min(base_hist.count, new_hist.count) < MIN_COMPARE_SAMPLES:
+            p_value, verdict = None, "⚪ too few samples"
+        else:
+            p_value = mann_whitney_greater(base_hist, new_hist)
+            if change > threshold and p_value < alpha:
+                verdict = "❌ REGRESSION"
+                regressions.append(key)
+            else:
+                verdict = "✅ ok"
+        p_text = f"{p_value:.4f}" if p_value is not None else "-"
+        print(f"{key:<26}{base_p95:>10.1f}{row['p95_ms']:>10.1f}{change * 100:>8.1f}%"
+              f"{p_text:>10}  {verdict}")
+    
+    if regressions:
+        print(f"\n🚨 {len(regressions)} endpoint(s) regressed more than {threshold * 100:.0f}% at p95")
+    return regressions
+
+def report_run(args, mode):
+    """Export metrics and handle baselines after a run; returns the process exit code"""
+    if args.metrics_json:
+        metrics.export_json(args.metrics_json, args.base_url)
+        print(f"📝 Metrics written to {args.metrics_json}")
+    
+    # The stand-in API listens on a new port every run, so its baselines use a fixed key
+    target = MOCK_BASELINE_TARGET if args.mock_server else args.base_url
+    exit_code = 0
+    if args.compare_baseline:
+        baseline = find_baseline(args.baseline_file, target, args.compare_baseline, mode)
+        if baseline is None:
+            print(f"⚠️  No {mode} baseline '{args.compare_baseline}' for {target} in {args.baseline_file}")
+        elif compare_to_baseline(baseline, args.regression_threshold, args.alpha):
+            exit_code = 1
+    
+    if args.save_baseline:
+        run = save_baseline(args.baseline_file, target, mode)
+        print(f"💾 {mode.capitalize()} baseline saved for {run['commit']} @ {target} in {args.baseline_file}")
+    return exit_code
+
+def parse_args(argv=None, supported=None):
+    """Parse command line options
+
+    supported limits the options that may be set, by destination name, for
+    harnesses that only implement some modes (backend_test_async.py).
+    """
+    parser = argparse.ArgumentParser(description="EmpowerYouth backend API tests")
+    parser.add_argument("--base-url", default=BASE_URL, help="API base URL")
+    parser.add_argument("--pool-size", type=int, default=POOL_SIZE,
+                        help="max keep-alive connections per host")
+    parser.add_argument("--retries", type=int, default=CONNECT_RETRIES,
+                        help="retries for connection errors")
+    parser.add_argument("--timeout", type=float, default=REQUEST_TIMEOUT,
+                        help="read timeout in seconds")
+    parser.add_argument("--connect-timeout", type=float, default=CONNECT_TIMEOUT,
+                        help="connect timeout in seconds")
+    parser.add_argument("--accept-encoding", default=ACCEPT_ENCODING,
+                        help="Accept-Encoding sent with every request, e.g. 'identity' to "
+                             f"measure uncompressed payloads (default '{ACCEPT_ENCODING}')")
+    parser.add_argument("--validate-every", type=int, default=VALIDATE_EVERY, metavar="N",
+                        help="check 1 in N responses against its route schema (1: all, 0: none); "
+                             "raise it for high-throughput load runs")
+    parser.add_argument("--workers", type=int, default=FUNCTIONAL_WORKERS,
+                        help="tests the functional suite runs at once (1 runs them in order)")
+    parser.add_argument("--users", type=int, default=0,
+                        help="run in load mode with this many virtual users")
+    parser.add_argument("--concurrency", type=int, default=0,
+                        help="virtual users running at once in load mode (default: --users)")
+    parser.add_argument("--duration", type=float, default=0,
+                        help="keep replaying journeys for this many seconds in load mode")
+    parser.add_argument("--event-log", metavar="PATH",
+                        help="write one JSON line per request to PATH-0001.jsonl, ... "
+                             "(analyse with analyze_events.py)")
+    parser.add_argument("--event-log-max-mb", type=float, default=EVENT_LOG_MAX_MB,
+                        help="size at which the event log moves on to a new file")
+    parser.add_argument("--profile", action="store_true",
+                        help="profile the harness: per-endpoint client CPU next to server time, "
+                             "top functions and a CPU flamegraph")
+    parser.add_argument("--profile-interval-ms", type=float, default=PROFILE_INTERVAL_MS,
+                        help="stack sampling interval for --profile")
+    parser.add_argument("--profile-output", default=PROFILE_OUTPUT, metavar="PATH",
+                        help="collapsed-stack file --profile writes for flamegraph tools")
+    parser.add_argument("--metrics-json", metavar="PATH",
+                        help="write per-endpoint latency metrics and histograms to this file")
+    parser.add_argument("--baseline-file", default=BASELINE_FILE,
+                        help="local file holding saved benchmark baselines")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="save this run's metrics as the baseline for the current commit")
+    parser.add_argument("--compare-baseline", metavar="REF",
+                        help="compare against a saved baseline ('latest' or a commit) and "
+                             "exit non-zero on regressions")
+    parser.add_argument("--regression-threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="relative p95 increase that counts as a regression (default 0.10)")
+    parser.add_argument("--alpha", type=float, default=REGRESSION_ALPHA,
+                        help="significance level of the Mann-Whitney test")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="split load mode across this many worker processes")
+    parser.add_argument("--seed-users", type=int, default=0,
+                        help="register and assess this many users, caching their tokens")
+    parser.add_argument("--seed-concurrency", type=int, default=SEED_CONCURRENCY,
+                        help="parallel registrations while seeding")
+    parser.add_argument("--token-cache", default=TOKEN_CACHE_FILE,
+                        help="file caching email -> token for seeded users")
+    parser.add_argument("--reuse-tokens", action="store_true",
+                        help="start load, scenario and open-loop runs from cached users "
+                             "instead of registering new ones")
+    parser.add_argument("--scenario", metavar="PATH",
+                        help="run a scenario file (weighted action mix, think times, sessions)")
+    parser.add_argument("--chat-stream-sessions", type=int, default=0,
+                        help="benchmark streamed chat replies with this many concurrent sessions")
+    parser.add_argument("--catalog-jobs", type=int, default=0,
+                        help="catalog benchmark: grow the job catalog to this size and walk its pages")
+    parser.add_argument("--catalog-courses", type=int, default=10_000,
+                        help="course catalog size for the catalog benchmark")
+    parser.add_argument("--page-size", type=int, default=CATALOG_PAGE_SIZE,
+                        help="items per page in the catalog benchmark (the API caps it at 100)")
+    parser.add_argument("--write-burst", type=int, default=0, metavar="MESSAGES",
+                        help="send this many concurrent chat messages, then check they were all persisted")
+    parser.add_argument("--open-loop", choices=sorted(OPEN_LOOP_TARGETS),
+                        help="open-loop mode: send requests to this endpoint at --rate")
+    parser.add_argument("--rate", type=float, default=10.0,
+                        help="open-loop arrival rate in requests per second (journeys per second with --soak)")
+    parser.add_argument("--arrival", choices=["fixed", "poisson", "step"], default="fixed",
+                        help="open-loop arrival process")
+    parser.add_argument("--step-rate", type=float, default=10.0,
+                        help="rate added at each step of a step ramp")
+    parser.add_argument("--step-interval", type=float, default=10.0,
+                        help="seconds per step of a step ramp")
+    parser.add_argument("--max-in-flight", type=int, default=256,
+                        help="worker threads available to the open-loop generator")
+    parser.add_argument("--capacity-search", nargs="+", choices=sorted(OPEN_LOOP_TARGETS), metavar="TARGET",
+                        help="step up concurrency against these endpoints until throughput levels off "
+                             f"or p99 passes the SLO ({', '.join(sorted(OPEN_LOOP_TARGETS))})")
+    parser.add_argument("--start-concurrency", type=int, default=1,
+                        help="first concurrency step of the capacity search (doubled each step)")
+    parser.add_argument("--max-concurrency", type=int, default=CAPACITY_MAX_CONCURRENCY,
+                        help="last concurrency step of the capacity search")
+    parser.add_argument("--step-duration", type=float, default=CAPACITY_STEP_DURATION,
+                        help="seconds per capacity search step")
+    parser.add_argument("--slo-p99-ms", type=float, default=CAPACITY_SLO_P99_MS,
+                        help="p99 latency SLO for the capacity search")
+    parser.add_argument("--max-error-rate", type=float, default=CAPACITY_MAX_ERROR_RATE,
+                        help="error rate at which the capacity search stops")
+    parser.add_argument("--soak", type=float, default=0, metavar="HOURS",
+                        help="soak mode: run the journey at --rate journeys/s for this many hours")
+    parser.add_argument("--sample-interval", type=float, default=SOAK_SAMPLE_INTERVAL,
+                        help="seconds between soak samples")
+    parser.add_argument("--server-pid", type=int,
+                        help="server process sampled in soak mode (default: the local process "
+                             "listening on --base-url's port)")
+    parser.add_argument("--soak-json", metavar="PATH",
+                        help="write the soak samples and trend results to a JSON file")
+    parser.add_argument("--cold-start", action="store_true",
+                        help="measure first-request vs warm latency of every route")
+    parser.add_argument("--server-command", metavar="CMD",
+                        help="cold start: shell command that starts the API server on --base-url's port; "
+                             "it is restarted for every run (without it, the server must be freshly started)")
+    parser.add_argument("--cold-start-runs", type=int, default=COLD_START_RUNS,
+                        help="server restarts measured with --server-command")
+    parser.add_argument("--warm-samples", type=int, default=COLD_START_WARM_SAMPLES,
+                        help="passes over every route after the first, per cold start run")
+    parser.add_argument("--wait-ready", action="store_true",
+                        help="cold start: wait for /api/ready to pass before the first request")
+    parser.add_argument("--auth-bench", type=int, default=0, metavar="REQUESTS",
+                        help="auth overhead benchmark: this many anonymous and reused-token requests "
+                             f"per route to {' and '.join(AUTH_BENCH_ROUTES)}")
+    parser.add_argument("--auth-bench-tokens", type=int, default=AUTH_BENCH_FRESH_TOKENS,
+                        help="requests per route with a token the server has not verified yet")
+    parser.add_argument("--mock-server", action="store_true",
+                        help="run against the in-process stand-in API instead of --base-url")
+    parser.add_argument("--mock-latency-ms", type=float, default=0.0,
+                        help="latency the stand-in API adds to every request")
+    parser.add_argument("--mock-error-rate", type=float, default=0.0,
+                        help="fraction of stand-in API requests that fail with HTTP 500")
+    parser.add_argument("--mock-chunk-delay-ms", type=float, default=0.0,
+                        help="delay the stand-in API adds before each streamed chat chunk")
+    if supported is not None:
+        for action in parser._actions:
+            if action.dest not in supported and action.dest != "help":
+                action.help = argparse.SUPPRESS
+    args = parser.parse_args(argv)
+    if supported is not None:
+        for dest, value in vars(args).items():
+            if dest not in supported and value != parser.get_default(dest):
+                parser.error(f"--{dest.replace('_', '-')} is not supported by {parser.prog}")
+    if args.rate <= 0:
+        parser.error("--rate must be greater than 0")
+    if args.step_interval <= 0:
+        parser.error("--step-interval must be greater than 0")
+    if args.open_loop and args.arrival == "step":
+        # The last step starts before the run ends; its rate must still be positive
+        duration = args.duration or OPEN_LOOP_DURATION
+        last_step = math.ceil(duration / args.step_interval) - 1
+        if args.rate + args.step_rate * last_step <= 0:
+            parser.error(f"--step-rate {args.step_rate:g} drives the rate to "
+                         f"{args.rate + args.step_rate * last_step:g}/s by step {last_step}; "
+                         "it must stay above 0 for the whole --duration")
+    return args
+
+def start_mock_target(args):
+    """Start the stand-in API when --mock-server is set and point args.base_url at it"""
+    if not args.mock_server:
+        return None
+    from mock_api_server import start_mock_server
+    server, args.base_url = start_mock_server(latency_ms=args.mock_latency_ms,
+                                              error_rate=args.mock_error_rate,
+                                              chunk_delay_ms=args.mock_chunk_delay_ms)
+    print(f"🧪 Using in-process mock API at {args.base_url}")
+    return server
+
+def stop_mock_target(server):
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+
+def main(argv=None):
+    args = parse_args(argv)
+    schema_checks.every = args.validate_every
+    mock_server = start_mock_target(args)
+    concurrency = args.concurrency or args.users or args.chat_stream_sessions or args.workers
+    if args.open_loop:
+        concurrency = args.max_in_flight
+    if args.write_burst:
+        concurrency = args.concurrency or WRITE_BURST_CONCURRENCY
+    if args.capacity_search:
+        concurrency = args.max_concurrency
+    if args.soak:
+        concurrency = args.max_in_flight
+    client_options = dict(base_url=args.base_url, retries=args.retries, timeout=args.timeout,
+                          connect_timeout=args.connect_timeout, accept_encoding=args.accept_encoding)
+    if args.seed_users:
+        concurrency = max(concurrency, args.seed_concurrency)
+    configure_client(pool_size=max(args.pool_size, concurrency), **client_options)
+    if args.reuse_tokens:
+        cached_users[:] = load_token_cache(args.token_cache, args.base_url)
+        print(f"🔑 Loaded {len(cached_users)} cached users from {args.token_cache}")
+    if args.event_log:
+        try:
+            start_event_log(args.event_log, args.event_log_max_mb)
+        except OSError as e:
+            print(f"🚨 Cannot write the event log: {e}")
+            api_client.close()
+            stop_mock_target(mock_server)
+            return 2
+    if args.profile:
+        if args.users and args.processes > 1:
+            print("⚠️  --profile only samples this process, not the load worker processes")
+        start_profiler(args.profile_interval_ms)
+    try:
+        if args.seed_users:
+            seed_users(args.seed_users, args.seed_concurrency, args.token_cache, args.base_url)
+            return 0
+        if args.scenario:
+            try:
+                scenario = load_scenario(args.scenario)
+            except ValueError as e:
+                print(f"🚨 Invalid scenario {args.scenario}: {e}")
+                return 2
+            scenario_concurrency = args.concurrency or args.users or scenario.get(
+                "concurrency", scenario.get("users", 10))
+            configure_client(pool_size=max(args.pool_size, scenario_concurrency), **client_options)
+            run_scenario(scenario, args.users, args.concurrency, args.duration)
+            mode = "scenario"
+        elif args.chat_stream_sessions:
+            run_chat_stream_benchmark(args.chat_stream_sessions,
+                                      args.concurrency or args.chat_stream_sessions)
+            mode = "chat-stream"
+        elif args.catalog_jobs:
+            run_catalog_benchmark(args.catalog_jobs, args.catalog_courses, args.page_size)
+            mode = "catalog"
+        elif args.write_burst:
+            persisted = run_write_burst(args.write_burst, args.users or WRITE_BURST_USERS, concurrency)
+            return report_run(args, "write-burst") or (0 if persisted else 1)
+        elif args.cold_start:
+            if run_cold_start(args.server_command, args.cold_start_runs, args.warm_samples,
+                              args.wait_ready, args.base_url) is None:
+                return 1
+            mode = "cold-start"
+        elif args.auth_bench:
+            if run_auth_bench(args.auth_bench, args.auth_bench_tokens) is None:
+                return 1
+            mode = "auth-bench"
+        elif args.soak:
+            soak = run_soak(args.soak, args.rate, args.users or 10, args.sample_interval, args.server_pid,
+                            args.max_in_flight, args.base_url, args.alpha)
+            if soak is None:
+                return 1
+            samples, trends = soak
+            if args.soak_json:
+                with open(args.soak_json, "w") as f:
+                    json.dump({"base_url": args.base_url, "samples": samples,
+                               "trends": [dict(zip(("series", "first", "last", "slope_per_hour", "p_value",
+                                                    "flagged"), trend)) for trend in trends]}, f, indent=2)
+                print(f"📝 Soak samples written to {args.soak_json}")
+            return report_run(args, "soak") or (1 if any(trend[-1] for trend in trends) else 0)
+        elif args.capacity_search:
+            run_capacity_search(args.capacity_search, args.users or 10, args.start_concurrency,
+                                args.max_concurrency, args.step_duration, args.slo_p99_ms,
+                                args.max_error_rate)
+            mode = "capacity"
+        elif args.open_loop:
+            run_open_loop(args.open_loop, args.rate, args.duration or OPEN_LOOP_DURATION, args.arrival,
+                          args.step_rate, args.step_interval, args.users or 10, args.max_in_flight)
+            mode = "open-loop"
+        elif args.users and args.processes > 1:
+            # Each worker only needs a pool as large as its share of the concurrency
+            client_options["pool_size"] = max(args.pool_size, -(-concurrency // args.processes))
+            run_multiprocess_load_test(args.processes, client_options, args.users, concurrency,
+                                       args.duration, args.event_log and (args.event_log, args.event_log_max_mb))
+            mode = "load"
+        elif args.users:
+            run_load_test(args.users, concurrency, args.duration)
+            mode = "load"
+        else:
+            results = run_all_tests(args.workers)
+            return report_run(args, "functional") or (0 if all(passed for _, passed in results) else 1)
+        return report_run(args, mode)
+    finally:
+        profile = stop_profiler()
+        if profile is not None:
+            print_profile_summary(profile, args.profile_output)
+        print_event_log_summary(stop_event_log())
+        api_client.close()
+        stop_mock_target(mock_server)
 
 if __name__ == "__main__":
-    run_all_tests()
\ No newline at end of file
+    sys.exit(main())
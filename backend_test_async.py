@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+EmpowerYouth AI Career Coach - Async Backend API Testing
+asyncio/httpx variant of backend_test.py that shares its response checks
+"""
+
+import asyncio
+import json
+import sys
+import time
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+import backend_test as bt
+from backend_test import (
+    ALT_ASSESSMENT_DATA,
+    ASSESSMENT_DATA,
+    DASHBOARD_FIELDS,
+    CHAT_TEST_MESSAGES,
+    PROTECTED_ENDPOINTS,
+    LoadResults,
+    UserState,
+    chat_request_data,
+    check_auth_me,
+    check_auth_required,
+    check_career_assessment,
+    check_chat_message,
+    check_courses,
+    check_dashboard,
+    check_dashboard_cache_hits,
+    check_dashboard_freshness,
+    check_duplicate_registration,
+    check_invalid_token,
+    check_job_application,
+    check_sparse_fields,
+    check_jobs,
+    check_root_endpoint,
+    check_streaming_chat,
+    check_user_registration,
+    first_job_id,
+    log_cache_stats,
+    log_test,
+    parse_chat_stream_line,
+    print_header,
+    print_latency_summary,
+    print_load_summary,
+    print_summary,
+    require_token,
+    run_check,
+)
+
+async_client = None
+
+# backend_test.py options this harness implements; the other modes are sync-only
+SUPPORTED_OPTIONS = {
+    "base_url", "pool_size", "retries", "timeout", "connect_timeout", "accept_encoding",
+    "validate_every", "users", "concurrency", "duration", "event_log", "event_log_max_mb",
+    "metrics_json", "baseline_file", "save_baseline", "compare_baseline", "regression_threshold", "alpha",
+    "mock_server", "mock_latency_ms", "mock_error_rate", "mock_chunk_delay_ms",
+}
+
+class AsyncApiClient:
+    """Shared httpx connection pool for all async tests"""
+
+    def __init__(self, base_url=bt.BASE_URL, pool_size=bt.POOL_SIZE, retries=bt.CONNECT_RETRIES,
+                 timeout=bt.REQUEST_TIMEOUT, connect_timeout=bt.CONNECT_TIMEOUT,
+                 accept_encoding=bt.ACCEPT_ENCODING):
+        self.base_url = base_url
+        limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        # httpx transport retries only cover connection failures, matching ApiClient;
+        # requests queue for a free connection instead of timing out in the pool
+        transport = httpx.AsyncHTTPTransport(retries=retries, limits=limits)
+        self.client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(timeout, connect=connect_timeout, pool=None),
+            headers={"Accept-Encoding": accept_encoding},
+        )
+
+    async def request(self, method, endpoint, data=None, headers=None, stream=False):
+        """Like ApiClient.request: bodies are decompressed here to measure wire_bytes and decode_ms
+
+        Streamed responses are returned unread; the caller must aclose() them.
+        """
+        url = f"{self.base_url}{endpoint}"
+        request = self.client.build_request(method, url, json=data, headers=headers)
+        response = await self.client.send(request, stream=True)
+        if stream:
+            return response
+        try:
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+        finally:
+            await response.aclose()
+        start = time.perf_counter()
+        try:
+            response._content = bt.decode_body(raw, response.headers.get("Content-Encoding"))
+        except bt.DECODE_ERRORS as e:
+            raise httpx.DecodingError(f"Could not decode body: {e}", request=request) from e
+        response.decode_ms = (time.perf_counter() - start) * 1000
+        response.wire_bytes = len(raw)
+        return response
+
+    async def close(self):
+        await self.client.aclose()
+
+async def make_request(method, endpoint, data=None, headers=None, auth_required=False, state=None,
+                       stream=False):
+    """Async counterpart of backend_test.make_request"""
+    state = state or bt.default_state
+
+    if auth_required and state.auth_token:
+        if not headers:
+            headers = {}
+        headers["Authorization"] = f"Bearer {state.auth_token}"
+
+    if method not in ("GET", "POST", "PUT", "DELETE"):
+        raise ValueError(f"Unsupported method: {method}")
+
+    # Streamed responses return once headers arrive, so they are kept apart
+    label = f"{endpoint} (stream)" if stream else endpoint
+    started_at = time.time()
+    start = time.perf_counter()
+    try:
+        response = await async_client.request(method, endpoint, data=data, headers=headers, stream=stream)
+    except httpx.HTTPError as e:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        bt.metrics.record(method, label, elapsed_ms, None)
+        if bt.event_log is not None:
+            bt.event_log.emit(bt.request_event(started_at, state, method, label, None, elapsed_ms, None,
+                                               type(e).__name__))
+        if bt.VERBOSE:
+            print(f"Request failed: {e!r}")
+        return None
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    phases = bt.phase_breakdown(elapsed_ms, response.headers.get("Server-Timing"))
+    transfer = None
+    if not stream:
+        transfer = (response.wire_bytes, len(response.content), response.decode_ms)
+    bt.metrics.record(method, label, elapsed_ms, response.status_code, phases, transfer)
+    if bt.event_log is not None:
+        error = bt.response_error(response) if not stream else None
+        bt.event_log.emit(bt.request_event(started_at, state, method, label, response.status_code, elapsed_ms,
+                                           response.wire_bytes if not stream else None, error))
+    return response
+
+async def test_root_endpoint():
+    """Test the root API endpoint"""
+    print_header("Root API Endpoint")
+    response = await make_request("GET", "/")
+    return run_check(check_root_endpoint, response)
+
+async def test_user_registration(state=None):
+    """Test user registration endpoint"""
+    state = state or bt.default_state
+    print_header("User Registration System")
+    response = await make_request("POST", "/auth/register", state.user_data, state=state)
+    return run_check(check_user_registration, response, state)
+
+async def test_duplicate_registration(state=None):
+    """Test duplicate email handling"""
+    state = state or bt.default_state
+    print_header("Duplicate Email Handling")
+    response = await make_request("POST", "/auth/register", state.user_data, state=state)
+    return run_check(check_duplicate_registration, response)
+
+async def test_auth_me_endpoint(state=None):
+    """Test the /auth/me endpoint"""
+    state = state or bt.default_state
+    print_header("Authentication Token Validation")
+    if not require_token("Auth Me Endpoint", state):
+        return False
+    response = await make_request("GET", "/auth/me", auth_required=True, state=state)
+    return run_check(check_auth_me, response, state)
+
+async def test_invalid_token():
+    """Test invalid token handling"""
+    print_header("Invalid Token Handling")
+    headers = {"Authorization": "Bearer invalid_token_123"}
+    response = await make_request("GET", "/auth/me", headers=headers)
+    return run_check(check_invalid_token, response)
+
+async def test_career_assessment(state=None):
+    """Test career assessment submission"""
+    state = state or bt.default_state
+    print_header("Career Assessment API")
+    if not require_token("Career Assessment", state):
+        return False
+    response = await make_request("POST", "/assessment/submit", ASSESSMENT_DATA, auth_required=True, state=state)
+    return run_check(check_career_assessment, response)
+
+async def test_dashboard_api(state=None):
+    """Test personalized dashboard API"""
+    state = state or bt.default_state
+    print_header("Personalized Dashboard API")
+    if not require_token("Dashboard API", state):
+        return False
+    response = await make_request("GET", "/dashboard", auth_required=True, state=state)
+    return run_check(check_dashboard, response)
+
+async def test_dashboard_cache(state=None):
+    """Hammer the dashboard, then check a new assessment invalidates the cached recommendations"""
+    state = state or bt.default_state
+    print_header("Dashboard Recommendation Cache")
+    if not require_token("Dashboard Cache", state):
+        return False
+
+    # Resubmitting invalidates the cache, so the first read is a miss to compare hits against
+    await make_request("POST", "/assessment/submit", ASSESSMENT_DATA, auth_required=True, state=state)
+    # Sequential so hit latencies are not inflated by queueing
+    samples = []
+    for _ in range(bt.DASHBOARD_CACHE_PROBES):
+        start = time.perf_counter()
+        response = await make_request("GET", "/dashboard", auth_required=True, state=state)
+        samples.append((response, (time.perf_counter() - start) * 1000))
+    if not run_check(check_dashboard_cache_hits, samples):
+        return False
+
+    submit_response = await make_request("POST", "/assessment/submit", ALT_ASSESSMENT_DATA, auth_required=True, state=state)
+    response = await make_request("GET", "/dashboard", auth_required=True, state=state)
+    fresh = run_check(check_dashboard_freshness, submit_response, response)
+    log_cache_stats(await make_request("GET", "/cache/stats"))
+    return fresh
+
+async def test_sparse_fields(state=None):
+    """Test ?fields= projections on the dashboard and jobs listing"""
+    state = state or bt.default_state
+    print_header("Sparse Fieldsets")
+    if not require_token("Sparse Fieldsets", state):
+        return False
+    dashboard_response, jobs_response = await asyncio.gather(
+        make_request("GET", f"/dashboard?fields={','.join(DASHBOARD_FIELDS)}", auth_required=True, state=state),
+        make_request("GET", "/jobs?fields=title", auth_required=True, state=state),
+    )
+    return run_check(check_sparse_fields, dashboard_response, jobs_response)
+
+async def test_ai_chatbot(state=None):
+    """Test AI chatbot API"""
+    state = state or bt.default_state
+    print_header("AI Chatbot API")
+    if not require_token("AI Chatbot", state):
+        return False
+
+    # Messages share a session, so they are sent one after another
+    for i, test_case in enumerate(CHAT_TEST_MESSAGES):
+        response = await make_request("POST", "/chat", chat_request_data(test_case, state), auth_required=True, state=state)
+        if not run_check(check_chat_message, i, test_case, response, state):
+            return False
+
+    log_test("AI Chatbot Overall", "PASS", "Chat functionality working with mock responses")
+    return True
+
+async def read_chat_stream(response, started):
+    """Async counterpart of backend_test.read_chat_stream"""
+    events = []
+    event = None
+    try:
+        async for line in response.aiter_lines():
+            event = parse_chat_stream_line(line, event, events, started)
+    except (httpx.HTTPError, json.JSONDecodeError):
+        events.append(("error", {"error": "Broken event stream"}, time.perf_counter() - started))
+    finally:
+        await response.aclose()
+    return events
+
+async def stream_chat_message(message, state):
+    """Send one streamed chat message; returns (response, events)"""
+    data = {"message": message, "language": "en", "sessionId": state.session_id, "stream": True}
+    started = time.perf_counter()
+    response = await make_request("POST", "/chat", data, auth_required=True, state=state, stream=True)
+    if response is None:
+        return None, []
+    if response.status_code != 200:
+        await response.aclose()
+        return response, []
+    events = await read_chat_stream(response, started)
+    if events and events[0][0] == "session":
+        state.session_id = events[0][1].get("sessionId", state.session_id)
+    return response, events
+
+async def test_streaming_chat(state=None):
+    """Test streamed chat replies (server-sent events)"""
+    state = state or bt.default_state
+    print_header("Streaming Chat API")
+    if not require_token("Streaming Chat", state):
+        return False
+    response, events = await stream_chat_message(CHAT_TEST_MESSAGES[0]["message"], state)
+    return run_check(check_streaming_chat, response, events)
+
+async def test_jobs_api(state=None):
+    """Test jobs listing API"""
+    state = state or bt.default_state
+    print_header("Jobs API")
+    if not require_token("Jobs API", state):
+        return False
+    response = await make_request("GET", "/jobs", auth_required=True, state=state)
+    return run_check(check_jobs, response)
+
+async def test_courses_api(state=None):
+    """Test courses listing API"""
+    state = state or bt.default_state
+    print_header("Courses API")
+    if not require_token("Courses API", state):
+        return False
+    response = await make_request("GET", "/courses", auth_required=True, state=state)
+    return run_check(check_courses, response)
+
+async def test_job_application(state=None):
+    """Test job application API"""
+    state = state or bt.default_state
+    print_header("Job Application API")
+    if not require_token("Job Application", state):
+        return False
+
+    jobs_response = await make_request("GET", "/jobs", auth_required=True, state=state)
+    job_id = first_job_id(jobs_response)
+    if job_id is None:
+        return False
+
+    response = await make_request("POST", "/apply", {"jobId": job_id}, auth_required=True, state=state)
+    return run_check(check_job_application, response)
+
+async def test_authentication_required_endpoints():
+    """Test that protected endpoints require authentication"""
+    print_header("Authentication Required Endpoints")
+
+    # The probes are independent, so they are sent concurrently
+    responses = await asyncio.gather(*(
+        make_request(method, endpoint, {"test": "data"} if method == "POST" else None)
+        for method, endpoint in PROTECTED_ENDPOINTS
+    ))
+    results = [run_check(check_auth_required, endpoint, response)
+               for (_, endpoint), response in zip(PROTECTED_ENDPOINTS, responses)]
+    return all(results)
+
+async def run_all_tests():
+    """Run all backend tests on the async client"""
+    print("🚀 Starting EmpowerYouth Backend API Tests (async)")
+    print("=" * 80)
+
+    test_results = []
+
+    print("\n🔥 HIGH PRIORITY TESTS")
+    test_results.append(("Root Endpoint", await test_root_endpoint()))
+    test_results.append(("User Registration", await test_user_registration()))
+    test_results.append(("Duplicate Email Handling", await test_duplicate_registration()))
+    test_results.append(("Auth Token Validation", await test_auth_me_endpoint()))
+    test_results.append(("Invalid Token Handling", await test_invalid_token()))
+    test_results.append(("Career Assessment", await test_career_assessment()))
+    test_results.append(("Dashboard API", await test_dashboard_api()))
+    test_results.append(("Dashboard Cache", await test_dashboard_cache()))
+    test_results.append(("Sparse Fieldsets", await test_sparse_fields()))
+
+    print("\n⚡ MEDIUM PRIORITY TESTS")
+    test_results.append(("AI Chatbot", await test_ai_chatbot()))
+    test_results.append(("Streaming Chat", await test_streaming_chat()))
+    test_results.append(("Jobs API", await test_jobs_api()))
+    test_results.append(("Courses API", await test_courses_api()))
+    test_results.append(("Job Application", await test_job_application()))
+    test_results.append(("Authentication Protection", await test_authentication_required_endpoints()))
+
+    print_summary(test_results)
+    print_latency_summary()
+    return test_results
+
+# Async counterparts of backend_test.USER_JOURNEY
+USER_JOURNEY = [
+    ("User Registration", test_user_registration),
+    ("Career Assessment", test_career_assessment),
+    ("Dashboard API", test_dashboard_api),
+    ("AI Chatbot", test_ai_chatbot),
+    ("Jobs API", test_jobs_api),
+    ("Courses API", test_courses_api),
+    ("Job Application", test_job_application),
+]
+
+async def run_user_journey(state):
+    """Run the journey for one user; registration is skipped once the user has a token"""
+    results = []
+    for name, test in USER_JOURNEY:
+        if test is test_user_registration and state.auth_token:
+            continue
+        try:
+            passed = bool(await test(state))
+        except bt.MALFORMED_RESPONSE_ERRORS as e:
+            # Parsing outside the checks, e.g. picking the job to apply to
+            log_test(name, "FAIL", f"Malformed response: {e!r}")
+            passed = False
+        results.append((name, passed))
+    return results
+
+async def run_load_test(users, concurrency=None, duration=0):
+    """Replay the user journey with N virtual users as asyncio tasks, C at a time"""
+    concurrency = concurrency or users
+    bt.VERBOSE = False
+
+    print("🚀 Starting EmpowerYouth Load Test (async)")
+    print("=" * 80)
+    print(f"Virtual users: {users}, concurrency: {concurrency}, "
+          f"duration: {f'{duration}s' if duration else 'single pass'}")
+
+    results = LoadResults()
+    slots = asyncio.Semaphore(concurrency)
+    start = time.monotonic()
+    deadline = start + duration if duration else None
+
+    async def virtual_user():
+        state = UserState()
+        while True:
+            async with slots:
+                results.record(await run_user_journey(state))
+            if deadline is None or time.monotonic() >= deadline:
+                return
+
+    try:
+        await asyncio.gather(*(virtual_user() for _ in range(users)))
+    finally:
+        bt.VERBOSE = True
+
+    print_load_summary(results, time.monotonic() - start)
+    print_latency_summary()
+    return results
+
+async def run(args):
+    global async_client
+    mock_server = bt.start_mock_target(args)
+    if args.event_log:
+        try:
+            bt.start_event_log(args.event_log, args.event_log_max_mb)
+        except OSError as e:
+            print(f"🚨 Cannot write the event log: {e}")
+            bt.stop_mock_target(mock_server)
+            return 2
+    concurrency = args.concurrency or args.users
+    async_client = AsyncApiClient(base_url=args.base_url, pool_size=max(args.pool_size, concurrency),
+                                  retries=args.retries, timeout=args.timeout,
+                                  connect_timeout=args.connect_timeout,
+                                  accept_encoding=args.accept_encoding)
+    try:
+        if args.users:
+            await run_load_test(args.users, concurrency, args.duration)
+            return bt.report_run(args, "load")
+        results = await run_all_tests()
+        return bt.report_run(args, "functional") or (0 if all(passed for _, passed in results) else 1)
+    finally:
+        bt.print_event_log_summary(bt.stop_event_log())
+        await async_client.close()
+        bt.stop_mock_target(mock_server)
+
+def main(argv=None):
+    if httpx is None:
+        sys.exit("backend_test_async.py requires httpx: pip install httpx")
+    args = bt.parse_args(argv, supported=SUPPORTED_OPTIONS)
+    bt.schema_checks.every = args.validate_every
+    return asyncio.run(run(args))
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+EmpowerYouth AI Career Coach - Catalog Data
+Seed job and course catalogs and the assessment skill rules of route.js,
+shared by the stand-in API server and the batch skill matcher
+"""
+
+from datetime import datetime, timezone
+
+def now_iso():
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+def catalog_id(prefix, n):
+    """Stable catalog id that sorts in insertion order, like catalogId in route.js"""
+    return f"{prefix}-{n:08d}"
+
+def generate_mock_jobs(user_skills=None):
+    jobs = [
+        {"title": "Frontend Developer", "company": "TechStart India", "location": "Mumbai",
+         "salary": "3-6 LPA", "type": "Full-time", "remote": True,
+         "skills": ["JavaScript", "React", "CSS", "HTML"],
+         "description": "Build modern web applications using React and JavaScript",
+         "matchPercentage": 85},
+        {"title": "Data Analyst", "company": "Analytics Pro", "location": "Bangalore",
+         "salary": "4-7 LPA", "type": "Full-time", "remote": False,
+         "skills": ["Python", "SQL", "Excel", "Data Analysis"],
+         "description": "Analyze data and create insights for business decisions",
+         "matchPercentage": 78},
+        {"title": "Digital Marketing Executive", "company": "MarketGrow", "location": "Delhi",
+         "salary": "2.5-4 LPA", "type": "Full-time", "remote": True,
+         "skills": ["Digital Marketing", "SEO", "Content Writing", "Social Media"],
+         "description": "Drive digital marketing campaigns and grow online presence",
+         "matchPercentage": 72},
+        {"title": "Sales Associate", "company": "SalesPro India", "location": "Chennai",
+         "salary": "3-5 LPA", "type": "Full-time", "remote": False,
+         "skills": ["Sales", "Communication", "Customer Service", "CRM"],
+         "description": "Drive sales growth and build customer relationships",
+         "matchPercentage": 68},
+        {"title": "Customer Support Specialist", "company": "SupportPlus", "location": "Pune",
+         "salary": "2-4 LPA", "type": "Full-time", "remote": True,
+         "skills": ["Communication", "Problem Solving", "English", "Customer Service"],
+         "description": "Provide excellent customer support via chat and email",
+         "matchPercentage": 75},
+        {"title": "Graphic Designer", "company": "Creative Studio", "location": "Hyderabad",
+         "salary": "2.5-5 LPA", "type": "Full-time", "remote": True,
+         "skills": ["Photoshop", "Illustrator", "Design", "Creativity"],
+         "description": "Create stunning visual designs for digital and print media",
+         "matchPercentage": 70},
+    ]
+    posted_at = now_iso()
+    for n, job in enumerate(jobs, 1):
+        job["id"] = catalog_id("job", n)
+        job["postedAt"] = posted_at
+    return sorted(jobs, key=lambda job: job["matchPercentage"], reverse=True)
+
+def generate_mock_courses():
+    courses = [
+        {"title": "Full Stack Web Development", "provider": "IBM SkillsBuild",
+         "description": "Learn to build complete web applications with modern technologies",
+         "duration": "12 weeks", "price": "Free", "rating": 4.5,
+         "skills": ["JavaScript", "React", "Node.js", "MongoDB"], "level": "Beginner"},
+        {"title": "Data Science Fundamentals", "provider": "IBM SkillsBuild",
+         "description": "Master the basics of data science and analytics",
+         "duration": "8 weeks", "price": "Free", "rating": 4.6,
+         "skills": ["Python", "Statistics", "Machine Learning", "Data Visualization"],
+         "level": "Beginner"},
+        {"title": "Digital Marketing Certification", "provider": "NSDC",
+         "description": "Comprehensive digital marketing skills for career growth",
+         "duration": "6 weeks", "price": "2999", "rating": 4.3,
+         "skills": ["SEO", "Google Ads", "Social Media Marketing", "Analytics"],
+         "level": "Intermediate"},
+        {"title": "Business Communication", "provider": "Coursera",
+         "description": "Improve professional communication skills",
+         "duration": "4 weeks", "price": "1999", "rating": 4.4,
+         "skills": ["Communication", "Presentation", "Email Writing", "English"],
+         "level": "Beginner"},
+        {"title": "Python Programming", "provider": "IBM SkillsBuild",
+         "description": "Learn Python programming from basics to advanced",
+         "duration": "10 weeks", "price": "Free", "rating": 4.7,
+         "skills": ["Python", "Programming", "Data Structures", "Algorithms"],
+         "level": "Beginner"},
+        {"title": "AI and Machine Learning", "provider": "Coursera",
+         "description": "Introduction to AI and ML concepts and applications",
+         "duration": "16 weeks", "price": "4999", "rating": 4.8,
+         "skills": ["Machine Learning", "AI", "Python", "TensorFlow"], "level": "Advanced"},
+    ]
+    return [dict(id=catalog_id("course", n), **course) for n, course in enumerate(courses, 1)]
+
+# (assessment field, answer, skills it implies with their levels), as in generateSkillVector
+SKILL_RULES = [
+    ("skills", "Programming", [("JavaScript", 3), ("Python", 2)]),
+    ("skills", "Communication", [("Communication", 4), ("English", 4)]),
+    ("skills", "Data Analysis", [("Excel", 3), ("SQL", 2)]),
+    ("skills", "Design", [("Photoshop", 3), ("Design", 3)]),
+    ("skills", "Sales", [("Sales", 3), ("Customer Service", 3)]),
+    ("interests", "Technology", [("Problem Solving", 3)]),
+    ("interests", "Business", [("Leadership", 2)]),
+]
+
+# Skill vector of an assessment that matches no rule
+DEFAULT_SKILL_VECTOR = [
+    {"name": "Communication", "level": 3},
+    {"name": "Problem Solving", "level": 3},
+    {"name": "Teamwork", "level": 3},
+]
+
+def generate_skill_vector(assessment_data):
+    skills = []
+    for field, answer, derived in SKILL_RULES:
+        if answer in (assessment_data.get(field) or []):
+            skills.extend({"name": name, "level": level} for name, level in derived)
+    return skills or [dict(skill) for skill in DEFAULT_SKILL_VECTOR]
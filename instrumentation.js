@@ -0,0 +1,36 @@
+const WARMUP_TIMEOUT_MS = 60000
+const WARMUP_RETRY_MS = 250
+
+// Optional warm-up on start (WARMUP_ON_START=true). Next.js calls register()
+// before the server listens, so this keeps requesting /api/ready until the
+// server is up. That compiles the API route in dev, connects the MongoDB pool
+// and builds the indexes before the first user arrives. Load balancers should
+// also use /api/ready as the readiness check, so no traffic is routed to the
+// instance before then.
+export async function register() {
+  if (process.env.NEXT_RUNTIME !== 'nodejs' || process.env.WARMUP_ON_START !== 'true') {
+    return
+  }
+  const url = `http://127.0.0.1:${process.env.PORT || 3000}/api/ready`
+  const started = Date.now()
+
+  async function attempt() {
+    try {
+      const response = await fetch(url)
+      if (response.ok) {
+        const { warmUpMs } = await response.json()
+        console.log(`API warmed up in ${Date.now() - started} ms (${warmUpMs} ms of warm-up work)`)
+        return
+      }
+    } catch {
+      // Not listening yet
+    }
+    if (Date.now() - started < WARMUP_TIMEOUT_MS) {
+      setTimeout(attempt, WARMUP_RETRY_MS)
+    } else {
+      console.error(`API warm-up gave up after ${WARMUP_TIMEOUT_MS} ms`)
+    }
+  }
+
+  setTimeout(attempt, 0)
+}
@@ -0,0 +1,884 @@
+#!/usr/bin/env python3
+"""
+EmpowerYouth AI Career Coach - Local API stand-in
+In-memory Python implementation of app/api/[[...path]]/route.js, so the
+backend tests can run without Next.js or MongoDB
+"""
+
+import argparse
+import base64
+import bisect
+import hashlib
+import hmac
+import json
+import os
+import random
+import socket
+import threading
+import time
+import uuid
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from catalog_data import (
+    catalog_id,
+    generate_mock_courses,
+    generate_mock_jobs,
+    generate_skill_vector,
+    now_iso,
+)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+JWT_SECRET = os.environ.get("JWT_SECRET", "empoweryouth-secret-key-2024")
+TOKEN_TTL = 7 * 24 * 3600
+# Routes whose responses are compressed, and the smallest body worth compressing
+COMPRESSED_ROUTES = {"/dashboard", "/jobs", "/courses"}
+COMPRESSION_MIN_BYTES = 1024
+BROTLI_QUALITY = 4
+DASHBOARD_CACHE_SIZE = int(os.environ.get("DASHBOARD_CACHE_SIZE", "1000"))
+DASHBOARD_CACHE_TTL_MS = int(os.environ.get("DASHBOARD_CACHE_TTL_MS", "300000"))
+AUTH_CACHE_SIZE = int(os.environ.get("AUTH_CACHE_SIZE", "10000"))
+AUTH_CACHE_TTL_MS = int(os.environ.get("AUTH_CACHE_TTL_MS", "300000"))
+USER_CACHE_SIZE = int(os.environ.get("USER_CACHE_SIZE", "10000"))
+USER_CACHE_TTL_MS = int(os.environ.get("USER_CACHE_TTL_MS", "60000"))
+WRITE_BUFFER_MODES = ("off", "ack", "async")
+WRITE_BUFFER_MODE = os.environ.get("WRITE_BUFFER_MODE", "off")
+WRITE_BUFFER_MAX_BATCH = int(os.environ.get("WRITE_BUFFER_MAX_BATCH", "500"))
+WRITE_BUFFER_FLUSH_MS = int(os.environ.get("WRITE_BUFFER_FLUSH_MS", "20"))
+CHAT_HISTORY_LIMIT = 50
+CHAT_HISTORY_MAX_LIMIT = 200
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type, Authorization",
+    "Access-Control-Allow-Credentials": "true",
+}
+
+# JWT helpers (HS256, compatible with jsonwebtoken)
+
+def b64url(raw):
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+def b64url_decode(text):
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+def generate_token(user_id):
+    issued = int(time.time())
+    header = b64url(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+    payload = b64url(json.dumps({"userId": user_id, "iat": issued, "exp": issued + TOKEN_TTL},
+                                separators=(",", ":")).encode())
+    signing_input = f"{header}.{payload}".encode()
+    signature = hmac.new(JWT_SECRET.encode(), signing_input, hashlib.sha256).digest()
+    return f"{header}.{payload}.{b64url(signature)}"
+
+def verify_token(token):
+    """Return the token claims, or None when the signature or expiry is invalid"""
+    try:
+        header, payload, signature = token.split(".")
+        expected = hmac.new(JWT_SECRET.encode(), f"{header}.{payload}".encode(), hashlib.sha256).digest()
+        if not hmac.compare_digest(expected, b64url_decode(signature)):
+            return None
+        claims = json.loads(b64url_decode(payload))
+    except (ValueError, TypeError):
+        return None
+    if claims.get("exp", 0) < time.time():
+        return None
+    return claims
+
+def get_auth_token(headers):
+    auth_header = headers.get("Authorization") or ""
+    if auth_header.startswith("Bearer "):
+        return auth_header[7:]
+    return None
+
+def negotiate_encoding(accept_encoding):
+    """br or gzip by q-value (br on ties, and only with the brotli module), like route.js"""
+    weights = {}
+    for part in (accept_encoding or "").lower().split(","):
+        name, *params = part.strip().split(";")
+        q = next((param.strip()[2:] for param in params if param.strip().startswith("q=")), None)
+        try:
+            weights[name] = float(q) if q is not None else 1.0
+        except ValueError:
+            weights[name] = 0.0
+    candidates = ["br", "gzip"] if brotli else ["gzip"]
+    best = max(candidates, key=lambda encoding: weights.get(encoding, weights.get("*", 0.0)))
+    return best if weights.get(best, weights.get("*", 0.0)) > 0 else None
+
+def compress_body(encoding, body):
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(body) + compressor.flush()
+
+def parse_fields(query):
+    """Top-level keys requested with ?fields=a,b,c, or None for everything"""
+    fields = [field.strip() for field in (query.get("fields") or "").split(",") if field.strip()]
+    return fields or None
+
+def pick_fields(obj, fields):
+    if not fields:
+        return obj
+    return {field: obj[field] for field in fields if field in obj}
+
+CHAT_RESPONSES = [
+    (("resume", "cv"), "Here are some resume tips: 1) Keep it concise and relevant 2) Highlight achievements with numbers 3) Use action verbs 4) Tailor it for each job. Would you like specific advice for any section?"),
+    (("interview",), "Interview preparation tips: 1) Research the company thoroughly 2) Practice common questions 3) Prepare STAR method examples 4) Ask thoughtful questions. What type of interview are you preparing for?"),
+    (("career", "job"), "I can help with career guidance! Based on your profile, I see opportunities in technology and business. What specific career questions do you have?"),
+    (("skill", "learn"), "Skill development is crucial for career growth. Based on current market trends, I recommend focusing on: 1) Digital skills (programming, data analysis) 2) Soft skills (communication, leadership) 3) Industry-specific skills. What area interests you most?"),
+    (("salary", "pay"), "Salary expectations should be based on: 1) Industry standards 2) Your experience level 3) Location 4) Company size. For fresher roles in India, expect 2-6 LPA depending on skills and industry. Would you like specific salary insights?"),
+]
+
+DEFAULT_CHAT_RESPONSE = "I'm here to help with your career journey! You can ask me about job search strategies, resume writing, interview preparation, skill development, or career planning. What would you like to know?"
+
+def generate_chat_response(message, language="en"):
+    lower_message = message.lower()
+    for keywords, reply in CHAT_RESPONSES:
+        if any(keyword in lower_message for keyword in keywords):
+            return reply
+    return DEFAULT_CHAT_RESPONSE
+
+CHAT_STREAM_WORDS = 3
+
+def generate_chat_response_chunks(message, language="en"):
+    words = generate_chat_response(message, language).split(" ")
+    for i in range(0, len(words), CHAT_STREAM_WORDS):
+        chunk = " ".join(words[i:i + CHAT_STREAM_WORDS])
+        yield chunk + " " if i + CHAT_STREAM_WORDS < len(words) else chunk
+
+def sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+def build_dashboard_recommendations(user, user_skills):
+    jobs = generate_mock_jobs([s["skillName"] for s in user_skills])
+    courses = generate_mock_courses()
+    user_skill_names = {s["skillName"].lower() for s in user_skills}
+    recommended_courses = [
+        course for course in courses
+        if any(skill.lower() not in user_skill_names for skill in course["skills"])
+    ][:6]
+    return {
+        "skills": [{"name": s["skillName"], "level": s["level"]} for s in user_skills],
+        "jobs": jobs,
+        "courses": courses,
+        "recommendedCourses": recommended_courses,
+        "profileCompletion": 85 if user.get("assessmentCompleted") else 45,
+    }
+
+class StreamingBody:
+    """Response body sent with chunked transfer encoding, one piece per iteration"""
+
+    def __init__(self, pieces, content_type="text/event-stream; charset=utf-8"):
+        self.pieces = pieces
+        self.content_type = content_type
+
+class ServerTiming:
+    """Per-request phase durations for the Server-Timing header, like createServerTiming in route.js"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = {}
+
+    @contextmanager
+    def measure(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+    def header(self):
+        entries = [f"{name};dur={dur:.2f}" for name, dur in self.phases.items()]
+        entries.append(f"total;dur={(time.perf_counter() - self.started) * 1000:.2f}")
+        return ", ".join(entries)
+
+class LruCache:
+    """Thread-safe bounded LRU cache with per-entry TTL, like createLruCache in route.js
+
+    Invalidated keys keep a tombstone until it expires, so set() drops values
+    computed from reads that started before the invalidation.
+    """
+
+    def __init__(self, max_entries, ttl_ms):
+        self.max_entries = max_entries
+        self.ttl_ms = ttl_ms
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.counters = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+
+    def _store(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.counters["evictions"] += 1
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and entry["expires_at"] <= time.monotonic():
+                del self.entries[key]
+                self.counters["expirations"] += 1
+            elif entry and "invalidated_at" not in entry:
+                self.entries.move_to_end(key)
+                self.counters["hits"] += 1
+                return entry["value"]
+            self.counters["misses"] += 1
+            return None
+
+    def set(self, key, value, read_started_at=None, max_age_ms=None):
+        """max_age_ms shortens the TTL for values that go stale sooner, e.g. tokens close to expiry"""
+        now = time.monotonic()
+        ttl_ms = self.ttl_ms if max_age_ms is None else min(self.ttl_ms, max_age_ms)
+        with self.lock:
+            existing = self.entries.get(key)
+            if (existing and read_started_at is not None and existing.get("invalidated_at", -1) >= read_started_at
+                    and existing["expires_at"] > now):
+                return
+            if ttl_ms <= 0:
+                return
+            self._store(key, {"value": value, "expires_at": now + ttl_ms / 1000.0})
+
+    def invalidate(self, key):
+        now = time.monotonic()
+        with self.lock:
+            self.counters["invalidations"] += 1
+            self._store(key, {"invalidated_at": now, "expires_at": now + self.ttl_ms / 1000.0})
+
+    def stats(self):
+        with self.lock:
+            lookups = self.counters["hits"] + self.counters["misses"]
+            return dict(self.counters, size=len(self.entries), maxEntries=self.max_entries,
+                        ttlMs=self.ttl_ms, hitRate=self.counters["hits"] / lookups if lookups else 0)
+
+class WriteBuffer:
+    """Write-behind buffer over one MemoryStore list, like createWriteBuffer in route.js
+
+    Mode "off" appends each record straight away, "ack" blocks the caller until
+    the batch holding its record is flushed and "async" returns once it is queued.
+    Batches flush at max_batch records or flush_ms after the first pending one.
+    """
+
+    def __init__(self, store, collection, mode=WRITE_BUFFER_MODE, max_batch=WRITE_BUFFER_MAX_BATCH,
+                 flush_ms=WRITE_BUFFER_FLUSH_MS):
+        self.store = store
+        self.collection = collection
+        self.mode = mode if mode in WRITE_BUFFER_MODES else "off"
+        self.max_batch = max_batch
+        self.flush_ms = flush_ms
+        self.lock = threading.Lock()
+        self.pending = []
+        self.timer = None
+        self.counters = {"writes": 0, "written": 0, "failed": 0, "batches": 0, "largestBatch": 0}
+
+    def append(self, records):
+        with self.store.lock:
+            getattr(self.store, self.collection).extend(records)
+
+    def insert(self, record):
+        if self.mode == "off":
+            self.append([record])
+            with self.lock:
+                self.counters["writes"] += 1
+                self.counters["written"] += 1
+            return
+        written = threading.Event()
+        with self.lock:
+            self.counters["writes"] += 1
+            self.pending.append((record, written))
+            full = len(self.pending) >= self.max_batch
+            if not full and self.timer is None:
+                self.timer = threading.Timer(self.flush_ms / 1000.0, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+        if full:
+            self.flush()
+        if self.mode == "ack":
+            written.wait()
+
+    def flush(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            batch, self.pending = self.pending, []
+            if not batch:
+                return
+            self.counters["batches"] += 1
+            self.counters["largestBatch"] = max(self.counters["largestBatch"], len(batch))
+        self.append([record for record, _ in batch])
+        with self.lock:
+            self.counters["written"] += len(batch)
+        for _, written in batch:
+            written.set()
+
+    def stats(self):
+        with self.lock:
+            return dict(self.counters, pending=len(self.pending), mode=self.mode,
+                        maxBatch=self.max_batch, flushMs=self.flush_ms)
+
+CATALOG_PAGE_SIZE = 20
+CATALOG_MAX_PAGE_SIZE = 100
+CATALOG_LOCATIONS = ["Mumbai", "Bangalore", "Delhi", "Chennai", "Pune", "Hyderabad", "Kolkata", "Ahmedabad"]
+
+class Catalog:
+    """In-memory job or course catalog ordered by id, mirroring the indexed collections in route.js"""
+
+    def __init__(self, prefix, built_in, filters):
+        self.prefix = prefix
+        self.filters = filters
+        self.templates = built_in()
+        self.lock = threading.Lock()
+        # Ids are assigned in increasing order, so appending keeps this list sorted
+        self.ids = [item["id"] for item in self.templates]
+        self.items = {item["id"]: item for item in self.templates}
+
+    def generate_item(self, n):
+        template = self.templates[n % len(self.templates)]
+        item = dict(template, id=catalog_id(self.prefix, n), title=f"{template['title']} #{n}")
+        if "location" in template:
+            # Every template appears in every location, a third of them remote
+            rounds = n // len(self.templates)
+            item["location"] = CATALOG_LOCATIONS[rounds % len(CATALOG_LOCATIONS)]
+            item["remote"] = rounds // len(CATALOG_LOCATIONS) % 3 == 0
+        return item
+
+    def seed(self, target):
+        """Grow to at least target entries; returns the resulting size"""
+        with self.lock:
+            for n in range(len(self.ids) + 1, target + 1):
+                item = self.generate_item(n)
+                self.ids.append(item["id"])
+                self.items[item["id"]] = item
+            return len(self.ids)
+
+    def decode_cursor(self, cursor):
+        try:
+            item_id = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        except (ValueError, UnicodeDecodeError):
+            return None
+        prefix, _, number = item_id.partition("-")
+        return item_id if prefix == self.prefix and len(number) >= 8 and number.isdigit() else None
+
+    def matches(self, item, filters):
+        for field, value in filters.items():
+            if field == "skills":
+                if not set(value) & set(item.get("skills", ())):
+                    return False
+            elif item.get(field) != value:
+                return False
+        return True
+
+    def page(self, query):
+        """(items, next cursor) for the listing query parameters, or None for a bad cursor"""
+        try:
+            limit = int(query.get("limit") or CATALOG_PAGE_SIZE)
+        except ValueError:
+            limit = CATALOG_PAGE_SIZE
+        limit = min(max(limit, 1), CATALOG_MAX_PAGE_SIZE)
+
+        filters = {}
+        for field in self.filters:
+            value = query.get(field)
+            if not value:
+                continue
+            if field == "skills":
+                filters[field] = [skill.strip() for skill in value.split(",") if skill.strip()]
+            elif field == "remote":
+                filters[field] = value == "true"
+            else:
+                filters[field] = value
+
+        with self.lock:
+            start = 0
+            if query.get("cursor"):
+                after = self.decode_cursor(query["cursor"])
+                if after is None:
+                    return None
+                start = bisect.bisect_right(self.ids, after)
+            items = []
+            for item_id in self.ids[start:] if filters else self.ids[start:start + limit + 1]:
+                item = self.items[item_id]
+                if self.matches(item, filters):
+                    items.append(item)
+                    if len(items) > limit:
+                        break
+        page = items[:limit]
+        fields = parse_fields(query)
+        if fields:
+            page = [pick_fields(item, ["id"] + fields) for item in page]
+        next_cursor = None
+        if len(items) > limit:
+            next_cursor = base64.urlsafe_b64encode(page[-1]["id"].encode()).decode().rstrip("=")
+        return page, next_cursor
+
+class MemoryStore:
+    """In-memory stand-in for the MongoDB collections used by the API"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.users = {}
+        self.users_by_email = {}
+        self.user_skills = {}
+        self.chat_messages = []
+        self.job_applications = []
+        self.jobs = Catalog("job", generate_mock_jobs, ("location", "remote", "skills"))
+        self.courses = Catalog("course", generate_mock_courses, ("provider", "level", "skills"))
+
+class MockApi:
+    """Route handlers returning (status, payload[, headers]), one per route in route.js
+
+    Handlers take (headers, read_body, timing) and record the same phases
+    route.js reports: auth, parse, db, compute (serialize is timed on send).
+    """
+
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, seed=None, chunk_delay_ms=0.0):
+        self.store = MemoryStore()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.chunk_delay_ms = chunk_delay_ms
+        self.random = random.Random(seed)
+        self.dashboard_cache = LruCache(DASHBOARD_CACHE_SIZE, DASHBOARD_CACHE_TTL_MS)
+        self.token_cache = LruCache(AUTH_CACHE_SIZE, AUTH_CACHE_TTL_MS)
+        self.user_cache = LruCache(USER_CACHE_SIZE, USER_CACHE_TTL_MS)
+        self.write_buffers = {name: WriteBuffer(self.store, name) for name in ("chat_messages", "job_applications")}
+        self.routes = {
+            ("GET", "/"): self.root,
+            ("GET", "/ready"): self.ready,
+            ("GET", "/cache/stats"): self.cache_stats,
+            ("GET", "/writes/stats"): self.write_stats,
+            ("POST", "/auth/register"): self.register,
+            ("GET", "/auth/me"): self.me,
+            ("POST", "/assessment/submit"): self.submit_assessment,
+            ("GET", "/dashboard"): self.dashboard,
+            ("POST", "/chat"): self.chat,
+            ("GET", "/chat/history"): self.chat_history,
+            ("GET", "/jobs"): self.jobs,
+            ("GET", "/courses"): self.courses,
+            ("POST", "/catalog/seed"): self.seed_catalog,
+            ("POST", "/apply"): self.apply,
+        }
+
+    def handle(self, method, route, headers, read_body, timing=None, query=None):
+        """Dispatch a request; read_body() returns the parsed JSON body, query maps parameters to values"""
+        timing = timing or ServerTiming()
+        if self.latency_ms or self.jitter_ms:
+            time.sleep(max(self.latency_ms + self.random.uniform(-self.jitter_ms, self.jitter_ms), 0) / 1000.0)
+        if self.error_rate and self.random.random() < self.error_rate:
+            return 500, {"error": "Internal server error"}
+        handler = self.routes.get((method, route))
+        if handler is None:
+            return 404, {"error": f"Route {route} not found"}
+        try:
+            return handler(headers, lambda: self.parse_body(read_body, timing), timing, query or {})
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return 500, {"error": "Internal server error"}
+
+    @staticmethod
+    def parse_body(read_body, timing):
+        with timing.measure("parse"):
+            return read_body()
+
+    def authenticate(self, headers, timing):
+        """Return (claims, None) or (None, error response) like the verifyToken checks"""
+        token = get_auth_token(headers)
+        if not token:
+            return None, (401, {"error": "Authentication required"})
+        with timing.measure("auth"):
+            claims = self.verify_token(token)
+        if not claims:
+            return None, (401, {"error": "Invalid token"})
+        return claims, None
+
+    def verify_token(self, token):
+        """verify_token through the token cache, like verifyTokenCached in route.js"""
+        claims = self.token_cache.get(token)
+        if claims is None:
+            claims = verify_token(token)
+            if claims:
+                self.token_cache.set(token, claims, max_age_ms=(claims["exp"] - time.time()) * 1000)
+        return claims
+
+    def find_user(self, user_id):
+        read_started_at = time.monotonic()
+        user = self.user_cache.get(user_id)
+        if user is None:
+            user = self.store.users.get(user_id)
+            if user is not None:
+                self.user_cache.set(user_id, user, read_started_at)
+        return user
+
+    def root(self, headers, read_body, timing, query):
+        return 200, {"message": "EmpowerYouth API is running!"}
+
+    def ready(self, headers, read_body, timing, query):
+        # Nothing to warm up in memory
+        return 200, {"ready": True, "warmUpMs": 0}
+
+    def cache_stats(self, headers, read_body, timing, query):
+        # Always enabled here; route.js requires CATALOG_SEED_ENABLED=true
+        return 200, {"dashboard": self.dashboard_cache.stats(), "tokens": self.token_cache.stats(),
+                     "users": self.user_cache.stats()}
+
+    def write_stats(self, headers, read_body, timing, query):
+        # Always enabled here; route.js requires CATALOG_SEED_ENABLED=true
+        return 200, {name: buffer.stats() for name, buffer in self.write_buffers.items()}
+
+    def register(self, headers, read_body, timing, query):
+        body = read_body()
+        name, email, phone, password = (body.get(k) for k in ("name", "email", "phone", "password"))
+        if not name or not email or not phone or not password:
+            return 400, {"error": "All fields are required"}
+
+        user_id = str(uuid.uuid4())
+        user = {
+            "id": user_id,
+            "name": name,
+            "email": email,
+            "phone": phone,
+            "location": body.get("location"),
+            "experience": body.get("experience"),
+            "skillVector": [],
+            "createdAt": now_iso(),
+            "assessmentCompleted": False,
+        }
+        with timing.measure("db"), self.store.lock:
+            if email in self.store.users_by_email:
+                return 400, {"error": "User already exists"}
+            self.store.users[user_id] = user
+            self.store.users_by_email[email] = user_id
+        with timing.measure("auth"):
+            token = generate_token(user_id)
+        return 200, {"user": user, "token": token}
+
+    def me(self, headers, read_body, timing, query):
+        token = get_auth_token(headers)
+        if not token:
+            return 401, {"error": "No token provided"}
+        with timing.measure("auth"):
+            claims = self.verify_token(token)
+        if not claims:
+            return 401, {"error": "Invalid token"}
+        with timing.measure("db"):
+            user = self.find_user(claims["userId"])
+        if user is None:
+            return 404, {"error": "User not found"}
+        return 200, user
+
+    def submit_assessment(self, headers, read_body, timing, query):
+        claims, error = self.authenticate(headers, timing)
+        if error:
+            return error
+        assessment_data = read_body()
+        with timing.measure("compute"):
+            skill_vector = generate_skill_vector(assessment_data)
+        user_id = claims["userId"]
+        with timing.measure("db"), self.store.lock:
+            user = self.store.users.get(user_id)
+            if user is not None:
+                user.update(skillVector=skill_vector, assessmentData=assessment_data,
+                            assessmentCompleted=True, updatedAt=now_iso())
+            self.store.user_skills[user_id] = [
+                {"id": str(uuid.uuid4()), "userId": user_id, "skillName": skill["name"],
+                 "level": skill["level"], "createdAt": now_iso()}
+                for skill in skill_vector
+            ]
+        self.user_cache.invalidate(user_id)
+        self.dashboard_cache.invalidate(user_id)
+        return 200, {"success": True, "skillVector": skill_vector}
+
+    def dashboard(self, headers, read_body, timing, query):
+        claims, error = self.authenticate(headers, timing)
+        if error:
+            return error
+        user_id = claims["userId"]
+        read_started_at = time.monotonic()
+        recommendations = self.dashboard_cache.get(user_id)
+        cache_status = "HIT" if recommendations else "MISS"
+        if recommendations is None:
+            with timing.measure("db"):
+                user = self.find_user(user_id)
+            if user is None:
+                return 404, {"error": "User not found"}
+            with timing.measure("db"):
+                user_skills = self.store.user_skills.get(user_id, [])
+            with timing.measure("compute"):
+                recommendations = build_dashboard_recommendations(user, user_skills)
+            self.dashboard_cache.set(user_id, recommendations, read_started_at)
+
+        return 200, pick_fields({
+            "skills": recommendations["skills"],
+            "jobMatches": recommendations["jobs"],
+            "jobs": recommendations["jobs"],
+            "courses": recommendations["courses"],
+            "recommendedCourses": recommendations["recommendedCourses"],
+            "progress": {
+                "profileCompletion": recommendations["profileCompletion"],
+                "coursesCompleted": self.random.randint(1, 5),
+                "jobApplications": self.random.randint(5, 19),
+            },
+        }, parse_fields(query)), {"X-Cache": cache_status}
+
+    def chat(self, headers, read_body, timing, query):
+        claims, error = self.authenticate(headers, timing)
+        if error:
+            return error
+        body = read_body()
+        message = body.get("message")
+        language = body.get("language") or "en"
+        if not message:
+            return 400, {"error": "Message is required"}
+
+        if body.get("stream"):
+            session_id = body.get("sessionId") or str(uuid.uuid4())
+            return 200, StreamingBody(self.stream_chat(claims["userId"], message, language, session_id))
+
+        with timing.measure("compute"):
+            response = generate_chat_response(message, language)
+        chat_record = {
+            "id": str(uuid.uuid4()),
+            "userId": claims["userId"],
+            "sessionId": body.get("sessionId") or str(uuid.uuid4()),
+            "userMessage": message,
+            "botResponse": response,
+            "language": language,
+            "timestamp": now_iso(),
+        }
+        with timing.measure("db"):
+            self.write_buffers["chat_messages"].insert(chat_record)
+        return 200, {"response": response, "sessionId": chat_record["sessionId"]}
+
+    def chat_history(self, headers, read_body, timing, query):
+        claims, error = self.authenticate(headers, timing)
+        if error:
+            return error
+        session_id = query.get("sessionId")
+        if not session_id:
+            return 400, {"error": "Session ID is required"}
+        try:
+            limit = int(query.get("limit", CHAT_HISTORY_LIMIT))
+        except ValueError:
+            limit = 0
+        limit = min(max(limit, 0), CHAT_HISTORY_MAX_LIMIT)
+        with timing.measure("db"), self.store.lock:
+            messages = [message for message in self.store.chat_messages
+                        if message["userId"] == claims["userId"] and message["sessionId"] == session_id]
+        messages.sort(key=lambda message: message["timestamp"])
+        recent = [{k: v for k, v in message.items() if k != "userId"} for message in messages[-limit:]] if limit else []
+        return 200, {"sessionId": session_id, "count": len(messages), "messages": recent}
+
+    def stream_chat(self, user_id, message, language, session_id):
+        """Server-sent events matching streamChatResponse in route.js"""
+        yield sse_event("session", {"sessionId": session_id})
+        response = ""
+        for chunk in generate_chat_response_chunks(message, language):
+            if self.chunk_delay_ms:
+                time.sleep(self.chunk_delay_ms / 1000.0)
+            response += chunk
+            yield sse_event("chunk", {"text": chunk})
+        self.write_buffers["chat_messages"].insert({
+            "id": str(uuid.uuid4()),
+            "userId": user_id,
+            "sessionId": session_id,
+            "userMessage": message,
+            "botResponse": response,
+            "language": language,
+            "timestamp": now_iso(),
+        })
+        yield sse_event("done", {"response": response, "sessionId": session_id})
+
+    def jobs(self, headers, read_body, timing, query):
+        _, error = self.authenticate(headers, timing)
+        if error:
+            return error
+        return self.list_catalog("jobs", self.store.jobs, query, timing)
+
+    def courses(self, headers, read_body, timing, query):
+        _, error = self.authenticate(headers, timing)
+        if error:
+            return error
+        return self.list_catalog("courses", self.store.courses, query, timing)
+
+    def list_catalog(self, name, catalog, query, timing):
+        with timing.measure("db"):
+            page = catalog.page(query)
+        if page is None:
+            return 400, {"error": "Invalid cursor"}
+        items, next_cursor = page
+        return 200, {name: items, "nextCursor": next_cursor}
+
+    def seed_catalog(self, headers, read_body, timing, query):
+        # Always enabled here; route.js requires CATALOG_SEED_ENABLED=true
+        claims, error = self.authenticate(headers, timing)
+        if error:
+            return error
+        targets = read_body()
+        with timing.measure("db"):
+            sizes = {name: catalog.seed(int(targets.get(name) or 0))
+                     for name, catalog in (("jobs", self.store.jobs), ("courses", self.store.courses))}
+        return 200, dict(success=True, **sizes)
+
+    def apply(self, headers, read_body, timing, query):
+        claims, error = self.authenticate(headers, timing)
+        if error:
+            return error
+        job_id = read_body().get("jobId")
+        if not job_id:
+            return 400, {"error": "Job ID is required"}
+        with timing.measure("db"):
+            job = self.store.jobs.items.get(job_id)
+        if job is None:
+            return 404, {"error": "Job not found"}
+        application = {
+            "id": str(uuid.uuid4()),
+            "userId": claims["userId"],
+            "jobId": job_id,
+            "appliedAt": now_iso(),
+            "status": "applied",
+        }
+        with timing.measure("db"):
+            self.write_buffers["job_applications"].insert(application)
+        return 200, {"success": True, "message": "Application submitted successfully!"}
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 keep-alive handler that forwards /api/* to the server's MockApi"""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_timing(self, timing):
+        # Always sent here; route.js requires SERVER_TIMING_ENABLED=true
+        if timing is not None:
+            self.send_header("Server-Timing", timing.header())
+            self.send_header("Timing-Allow-Origin", "*")
+
+    def send_stream(self, status, stream, timing=None):
+        self.send_response(status)
+        for name, value in CORS_HEADERS.items():
+            self.send_header(name, value)
+        self.send_timing(timing)
+        self.send_header("Content-Type", stream.content_type)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for piece in stream.pieces:
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(piece), piece))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def send_json(self, status, payload, timing=None, headers=None, encoding=False):
+        """encoding is the negotiated Content-Encoding on compressing routes (None for identity)"""
+        headers = dict(headers or {})
+        if timing is not None:
+            with timing.measure("serialize"):
+                body = json.dumps(payload).encode()
+        else:
+            body = json.dumps(payload).encode() if payload is not None else b""
+        if encoding is not False:
+            headers["Vary"] = "Accept-Encoding"
+        if encoding and len(body) >= COMPRESSION_MIN_BYTES:
+            with timing.measure("compress"):
+                body = compress_body(encoding, body)
+            headers["Content-Encoding"] = encoding
+        self.send_response(status)
+        for name, value in CORS_HEADERS.items():
+            self.send_header(name, value)
+        self.send_timing(timing)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if payload is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        self._body_read = True
+        return json.loads(raw) if raw else {}
+
+    def dispatch(self):
+        path, _, query_string = self.path.partition("?")
+        if not path.startswith("/api"):
+            return self.send_json(404, {"error": "Not found"})
+        route = path[len("/api"):].rstrip("/") or "/"
+        self._body_read = False
+        timing = ServerTiming()
+        query = {name: values[0] for name, values in parse_qs(query_string).items()}
+        status, payload, *extra = self.server.api.handle(self.command, route, self.headers, self.read_body,
+                                                         timing, query)
+        if not self._body_read and self.headers.get("Content-Length"):
+            # Drain unread bodies so the keep-alive connection stays in sync
+            self.rfile.read(int(self.headers["Content-Length"]))
+        if isinstance(payload, StreamingBody):
+            self.send_stream(status, payload, timing)
+        else:
+            encoding = False
+            if route in COMPRESSED_ROUTES:
+                encoding = negotiate_encoding(self.headers.get("Accept-Encoding"))
+            self.send_json(status, payload, timing, *extra, encoding=encoding)
+
+    def do_OPTIONS(self):
+        self.send_json(200, None)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = dispatch
+
+class MockApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Large accept backlog so load tests don't hit SYN retries on connect bursts
+    request_queue_size = 1024
+
+    def __init__(self, address, api):
+        super().__init__(address, MockRequestHandler)
+        self.api = api
+
+def start_mock_server(host="127.0.0.1", port=0, **api_options):
+    """Start the stand-in on a background thread; returns (server, base_url)"""
+    server = MockApiServer((host, port), MockApi(**api_options))
+    thread = threading.Thread(target=server.serve_forever, name="mock-api-server", daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_port}/api"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="In-memory stand-in for the EmpowerYouth API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3001)
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="latency added to every request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0,
+                        help="uniform +/- jitter around --latency-ms")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="fraction of requests answered with HTTP 500")
+    parser.add_argument("--seed", type=int, help="seed for injected latency and errors")
+    parser.add_argument("--chunk-delay-ms", type=float, default=0.0,
+                        help="delay before each streamed chat chunk")
+    args = parser.parse_args(argv)
+
+    api = MockApi(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                  error_rate=args.error_rate, seed=args.seed, chunk_delay_ms=args.chunk_delay_ms)
+    server = MockApiServer((args.host, args.port), api)
+    print(f"🧪 Mock EmpowerYouth API listening on http://{args.host}:{server.server_port}/api")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
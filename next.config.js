@@ -6,6 +6,8 @@ const nextConfig = {
   experimental: {
     // Remove if not using Server Components
     serverComponentsExternalPackages: ['mongodb'],
+    // Loads instrumentation.js (optional warm-up on start)
+    instrumentationHook: true,
   },
   webpack(config, { dev }) {
     if (dev) {
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+EmpowerYouth AI Career Coach - Response Schemas
+Response shapes of every API route, declared once and compiled into plain
+Python validator functions for backend_test.py and backend_test_async.py
+"""
+
+import itertools
+
+class Optional:
+    """Object key that may be missing or null"""
+
+    def __init__(self, schema):
+        self.schema = schema
+
+class NonEmpty:
+    """List or string with at least one element"""
+
+    def __init__(self, schema):
+        self.schema = schema
+
+class Const:
+    """Exactly this value, e.g. Const(True) for success flags"""
+
+    def __init__(self, value):
+        self.value = value
+
+# Schema language: str, int, bool and float (any JSON number) match those types,
+# object matches anything, {key: schema} is an object with at least those keys,
+# [schema] is a list whose items all match schema. Types are compared exactly,
+# which is safe because JSON decoders only produce exact dict/list/str/int/float/bool.
+TYPE_NAMES = {str: "string", int: "integer", float: "number", bool: "boolean"}
+
+SKILL = {"name": str, "level": int}
+USER = {
+    "id": str,
+    "name": str,
+    "email": str,
+    "phone": str,
+    "location": Optional(str),
+    "experience": Optional(str),
+    "skillVector": [SKILL],
+    "assessmentCompleted": bool,
+}
+JOB = {
+    "id": str,
+    "title": str,
+    "company": str,
+    "location": str,
+    "salary": str,
+    "skills": [str],
+    "matchPercentage": Optional(float),
+}
+COURSE = {
+    "id": str,
+    "title": str,
+    "provider": str,
+    "description": str,
+    "duration": str,
+    "skills": [str],
+}
+ERROR = {"error": str}
+
+# (method, route) -> schema of its 2xx response; any status >= 400 must match ERROR
+ROUTE_SCHEMAS = {
+    ("GET", "/"): {"message": str},
+    ("GET", "/ready"): {"ready": Const(True), "warmUpMs": float},
+    ("POST", "/auth/register"): {"user": USER, "token": NonEmpty(str)},
+    ("GET", "/auth/me"): USER,
+    ("POST", "/assessment/submit"): {"success": Const(True), "skillVector": NonEmpty([SKILL])},
+    ("GET", "/dashboard"): {
+        "skills": [SKILL],
+        "jobMatches": [JOB],
+        "jobs": [JOB],
+        "courses": [COURSE],
+        "recommendedCourses": [COURSE],
+        "progress": {"profileCompletion": float, "coursesCompleted": int, "jobApplications": int},
+    },
+    ("POST", "/chat"): {"response": str, "sessionId": NonEmpty(str)},
+    ("GET", "/chat/history"): {"sessionId": str, "count": int,
+                               "messages": [{"message": str, "response": str}]},
+    ("GET", "/jobs"): {"jobs": [JOB], "nextCursor": Optional(str)},
+    ("GET", "/courses"): {"courses": [COURSE], "nextCursor": Optional(str)},
+    ("POST", "/apply"): {"success": Const(True), "message": str},
+    ("GET", "/cache/stats"): {"dashboard": {"hits": int, "misses": int, "evictions": int,
+                                            "hitRate": float}},
+}
+
+def fail(path, expected, value):
+    """Error message of a failed check; only built once something has failed"""
+    if value is None:
+        return f"{path}: expected {expected}, got null"
+    return f"{path}: expected {expected}, got {type(value).__name__}"
+
+class SchemaCompiler:
+    """Turns a schema into the source of one straight-line validator function
+
+    The generated function returns None for a valid value and a message naming
+    the first offending path otherwise, e.g. "$.jobs[3].skills: expected list,
+    got str". Paths are only assembled on failure.
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.constants = {}
+        self.names = itertools.count()
+
+    def line(self, depth, text):
+        self.lines.append("    " * depth + text)
+
+    def variable(self, prefix):
+        return f"{prefix}{next(self.names)}"
+
+    def compile(self, schema, name):
+        self.line(0, f"def {name}(value):")
+        self.emit(schema, "value", "'$'", 1)
+        self.line(1, "return None")
+        return "\n".join(self.lines) + "\n"
+
+    def emit(self, schema, var, path, depth):
+        if schema is object:
+            return
+        if isinstance(schema, Optional):
+            raise TypeError("Optional is only allowed for object keys")
+        if isinstance(schema, Const):
+            constant = self.variable("_const")
+            self.constants[constant] = schema.value
+            self.line(depth, f"if {var} != {constant}:")
+            self.line(depth + 1, f"return {path} + ': expected ' + {repr(repr(schema.value))} + ', got ' + repr({var})")
+            return
+        non_empty = isinstance(schema, NonEmpty)
+        if non_empty:
+            schema = schema.schema
+        if isinstance(schema, dict):
+            self.line(depth, f"if type({var}) is not dict:")
+            self.line(depth + 1, f"return _fail({path}, 'object', {var})")
+            for key, child_schema in schema.items():
+                self.emit_key(var, key, child_schema, path, depth)
+        elif isinstance(schema, list):
+            if len(schema) != 1:
+                raise TypeError(f"List schemas hold exactly one item schema, got {schema!r}")
+            self.line(depth, f"if type({var}) is not list:")
+            self.line(depth + 1, f"return _fail({path}, 'list', {var})")
+            self.emit_non_empty(non_empty, var, path, depth)
+            if schema[0] is not object:
+                index, item = self.variable("i"), self.variable("v")
+                self.line(depth, f"for {index}, {item} in enumerate({var}):")
+                self.emit(schema[0], item, f"{path} + '[' + str({index}) + ']'", depth + 1)
+        elif schema is float:
+            self.line(depth, f"if type({var}) is not float and type({var}) is not int:")
+            self.line(depth + 1, f"return _fail({path}, 'number', {var})")
+        elif schema in TYPE_NAMES:
+            self.line(depth, f"if type({var}) is not {schema.__name__}:")
+            self.line(depth + 1, f"return _fail({path}, {TYPE_NAMES[schema]!r}, {var})")
+            self.emit_non_empty(non_empty, var, path, depth)
+        else:
+            raise TypeError(f"Unsupported schema {schema!r}")
+
+    def emit_non_empty(self, non_empty, var, path, depth):
+        if non_empty:
+            self.line(depth, f"if not {var}:")
+            self.line(depth + 1, f"return {path} + ': must not be empty'")
+
+    def emit_key(self, var, key, schema, path, depth):
+        child = self.variable("v")
+        child_path = f"{path} + {'.' + key!r}"
+        if isinstance(schema, Optional):
+            self.line(depth, f"{child} = {var}.get({key!r})")
+            if schema.schema is not object:
+                self.line(depth, f"if {child} is not None:")
+                self.emit(schema.schema, child, child_path, depth + 1)
+            return
+        self.line(depth, f"{child} = {var}.get({key!r}, _MISSING)")
+        self.line(depth, f"if {child} is _MISSING:")
+        self.line(depth + 1, f"return {child_path} + ': missing'")
+        self.emit(schema, child, child_path, depth)
+
+def compile_schema(schema, name="validate"):
+    """Compile a schema into validator(value) -> None or an error message
+
+    The generated source is kept on the function as .source for debugging.
+    """
+    compiler = SchemaCompiler()
+    source = compiler.compile(schema, name)
+    namespace = dict(compiler.constants, _MISSING=object(), _fail=fail)
+    exec(compile(source, f"<schema {name}>", "exec"), namespace)
+    validator = namespace[name]
+    validator.source = source
+    return validator
+
+def validator_name(method, route):
+    words = "".join(c if c.isalnum() else "_" for c in route).strip("_") or "root"
+    return f"validate_{method.lower()}_{words}"
+
+VALIDATORS = {key: compile_schema(schema, validator_name(*key)) for key, schema in ROUTE_SCHEMAS.items()}
+validate_error = compile_schema(ERROR, "validate_error")
+
+def validate(method, route, status, data):
+    """Check a decoded response body against its route's schema
+
+    Returns an error message, or None when it matches or the route has no schema.
+    """
+    if status >= 400:
+        return validate_error(data)
+    validator = VALIDATORS.get((method, route))
+    return validator(data) if validator is not None else None
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+EmpowerYouth AI Career Coach - Batch Skill Matching
+Scores every user's skill vector against the job and course catalogs in one
+batched NumPy operation, for nightly precomputed recommendations
+"""
+
+import argparse
+import random
+import resource
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from catalog_data import (
+    DEFAULT_SKILL_VECTOR,
+    SKILL_RULES,
+    generate_mock_courses,
+    generate_mock_jobs,
+    generate_skill_vector,
+)
+
+# Level at which a skill counts as fully covering a requirement (levels run 1-5)
+TARGET_LEVEL = 3
+BATCH_SIZE = 2048
+
+def skill_vocabulary(*catalogs):
+    """Skill names from generateSkillVector's rules, then any extra skills the catalogs use"""
+    names = [name for _, _, derived in SKILL_RULES for name, _ in derived]
+    names += [skill["name"] for skill in DEFAULT_SKILL_VECTOR]
+    for catalog in catalogs:
+        for item in catalog:
+            names.extend(item["skills"])
+    vocabulary = {}
+    for name in names:
+        vocabulary.setdefault(name.lower(), len(vocabulary))
+    return vocabulary
+
+class SkillMatcher:
+    """Scores users against a job and a course catalog
+
+    Users are encoded as proficiency rows (min(level / TARGET_LEVEL, 1) per skill)
+    and catalog items as rows of required skills weighted 1/n, so one matrix
+    product gives every user's coverage of every job. Courses are ranked by how
+    much of what they teach the user still lacks, mirroring the dashboard's
+    skill-gap filter. Skill names match case-insensitively, like route.js.
+    """
+
+    def __init__(self, jobs, courses=(), target_level=TARGET_LEVEL, batch_size=BATCH_SIZE):
+        if np is None:
+            raise ImportError("skill_matching requires numpy: pip install numpy")
+        self.jobs = list(jobs)
+        self.courses = list(courses)
+        self.target_level = target_level
+        self.batch_size = batch_size
+        self.vocabulary = skill_vocabulary(self.jobs, self.courses)
+        self.job_matrix = self.encode_catalog(self.jobs)
+        self.course_matrix = self.encode_catalog(self.courses)
+
+    def encode_catalog(self, items):
+        """(items, skills) float32 matrix; each row's required skills share a weight of 1"""
+        matrix = np.zeros((len(items), len(self.vocabulary)), dtype=np.float32)
+        for row, item in enumerate(items):
+            columns = sorted({self.vocabulary[name.lower()] for name in item["skills"]})
+            if columns:
+                matrix[row, columns] = 1.0 / len(columns)
+        return matrix
+
+    def encode_users(self, skill_vectors):
+        """(users, skills) float32 proficiency matrix; skills outside the vocabulary are ignored"""
+        rows, columns, levels = [], [], []
+        for row, skills in enumerate(skill_vectors):
+            for skill in skills:
+                column = self.vocabulary.get(skill["name"].lower())
+                if column is not None:
+                    rows.append(row)
+                    columns.append(column)
+                    levels.append(skill["level"])
+        matrix = np.zeros((len(skill_vectors), len(self.vocabulary)), dtype=np.float32)
+        values = np.minimum(np.asarray(levels, dtype=np.float32) / self.target_level, 1.0)
+        # A skill listed twice keeps its highest level
+        np.maximum.at(matrix, (np.asarray(rows, dtype=np.intp), np.asarray(columns, dtype=np.intp)), values)
+        return matrix
+
+    def top_k(self, scores, k):
+        """Indices and scores of each row's k best columns, best first"""
+        k = min(k, scores.shape[1])
+        if k == 0:
+            return np.empty((scores.shape[0], 0), dtype=np.intp), np.empty((scores.shape[0], 0), dtype=np.float32)
+        candidates = np.argpartition(scores, -k, axis=1)[:, -k:]
+        candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind="stable")
+        return np.take_along_axis(candidates, order, axis=1), np.take_along_axis(candidate_scores, order, axis=1)
+
+    def score(self, users, catalog, k, gaps=False):
+        """Top-k (indices, match percentages) for an encoded user matrix, in user batches"""
+        indices = np.empty((users.shape[0], min(k, catalog.shape[0])), dtype=np.intp)
+        percentages = np.empty(indices.shape, dtype=np.uint8)
+        for start in range(0, users.shape[0], self.batch_size):
+            batch = users[start:start + self.batch_size]
+            scores = (1.0 - batch if gaps else batch) @ catalog.T
+            top, top_scores = self.top_k(scores, k)
+            indices[start:start + len(batch)] = top
+            percentages[start:start + len(batch)] = np.rint(top_scores * 100)
+        return indices, percentages
+
+    def top_jobs(self, users, k=10):
+        """Jobs whose required skills each user covers best; users is an encode_users matrix
+
+        A job's score is the share of its requirements the user covers, each
+        weighted 1/n over the job's n required skills.
+        """
+        return self.score(users, self.job_matrix, k)
+
+    def top_courses(self, users, k=6):
+        """Courses teaching most of what each user lacks; users is an encode_users matrix"""
+        return self.score(users, self.course_matrix, k, gaps=True)
+
+    def recommend(self, skill_vectors, job_count=10, course_count=6):
+        """Dashboard-shaped recommendations per user, jobs carrying a computed matchPercentage"""
+        users = self.encode_users(skill_vectors)
+        job_indices, job_matches = self.top_jobs(users, job_count)
+        course_indices, course_gaps = self.top_courses(users, course_count)
+        return [
+            {
+                "jobMatches": [dict(self.jobs[j], matchPercentage=int(m)) for j, m in zip(jobs, matches)],
+                "recommendedCourses": [dict(self.courses[c], gapPercentage=int(g)) for c, g in zip(courses, gaps)],
+            }
+            for jobs, matches, courses, gaps in zip(job_indices, job_matches, course_indices, course_gaps)
+        ]
+
+def random_skill_vectors(count, rng):
+    """Skill vectors from random assessments, run through generate_skill_vector"""
+    answers = {}
+    for field, answer, _ in SKILL_RULES:
+        answers.setdefault(field, []).append(answer)
+    return [
+        generate_skill_vector({field: rng.sample(choices, rng.randint(0, len(choices)))
+                               for field, choices in answers.items()})
+        for _ in range(count)
+    ]
+
+def random_catalog(count, vocabulary, template, rng):
+    """count catalog items cycling through template, each requiring 2-6 random skills"""
+    names = list(vocabulary)
+    return [dict(template[i % len(template)], skills=rng.sample(names, rng.randint(2, min(6, len(names)))))
+            for i in range(count)]
+
+def peak_rss_mb():
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+def run_benchmark(users, jobs, courses, k, batch_size, seed):
+    rng = random.Random(seed)
+    base_jobs, base_courses = generate_mock_jobs(), generate_mock_courses()
+    vocabulary = skill_vocabulary(base_jobs, base_courses)
+
+    print("🚀 Starting EmpowerYouth Skill Matching Benchmark")
+    print("=" * 80)
+    print(f"Users: {users}, jobs: {jobs}, courses: {courses}, top-k: {k}, batch size: {batch_size}")
+
+    start = time.perf_counter()
+    skill_vectors = random_skill_vectors(users, rng)
+    job_catalog = random_catalog(jobs, vocabulary, base_jobs, rng)
+    course_catalog = random_catalog(courses, vocabulary, base_courses, rng)
+    generated = time.perf_counter()
+    rss_before = peak_rss_mb()
+
+    matcher = SkillMatcher(job_catalog, course_catalog, batch_size=batch_size)
+    user_matrix = matcher.encode_users(skill_vectors)
+    encoded = time.perf_counter()
+    job_indices, job_matches = matcher.top_jobs(user_matrix, k)
+    scored_jobs = time.perf_counter()
+    course_indices, _ = matcher.top_courses(user_matrix, k)
+    scored_courses = time.perf_counter()
+
+    footprint = sum(a.nbytes for a in (user_matrix, matcher.job_matrix, matcher.course_matrix,
+                                       job_indices, job_matches, course_indices))
+    batch_scores = min(batch_size, users) * max(jobs, courses) * 4
+
+    print("\n" + "=" * 80)
+    print("📊 SKILL MATCHING SUMMARY")
+    print("=" * 80)
+    print(f"Vocabulary: {len(matcher.vocabulary)} skills")
+    print(f"Generate inputs:  {generated - start:>8.2f} s (not counted below)")
+    print(f"Encode:           {encoded - generated:>8.2f} s")
+    print(f"Score jobs:       {scored_jobs - encoded:>8.2f} s ({users * jobs / (scored_jobs - encoded) / 1e6:,.0f}M pairs/s)")
+    print(f"Score courses:    {scored_courses - scored_jobs:>8.2f} s")
+    print(f"Total wall time:  {scored_courses - generated:>8.2f} s")
+    print(f"Matrices/results: {footprint / 2**20:>8.1f} MiB, score batch {batch_scores / 2**20:.1f} MiB")
+    print(f"Peak RSS:         {peak_rss_mb():>8.1f} MiB ({rss_before:.1f} MiB before matching)")
+    print(f"Sample: user 0 top job match {job_matches[0][0]}% ({job_catalog[job_indices[0][0]]['title']})")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Batch skill-to-job/course matching benchmark")
+    parser.add_argument("--users", type=int, default=100_000, help="number of synthetic users")
+    parser.add_argument("--jobs", type=int, default=10_000, help="number of synthetic jobs")
+    parser.add_argument("--courses", type=int, default=1_000, help="number of synthetic courses")
+    parser.add_argument("--top-k", type=int, default=10, help="recommendations kept per user")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                        help="users scored per matrix product; bounds the score matrix memory")
+    parser.add_argument("--seed", type=int, default=42, help="random seed for the synthetic data")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    if np is None:
+        sys.exit("skill_matching.py requires numpy: pip install numpy")
+    args = parse_args(argv)
+    run_benchmark(args.users, args.jobs, args.courses, args.top_k, args.batch_size, args.seed)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())